@@ -1 +1 @@
-"""app/analytics — the data science layer (scoring, evaluation, optimization)."""
+"""app/analytics — the data science layer (scoring, evaluation, optimization, simulation)."""
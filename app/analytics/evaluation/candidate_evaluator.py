@@ -10,12 +10,18 @@ options and returns a typed EvaluationResult.
 The evaluation math is intentionally simple: per-category value-added =
 (candidate score − drop candidate score). The sophistication lives in the
 ScoringStrategy that produced the scores — not here.
+
+Value-added is computed for the whole pool as one subtraction against the
+ScoredPool's score matrix; only the top-n survivors of a partial
+selection are turned into ReplacementOption objects.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, Iterable, List
+
+import numpy as np
 
 from app.domain.scoring import RosterSnapshot, ScoredPlayer, ScoredPool
 
@@ -54,6 +60,7 @@ def evaluate_replacements(
     drop_candidate_id: int,
     roster_snapshot: RosterSnapshot,
     top_n: int = 50,
+    excluded_ids: Iterable[int] = (),
 ) -> EvaluationResult:
     """
     Rank every player in *scored_pool* as a replacement for *drop_candidate_id*.
@@ -67,41 +74,160 @@ def evaluate_replacements(
                               scorers that need roster-level information;
                               not used by the base evaluator itself).
     :param top_n:             Maximum number of replacement options to return.
+    :param excluded_ids:      Player IDs that are not available to add
+                              (e.g. players rostered by other teams).
     :returns:                 EvaluationResult sorted descending by total_added_value.
     :raises ValueError:       If drop_candidate_id is not in scored_pool.
     """
-    drop = scored_pool.get(drop_candidate_id)
-    if drop is None:
+    drop_row = scored_pool.row_of(drop_candidate_id)
+    if drop_row is None:
         raise ValueError(
             f"Drop candidate {drop_candidate_id} not found in ScoredPool. "
             "Ensure data_zscores.json is up to date (run `python main.py rank`)."
         )
 
-    drop_scores = drop.category_scores.scores
-
-    options: List[ReplacementOption] = []
+    value_added = scored_pool.scores - scored_pool.scores[drop_row]
+    totals = value_added.sum(axis=1)
+    available = np.ones(len(totals), dtype=bool)
+    available[drop_row] = False                # never recommend the drop itself
+    available[scored_pool.rows_of(excluded_ids)] = False
+    totals[~available] = -np.inf
 
-    for pid, sp in scored_pool.scored_players.items():
-        if pid == drop_candidate_id:
-            continue
+    rows = top_k_rows(totals, min(top_n, int(available.sum())))
 
-        value_added = {
-            cat: sp.category_scores.scores.get(cat, 0.0) - drop_scores.get(cat, 0.0)
-            for cat in drop_scores
-        }
-        total_added = sum(value_added.values())
-
-        options.append(
+    return EvaluationResult(
+        drop_candidate=scored_pool.scored_player_at(drop_row),
+        replacements=[
             ReplacementOption(
-                candidate=sp,
-                value_added=value_added,
-                total_added_value=total_added,
+                candidate=scored_pool.scored_player_at(r),
+                value_added=dict(zip(scored_pool.score_columns, value_added[r].tolist())),
+                total_added_value=float(totals[r]),
             )
+            for r in rows
+        ],
+    )
+
+
+def top_k_rows(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the *k* largest *values*, best first (ties keep row order).
+
+    Uses partial selection, so cost is O(n + k log k) rather than a full sort.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(values):
+        candidates = np.argpartition(-values, k - 1)[:k]
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.lexsort((candidates, -values[candidates]))]
+
+
+# ---------------------------------------------------------------------------
+# Whole-roster drop × add evaluation
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RosterSwapEvaluation:
+    """
+    Every roster player evaluated as a drop against every free agent.
+
+    ``value_added[d, a, c]`` is free agent ``add_ids[a]``'s score minus
+    roster player ``drop_ids[d]``'s score in ``score_columns[c]``.
+    Pairs are reported through the existing result types: each entry of
+    ``best_pairs`` / ``best_by_category`` is an EvaluationResult holding
+    a single ReplacementOption. ``best_by_category`` leaves out columns
+    that are zero for every pair (punted categories).
+    """
+
+    drop_ids: np.ndarray
+    add_ids: np.ndarray
+    score_columns: List[str]
+    value_added: np.ndarray                                  # (drops, adds, columns)
+    by_drop: Dict[int, EvaluationResult] = field(default_factory=dict)
+    best_pairs: List[EvaluationResult] = field(default_factory=list)
+    best_by_category: Dict[str, EvaluationResult] = field(default_factory=dict)
+
+
+def evaluate_roster_swaps(
+    scored_pool: ScoredPool,
+    roster_snapshot: RosterSnapshot,
+    excluded_ids: Iterable[int] = (),
+    top_n: int = 10,
+) -> RosterSwapEvaluation:
+    """
+    Evaluate every player on *roster_snapshot* as a drop candidate against
+    every free agent in one broadcast over the score matrix.
+
+    Free agents are all pool players not on the roster and not in
+    *excluded_ids* (e.g. players rostered by other teams).
+
+    :param scored_pool:     The full player pool with scores applied.
+    :param roster_snapshot: The roster whose players are drop candidates.
+    :param excluded_ids:    Player IDs that are not available to add.
+    :param top_n:           Adds kept per drop candidate, and number of
+                            overall best pairs.
+    :returns:               RosterSwapEvaluation (tensor + best pairs).
+    :raises ValueError:     If no roster player is in *scored_pool*.
+    """
+    drop_rows = scored_pool.rows_of(roster_snapshot.roster.player_ids)
+    if len(drop_rows) == 0:
+        raise ValueError(
+            f"No players from roster '{roster_snapshot.roster.name}' found in "
+            "ScoredPool. Ensure data_zscores.json is up to date "
+            "(run `python main.py rank`)."
         )
 
-    options.sort(key=lambda o: o.total_added_value, reverse=True)
+    unavailable = np.zeros(len(scored_pool), dtype=bool)
+    unavailable[drop_rows] = True
+    unavailable[scored_pool.rows_of(excluded_ids)] = True
+    add_rows = np.flatnonzero(~unavailable)
 
-    return EvaluationResult(
-        drop_candidate=drop,
-        replacements=options[:top_n],
+    scores = scored_pool.scores
+    value_added = scores[add_rows][None, :, :] - scores[drop_rows][:, None, :]
+    totals = value_added.sum(axis=2)                         # (drops, adds)
+
+    def _option(d: int, a: int) -> ReplacementOption:
+        return ReplacementOption(
+            candidate=scored_pool.scored_player_at(add_rows[a]),
+            value_added=dict(zip(scored_pool.score_columns, value_added[d, a].tolist())),
+            total_added_value=float(totals[d, a]),
+        )
+
+    def _result(d: int, a: int) -> EvaluationResult:
+        return EvaluationResult(
+            drop_candidate=scored_pool.scored_player_at(drop_rows[d]),
+            replacements=[_option(d, a)],
+        )
+
+    by_drop = {
+        int(scored_pool.player_ids[drop_rows[d]]): EvaluationResult(
+            drop_candidate=scored_pool.scored_player_at(drop_rows[d]),
+            replacements=[_option(d, a) for a in top_k_rows(totals[d], top_n)],
+        )
+        for d in range(len(drop_rows))
+    }
+
+    flat_best = top_k_rows(totals.ravel(), top_n) if totals.size else []
+    best_pairs = [_result(*divmod(int(i), len(add_rows))) for i in flat_best]
+
+    # Punted (weight 0) columns score 0 for everyone: no swap improves them,
+    # and argmax would just name the first pair.
+    best_by_category: Dict[str, EvaluationResult] = {}
+    if len(add_rows):
+        flat = value_added.reshape(-1, len(scored_pool.score_columns))
+        per_cat = flat.argmax(axis=0)
+        scored = flat.any(axis=0)
+        for c, col in enumerate(scored_pool.score_columns):
+            if scored[c]:
+                best_by_category[col] = _result(*divmod(int(per_cat[c]), len(add_rows)))
+
+    return RosterSwapEvaluation(
+        drop_ids=scored_pool.player_ids[drop_rows],
+        add_ids=scored_pool.player_ids[add_rows],
+        score_columns=list(scored_pool.score_columns),
+        value_added=value_added,
+        by_drop=by_drop,
+        best_pairs=best_pairs,
+        best_by_category=best_by_category,
     )
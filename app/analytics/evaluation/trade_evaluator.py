@@ -0,0 +1,236 @@
+"""
+app/analytics/evaluation/trade_evaluator.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Multi-player trade engine (2-for-1, 2-for-2, 3-for-2, …).
+
+A trade package gives *g* players from my roster for *r* players from a
+partner roster (g ≥ r). It is scored by the change it makes to my
+``RosterSnapshot.category_totals``:
+
+    Δ = Σ received − Σ given + Σ best (g − r) free agents
+
+(the free agents fill the roster spots a consolidation trade opens up).
+The objective is ``Δ · weights`` — by default the change in Total_Value.
+
+Search
+------
+Package sums are built per side as vectorised combination sums. Give
+packages are visited cheapest-first and receive packages best-first, so
+``best receive − give cost`` is an upper bound for everything left: once
+it cannot beat the current k-th best trade, the search stops. Each give
+package is scored against all remaining receive packages in one vector
+op. ``max_candidates`` caps the number of (give, receive) pairs scored.
+
+Optionally, ``min_partner_gain`` only keeps trades the partner would not
+lose on (their Total_Value change, after releasing their lowest-value
+remaining players to stay at roster size).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.analytics.evaluation.candidate_evaluator import top_k_rows
+from app.domain.scoring import RosterSnapshot, ScoredPlayer, ScoredPool
+
+DEFAULT_SHAPES: Tuple[Tuple[int, int], ...] = ((2, 1), (2, 2), (3, 2))
+
+
+# ---------------------------------------------------------------------------
+# Result types
+# ---------------------------------------------------------------------------
+
+@dataclass
+class TradeOption:
+    """A single trade package and its effect on my roster."""
+
+    give: List[ScoredPlayer]
+    receive: List[ScoredPlayer]
+    category_delta: Dict[str, float]   # change in my category_totals
+    total_delta: float                 # objective value (weighted Δ)
+    partner_delta: float               # partner's Total_Value change
+
+
+@dataclass
+class TradeResult:
+    """
+    Top trades found by :func:`evaluate_trades`.
+
+    ``options`` is sorted descending by ``total_delta``. ``complete`` is
+    ``False`` when the search hit ``max_candidates`` before the bound
+    proved the result optimal.
+    """
+
+    options: List[TradeOption] = field(default_factory=list)
+    explored: int = 0
+    complete: bool = True
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _package_sums(scores: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """All *size*-subsets of the rows of *scores*: ``(members, summed rows)``."""
+    members = np.array(list(combinations(range(len(scores)), size)), dtype=np.int64)
+    if members.size == 0:
+        return members.reshape(0, size), np.empty((0, scores.shape[1]))
+    return members, scores[members].sum(axis=1)
+
+
+def _partner_release_cost(totals: np.ndarray, recv: np.ndarray, n_release: int) -> np.ndarray:
+    """
+    Total_Value the partner loses by releasing their *n_release* weakest
+    players that remain after giving up each receive package in *recv*.
+    """
+    if n_release <= 0:
+        return np.zeros(len(recv))
+    order = np.argsort(totals, kind="stable")           # weakest first
+    kept = ~(order[None, None, :] == recv[:, :, None]).any(axis=1)   # (packages, players)
+    # first n_release kept players in weakest-first order
+    ranks = np.cumsum(kept, axis=1)
+    take = kept & (ranks <= n_release)
+    return (totals[order][None, :] * take).sum(axis=1)
+
+
+# ---------------------------------------------------------------------------
+# Core engine
+# ---------------------------------------------------------------------------
+
+def evaluate_trades(
+    scored_pool: ScoredPool,
+    my_snapshot: RosterSnapshot,
+    partner_snapshot: RosterSnapshot,
+    shapes: Sequence[Tuple[int, int]] = DEFAULT_SHAPES,
+    top_n: int = 10,
+    category_weights: Optional[Dict[str, float]] = None,
+    min_partner_gain: Optional[float] = None,
+    max_candidates: int = 1_000_000,
+    excluded_ids: Iterable[int] = (),
+) -> TradeResult:
+    """
+    Find the best *shapes* trades between *my_snapshot* and *partner_snapshot*.
+
+    :param scored_pool:      Pool the rosters were sliced from (supplies the
+                             score matrix and the free-agent fill).
+    :param my_snapshot:      My roster.
+    :param partner_snapshot: The trade partner's roster.
+    :param shapes:           ``(give, receive)`` package sizes; give ≥ receive.
+    :param top_n:            Number of trades to return.
+    :param category_weights: Objective weight per score column (e.g.
+                             ``{"zBLK": 2.0}``); z-columns default to 1.0,
+                             other columns to 0.0, i.e. Δ Total_Value.
+    :param min_partner_gain: If set, drop trades whose partner Total_Value
+                             change is below this.
+    :param max_candidates:   Cap on (give, receive) pairs scored.
+    :param excluded_ids:     Players on other fantasy rosters, never used as
+                             free-agent fill.
+    :returns:                TradeResult sorted descending by total_delta.
+    :raises ValueError:      On an unsupported shape or empty roster.
+    """
+    for g, r in shapes:
+        if r > g or r < 1:
+            raise ValueError(f"Unsupported trade shape {g}-for-{r}: need give ≥ receive ≥ 1.")
+
+    my_rows = scored_pool.rows_of(my_snapshot.roster.player_ids)
+    partner_rows = scored_pool.rows_of(partner_snapshot.roster.player_ids)
+    if len(my_rows) == 0 or len(partner_rows) == 0:
+        raise ValueError("Both rosters need at least one player in the ScoredPool.")
+
+    columns = scored_pool.score_columns
+    weights = np.array([
+        (category_weights or {}).get(c, 1.0 if c.startswith("z") else 0.0)
+        for c in columns
+    ])
+    scores = scored_pool.scores
+    totals = scored_pool.total_value
+
+    # Free agents (best first) fill the roster spots opened by g > r
+    rostered = np.zeros(len(scored_pool), dtype=bool)
+    rostered[my_rows] = rostered[partner_rows] = True
+    rostered[scored_pool.rows_of(excluded_ids)] = True
+    free_agents = np.flatnonzero(~rostered)
+    free_agents = free_agents[np.argsort(-(scores[free_agents] @ weights), kind="stable")]
+
+    # Current best trades: (objective, shape index, give package, receive package)
+    found: List[Tuple[float, int, int, int]] = []
+    threshold = -np.inf
+    explored = 0
+    complete = True
+
+    packages = []
+    for s, (g, r) in enumerate(shapes):
+        give_members, give_sums = _package_sums(scores[my_rows], g)
+        recv_members, recv_sums = _package_sums(scores[partner_rows], r)
+        fill = scores[free_agents[: g - r]].sum(axis=0)
+        if len(give_members) == 0 or len(recv_members) == 0:
+            packages.append(None)                       # roster too small for shape
+            continue
+
+        give_cost = give_sums @ weights - fill @ weights
+        recv_value = recv_sums @ weights
+        give_order = np.argsort(give_cost, kind="stable")
+        recv_order = np.argsort(-recv_value, kind="stable")
+
+        # Partner's Total_Value change for every (give, receive) pair
+        release = _partner_release_cost(totals[partner_rows], recv_members, g - r)
+        partner_net = (
+            totals[my_rows][give_members].sum(axis=1)[:, None]
+            - totals[partner_rows][recv_members].sum(axis=1)[None, :]
+            - release[None, :]
+        )
+
+        packages.append((give_members, give_sums, recv_members, recv_sums, fill, partner_net))
+
+        for gi in give_order:
+            best_possible = recv_value[recv_order[0]] - give_cost[gi]
+            if best_possible <= threshold:
+                break                                   # bound: nothing left can qualify
+            if explored >= max_candidates:
+                complete = False
+                break
+
+            # receive packages that can still beat the threshold (sorted best-first)
+            n_viable = int(np.searchsorted(
+                -recv_value[recv_order], -(threshold + give_cost[gi]), side="left"
+            ))
+            if n_viable > max_candidates - explored:
+                n_viable = max_candidates - explored
+                complete = False                        # viable packages dropped
+            cand = recv_order[:n_viable]
+            explored += n_viable
+
+            objective = recv_value[cand] - give_cost[gi]
+            if min_partner_gain is not None:
+                ok = partner_net[gi, cand] >= min_partner_gain
+                cand, objective = cand[ok], objective[ok]
+
+            for ri, val in zip(cand.tolist(), objective.tolist()):
+                found.append((val, s, int(gi), ri))
+            if len(found) > top_n:
+                keep = top_k_rows(np.array([f[0] for f in found]), top_n)
+                found = [found[i] for i in keep]
+            if len(found) >= top_n:
+                threshold = min(f[0] for f in found)
+
+    found.sort(key=lambda f: -f[0])
+
+    options: List[TradeOption] = []
+    for val, s, gi, ri in found[:top_n]:
+        give_members, give_sums, recv_members, recv_sums, fill, partner_net = packages[s]
+        delta = recv_sums[ri] - give_sums[gi] + fill
+        g_rows = my_rows[give_members[gi]]
+        r_rows = partner_rows[recv_members[ri]]
+        options.append(TradeOption(
+            give=[scored_pool.scored_player_at(i) for i in g_rows],
+            receive=[scored_pool.scored_player_at(i) for i in r_rows],
+            category_delta=dict(zip(columns, delta.tolist())),
+            total_delta=float(val),
+            partner_delta=float(partner_net[gi, ri]),
+        ))
+
+    return TradeResult(options=options, explored=explored, complete=complete)
@@ -1,6 +1,9 @@
 """
 app/analytics/optimization
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~
-Scaffolded package — future home for portfolio theory and combinatorial
-roster optimization.
+Combinatorial roster optimization.
+
+  - lineup:    daily start/sit assignment of roster players to position slots
+  - streaming: weekly lineup + add/drop planner over the schedule
+  - portfolio: mean–variance roster construction over category covariance
 """
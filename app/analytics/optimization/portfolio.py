@@ -0,0 +1,285 @@
+"""
+app/analytics/optimization/portfolio.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Mean–variance (portfolio-style) roster construction.
+
+Treat the roster's players as assets and its weighted category totals
+``e = (X Z) ∘ w`` as its output:
+
+  - expected value  μ = Σ e                 (weighted Total_Value)
+  - risk            σ² = Σᵢ wᵀ Σᵢ w         (variance of that output)
+
+Σᵢ is player *i*'s 9 × 9 per-game category covariance in z units — from
+their game log when one is supplied, else the matchup simulator's model
+(Poisson counting stats, makes and misses as independent Poissons).
+Players are independent, so a roster's risk is the sum of its players'
+and every roster's risk is one ``X @ r`` over per-player risks *r*. A
+roster leaning on streaky, high-variance lines carries more risk than a
+steady one with the same μ.
+
+Candidate rosters are dense indicator rows over a small universe (my
+roster plus the best free agents): every roster reachable with up to
+``max_swaps`` drop/add swaps. For ``max_swaps=2`` that is tens of
+thousands of rosters, all scored with two matmuls (``X @ Z`` and
+``X @ r``).
+
+Usage::
+
+    result = optimize_portfolio(pool, my_roster, weights, risk_ratio=1.0)
+    result.best.adds, result.best.mean, result.frontier
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.analytics.evaluation.candidate_evaluator import top_k_rows
+from app.analytics.scoring.z_score import category_matrix, unweighted_z_matrix, weight_vector
+from app.domain.player import PlayerPool
+from app.domain.roster import Roster
+from app.domain.stats import STAT_COLUMNS, STAT_MAP
+
+_COL = {name: i for i, name in enumerate(STAT_COLUMNS)}
+
+
+# ---------------------------------------------------------------------------
+# Result types
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PortfolioRoster:
+    """One candidate roster and its mean / risk."""
+
+    player_ids: List[int]
+    drops: List[int]
+    adds: List[int]
+    mean: float
+    risk: float
+
+
+@dataclass
+class PortfolioResult:
+    """
+    Outcome of :func:`optimize_portfolio`.
+
+    ``best`` maximises ``mean − risk_aversion · risk`` among rosters within
+    ``max_risk``; ``frontier`` is the efficient frontier (no other roster
+    has both higher mean and lower risk), ordered by risk.
+    """
+
+    current: PortfolioRoster
+    best: PortfolioRoster
+    frontier: List[PortfolioRoster] = field(default_factory=list)
+    max_risk: Optional[float] = None
+    n_scored: int = 0
+
+
+# ---------------------------------------------------------------------------
+# Building blocks
+# ---------------------------------------------------------------------------
+
+def category_variances(values: np.ndarray, league_pct: np.ndarray) -> np.ndarray:
+    """
+    Per-game variance of each category under the simulator's model.
+
+    Counting stats are Poisson (variance = per-game mean). FG% / FT%
+    impact ``M − p·A`` with makes ~ Poisson(M) and misses ~ Poisson(A − M)
+    has variance ``(1 − p)²·M + p²·(A − M)``.
+
+    :param values:     ``(n, len(STAT_COLUMNS))`` per-game lines.
+    :param league_pct: League (FG%, FT%) the impacts are measured against.
+    :returns:          ``(n, 9)`` variances, laid out as STAT_MAP.
+    """
+    var = np.empty((len(values), len(STAT_MAP)))
+    shooting = {
+        "FG%_Impact": ("FGM", "FGA", league_pct[0]),
+        "FT%_Impact": ("FTM", "FTA", league_pct[1]),
+    }
+    for j, (_, col, _) in enumerate(STAT_MAP):
+        if col in shooting:
+            made, att, p = shooting[col]
+            m = values[:, _COL[made]]
+            misses = np.maximum(values[:, _COL[att]] - m, 0.0)
+            var[:, j] = (1 - p) ** 2 * m + p * p * misses
+        else:
+            var[:, j] = values[:, _COL[col]]
+    return np.maximum(var, 0.0)
+
+
+def player_covariances(
+    player_ids: np.ndarray,
+    model_variances: np.ndarray,
+    game_logs: Optional[Dict[int, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Each player's 9 × 9 per-game category covariance in z units.
+
+    :param player_ids:      ``(n,)`` player IDs.
+    :param model_variances: ``(n, 9)`` z-unit variances from the box-score
+                            model, used (as a diagonal) for players
+                            without a usable game log.
+    :param game_logs:       Optional ``{player_id: (games, 9)}`` per-game
+                            category lines in z units.
+    :returns:               ``(n, 9, 9)``.
+    """
+    n, k = model_variances.shape
+    cov = np.zeros((n, k, k))
+    cov[:, np.arange(k), np.arange(k)] = model_variances
+    for i, pid in enumerate(player_ids.tolist()):
+        log = (game_logs or {}).get(int(pid))
+        if log is not None and len(log) > 1:
+            cov[i] = np.cov(log, rowvar=False)
+    return cov
+
+
+def swap_rosters(n_roster: int, n_candidates: int, max_swaps: int,
+                 droppable: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Indicator matrix of every roster reachable with ≤ *max_swaps* swaps.
+
+    Columns are the universe ``[roster…, candidates…]``; row 0 is the
+    current roster.
+
+    :param droppable: Boolean mask over the roster columns (default: all).
+    :returns:         ``(rosters, n_roster + n_candidates)`` bool matrix.
+    """
+    drop_idx = np.flatnonzero(droppable if droppable is not None else np.ones(n_roster, bool))
+    blocks = []
+    for k in range(max_swaps + 1):
+        drop_sets = list(combinations(drop_idx, k))
+        add_sets = list(combinations(range(n_candidates), k))
+        drops = np.array(drop_sets, dtype=np.int64).reshape(len(drop_sets), k)
+        adds = np.array(add_sets, dtype=np.int64).reshape(len(add_sets), k)
+        if len(drops) == 0 or len(adds) == 0:
+            continue
+        block = np.zeros((len(drops) * len(adds), n_roster + n_candidates), dtype=bool)
+        block[:, :n_roster] = True
+        rows = np.arange(len(block))[:, None]
+        block[rows, np.repeat(drops, len(adds), axis=0)] = False
+        block[rows, n_roster + np.tile(adds, (len(drops), 1))] = True
+        blocks.append(block)
+    return np.vstack(blocks)
+
+
+def score_rosters(
+    indicators: np.ndarray, z: np.ndarray, weights: np.ndarray, cov: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and risk of every roster row.
+
+    :param cov: ``(universe, 9, 9)`` per-player covariances
+                (:func:`player_covariances`).
+    :returns:   ``(mean, risk)``, each ``(rosters,)``.
+    """
+    x = indicators.astype(np.float64)
+    player_risk = np.einsum("j,ijk,k->i", weights, cov, weights)   # wᵀ Σᵢ w
+    return (x @ z) @ weights, x @ player_risk
+
+
+def efficient_frontier(mean: np.ndarray, risk: np.ndarray) -> np.ndarray:
+    """Row indices on the efficient frontier, ordered by increasing risk."""
+    order = np.lexsort((-mean, risk))
+    best = np.maximum.accumulate(mean[order])
+    improves = np.r_[True, mean[order][1:] > best[:-1]]
+    return order[improves]
+
+
+# ---------------------------------------------------------------------------
+# Core engine
+# ---------------------------------------------------------------------------
+
+def optimize_portfolio(
+    pool: PlayerPool,
+    roster: Roster,
+    weights: Dict[str, float],
+    punt_categories: Optional[List[str]] = None,
+    excluded_ids: Iterable[int] = (),
+    droppable_ids: Optional[Iterable[int]] = None,
+    n_candidates: int = 25,
+    max_swaps: int = 2,
+    risk_ratio: Optional[float] = 1.0,
+    risk_aversion: float = 0.0,
+    game_logs: Optional[Dict[int, np.ndarray]] = None,
+    stats_source: str = "stats_curr_season",
+) -> PortfolioResult:
+    """
+    Choose the roster (≤ *max_swaps* swaps away) with the best mean–variance trade-off.
+
+    :param pool:            PlayerPool to score. Not mutated.
+    :param roster:          My current roster.
+    :param weights:         Category weights.
+    :param punt_categories: Categories weighted 0.
+    :param excluded_ids:    Players on other fantasy rosters (not free agents).
+    :param droppable_ids:   Roster players that may be swapped out (``None`` = all).
+    :param n_candidates:    Free agents (best by weighted value) in the universe.
+    :param max_swaps:       Maximum drop/add swaps per candidate roster.
+    :param risk_ratio:      Consistency target: risk may be at most this
+                            multiple of the current roster's (``None`` = no cap).
+    :param risk_aversion:   λ in ``mean − λ · risk``.
+    :param game_logs:       Optional ``{player_id: (games, 9)}`` per-game
+                            category lines in z units for Σᵢ.
+    :param stats_source:    Which PlayerStats window to score against.
+    :returns:               PortfolioResult.
+    :raises ValueError:     If no roster player is in the scored window.
+    """
+    window = pool.window(stats_source)
+    categories, _ = category_matrix(window.values)
+    z = unweighted_z_matrix(categories)
+    ids = pool.player_ids[window.rows]
+    w = weight_vector(weights, punt_categories or [])
+
+    position = {int(pid): i for i, pid in enumerate(ids)}
+    mine = np.array([position[int(p)] for p in roster.player_ids if int(p) in position], dtype=np.int64)
+    if len(mine) == 0:
+        raise ValueError("None of the roster's players have stats in the scored window.")
+
+    taken = np.zeros(len(ids), dtype=bool)
+    taken[mine] = True
+    taken[[position[int(p)] for p in excluded_ids if int(p) in position]] = True
+    free = np.flatnonzero(~taken)
+    free = free[top_k_rows(z[free] @ w, n_candidates)]
+
+    universe = np.concatenate([mine, free])
+    droppable = None
+    if droppable_ids is not None:
+        allowed = {int(p) for p in droppable_ids}
+        droppable = np.array([int(ids[i]) in allowed for i in mine])
+
+    # Per-game variances in the z-matrix's units (same std as unweighted_z_matrix)
+    totals = window.values.sum(axis=0)
+    league_pct = totals[[_COL["FGM"], _COL["FTM"]]] / totals[[_COL["FGA"], _COL["FTA"]]]
+    std = categories.std(axis=0, ddof=1) if len(categories) > 1 else np.ones(len(w))
+    std = np.where(std == 0, 1.0, std)
+    variances = category_variances(window.values[universe], league_pct) / std ** 2
+    cov = player_covariances(ids[universe], variances, game_logs)
+
+    indicators = swap_rosters(len(mine), len(free), max_swaps, droppable)
+    mean, risk = score_rosters(indicators, z[universe], w, cov)
+
+    max_risk = risk[0] * risk_ratio if risk_ratio is not None else None
+    objective = mean - risk_aversion * risk
+    if max_risk is not None:
+        objective = np.where(risk <= max_risk + 1e-9, objective, -np.inf)
+    best = int(np.argmax(objective))          # row 0 (current) always qualifies
+
+    def portfolio_roster(r: int) -> PortfolioRoster:
+        members = universe[indicators[r]]
+        return PortfolioRoster(
+            player_ids=[int(p) for p in ids[members]],
+            drops=[int(ids[i]) for i, keep in zip(mine, indicators[r, :len(mine)]) if not keep],
+            adds=[int(ids[i]) for i, add in zip(free, indicators[r, len(mine):]) if add],
+            mean=float(mean[r]),
+            risk=float(risk[r]),
+        )
+
+    return PortfolioResult(
+        current=portfolio_roster(0),
+        best=portfolio_roster(best),
+        frontier=[portfolio_roster(int(r)) for r in efficient_frontier(mean, risk)],
+        max_risk=max_risk,
+        n_scored=len(indicators),
+    )
@@ -0,0 +1,332 @@
+"""
+app/analytics/optimization/streaming.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Weekly lineup and streaming planner.
+
+Given the week's schedule (which NBA teams play on which day), plans the
+add/drop moves that maximise the total value of the daily starting
+lineups over the week, under a weekly transaction limit.
+
+Value model
+-----------
+A player's value on a day is their weighted z-score line (Total_Value by
+default) — from that day's scored projection when ``daily_scores`` is
+given (e.g. :func:`app.ingestion.projection_ingestion.project_range`, so
+injuries and minutes redistribution differ by day), else their season
+line on every day their team plays. A day's value is the value of that
+day's starters, so adding a free agent on day *d* earns their games from
+*d* onwards and costs the dropped player's remaining games.
+
+Search
+------
+Exact DP over rosters is out of reach (days × rosters × free agents), so
+the planner runs a beam search day by day:
+
+  - the universe is my roster plus the ``n_candidates`` free agents with
+    the most value left this week;
+  - each state is ``(roster, adds used)``; every day it may make up to
+    ``max_moves_per_day`` drop → add moves;
+  - children are ranked by value so far plus the value of holding the
+    roster fixed for the rest of the week (an achievable completion), and
+    the best ``beam_width`` survive.
+
+Inside the search a day's value is the sum of the top-*S* playing players
+(*S* = number of slots), which ignores position eligibility and is
+evaluated for thousands of rosters in one vectorised pass. The surviving
+plans are then re-scored with exact position-aware lineups
+(:func:`app.analytics.optimization.lineup.optimize_lineup`), together with
+the no-move plan, and the best is returned.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.analytics.evaluation.candidate_evaluator import top_k_rows
+from app.analytics.optimization.lineup import (
+    DEFAULT_SLOTS,
+    LineupResult,
+    optimize_lineup,
+)
+from app.domain.roster import Roster
+from app.domain.scoring import ScoredPlayer, ScoredPool
+
+
+# ---------------------------------------------------------------------------
+# Result types
+# ---------------------------------------------------------------------------
+
+@dataclass
+class StreamingMove:
+    """One add/drop, effective from ``day`` (the added player can start that day)."""
+
+    day: date
+    drop: ScoredPlayer
+    add: ScoredPlayer
+
+
+@dataclass
+class DayPlan:
+    """The roster and optimised lineup for one day of the plan."""
+
+    day: date
+    roster: List[int]
+    lineup: LineupResult
+
+
+@dataclass
+class WeeklyPlan:
+    """
+    The planned week.
+
+    ``total_value`` is the summed starter value over the week with the
+    planned moves; ``baseline_value`` is the same without any moves.
+    """
+
+    moves: List[StreamingMove] = field(default_factory=list)
+    days: List[DayPlan] = field(default_factory=list)
+    total_value: float = 0.0
+    baseline_value: float = 0.0
+    explored: int = 0
+
+    @property
+    def gain(self) -> float:
+        return self.total_value - self.baseline_value
+
+
+# ---------------------------------------------------------------------------
+# Relaxed (position-free) day values
+# ---------------------------------------------------------------------------
+
+def _day_values(masks: np.ndarray, plays: np.ndarray, values: np.ndarray, n_slots: int) -> np.ndarray:
+    """
+    Position-free lineup value of every roster on every day.
+
+    :param masks:   ``(rosters, players)`` roster membership.
+    :param plays:   ``(days, players)`` has-a-game matrix.
+    :param values:  ``(days, players)`` value of each game.
+    :param n_slots: Number of starting slots.
+    :returns:       ``(rosters, days)`` — sum of the best *n_slots* playing
+                    players (every playing player starts if there is room).
+    """
+    active = masks[:, None, :] & plays[None, :, :]                # (R, D, P)
+    filled = np.where(active, values[None, :, :], -np.inf)
+    if filled.shape[2] > n_slots:
+        filled = -np.partition(-filled, n_slots - 1, axis=2)[:, :, :n_slots]
+    return np.where(np.isfinite(filled), filled, 0.0).sum(axis=2)
+
+
+# ---------------------------------------------------------------------------
+# Core engine
+# ---------------------------------------------------------------------------
+
+def plan_week(
+    scored_pool: ScoredPool,
+    roster: Roster,
+    schedule: Dict[date, Set[int]],
+    team_map: Dict[int, int],
+    max_adds: int,
+    slots: Optional[Dict[str, int]] = None,
+    category_weights: Optional[Dict[str, float]] = None,
+    droppable_ids: Optional[Iterable[int]] = None,
+    excluded_ids: Iterable[int] = (),
+    out_ids: Iterable[int] = (),
+    n_candidates: int = 25,
+    beam_width: int = 64,
+    max_moves_per_day: int = 2,
+    daily_scores: Optional[Dict[date, ScoredPool]] = None,
+) -> WeeklyPlan:
+    """
+    Plan daily lineups and streaming moves for the days in *schedule*.
+
+    :param scored_pool:       Scored pool (per-game values; free-agent source).
+    :param roster:            My current roster.
+    :param schedule:          ``{day: team IDs with a game}`` for the days to plan.
+    :param team_map:          ``{player_id: team_id}`` (unused with *daily_scores*).
+    :param max_adds:          Weekly transaction limit (adds remaining).
+    :param slots:             Daily starting slots; defaults to DEFAULT_SLOTS.
+    :param category_weights:  Weight per score column (as in optimize_lineup).
+    :param droppable_ids:     Roster players that may be dropped (added
+                              streamers always may). ``None`` = anyone.
+    :param excluded_ids:      Players on other fantasy rosters (not free agents).
+    :param out_ids:           Players ruled out for the week.
+    :param n_candidates:      Free agents considered for streaming.
+    :param beam_width:        Plans kept after each day.
+    :param max_moves_per_day: Moves a plan may make on a single day.
+    :param daily_scores:      ``{day: scored projection}``; a player plays on
+                              a day iff they are in that day's pool, and is
+                              valued and lined up from it. Days missing
+                              from it have no games.
+    :returns:                 WeeklyPlan (never worse than making no moves).
+    """
+    slots = slots or DEFAULT_SLOTS
+    n_slots = sum(int(c) for c in slots.values())
+    days = sorted(schedule)
+    out = {int(p) for p in out_ids}
+
+    # --- Universe: my roster + the best streamable free agents -----------
+    roster_rows = scored_pool.rows_of(roster.player_ids)
+    rostered = np.zeros(len(scored_pool), dtype=bool)
+    rostered[roster_rows] = True
+    rostered[scored_pool.rows_of(list(excluded_ids))] = True
+
+    day_values, day_plays = _daily_matrices(
+        scored_pool, days, schedule, team_map, category_weights, daily_scores
+    )
+    day_plays[:, scored_pool.rows_of(list(out))] = False
+    week_values = np.where(day_plays, day_values, 0.0).sum(axis=0)
+
+    fa_rows = np.flatnonzero(~rostered & day_plays.any(axis=0))
+    fa_rows = fa_rows[top_k_rows(week_values[fa_rows], n_candidates)]
+
+    rows = np.concatenate([roster_rows, fa_rows])
+    ids = scored_pool.player_ids[rows]
+    values = day_values[:, rows]
+    n_roster = len(roster_rows)
+    plays = day_plays[:, rows]
+
+    can_drop = np.ones(len(rows), dtype=bool)
+    if droppable_ids is not None:
+        droppable = {int(p) for p in droppable_ids}
+        can_drop[:n_roster] = [int(p) in droppable for p in ids[:n_roster]]
+
+    # --- Beam search ------------------------------------------------------
+    # state: (mask, adds used, value so far, moves as (day index, drop, add))
+    start = np.zeros(len(rows), dtype=bool)
+    start[:n_roster] = True
+    beam: List[Tuple[np.ndarray, int, float, Tuple[Tuple[int, int, int], ...]]] = [
+        (start, 0, 0.0, ())
+    ]
+    explored = 0
+
+    for d in range(len(days)):
+        frontier = beam
+        for _ in range(max_moves_per_day):
+            children = []
+            for mask, adds, acc, moves in frontier:
+                if adds >= max_adds:
+                    continue
+                for i in np.flatnonzero(mask & can_drop):
+                    for j in np.flatnonzero(~mask[n_roster:]) + n_roster:
+                        child = mask.copy()
+                        child[i], child[j] = False, True
+                        children.append((child, adds + 1, acc, moves + ((d, int(i), int(j)),)))
+            if not children:
+                break
+            beam = _prune(beam + children, plays[d:], values[d:], n_slots, beam_width)
+            explored += len(children)
+            frontier = [s for s in beam if len(s[3]) and s[3][-1][0] == d]
+
+        today = _day_values(
+            np.array([s[0] for s in beam]), plays[d:d + 1], values[d:d + 1], n_slots
+        )[:, 0]
+        beam = [(m, a, acc + v, mv) for (m, a, acc, mv), v in zip(beam, today)]
+
+    # --- Exact, position-aware re-scoring --------------------------------
+    def realise(moves: Sequence[Tuple[int, int, int]]) -> Tuple[float, List[DayPlan]]:
+        current = list(ids[:n_roster])
+        plan_days = []
+        total = 0.0
+        for d, day in enumerate(days):
+            for md, i, j in moves:
+                if md == d:
+                    current[current.index(ids[i])] = ids[j]
+            playing = ids[plays[d]].tolist()
+            day_pool = scored_pool if daily_scores is None else daily_scores.get(day, scored_pool)
+            lineup = optimize_lineup(
+                day_pool, Roster(roster.name, [int(p) for p in current]),
+                slots=slots, category_weights=category_weights, playing_ids=playing,
+            )
+            plan_days.append(DayPlan(day=day, roster=[int(p) for p in current], lineup=lineup))
+            total += lineup.objective
+        return total, plan_days
+
+    baseline_value, baseline_days = realise(())
+    best = (baseline_value, baseline_days, ())
+    for _, _, _, moves in beam:
+        if moves:
+            total, plan_days = realise(moves)
+            if total > best[0] + 1e-9:
+                best = (total, plan_days, moves)
+
+    total, plan_days, moves = best
+    return WeeklyPlan(
+        moves=[
+            StreamingMove(
+                day=days[d],
+                drop=scored_pool.scored_player_at(rows[i]),
+                add=scored_pool.scored_player_at(rows[j]),
+            )
+            for d, i, j in moves
+        ],
+        days=plan_days,
+        total_value=total,
+        baseline_value=baseline_value,
+        explored=explored,
+    )
+
+
+def _weights(scored_pool: ScoredPool, category_weights: Optional[Dict[str, float]]) -> np.ndarray:
+    return np.array([
+        (category_weights or {}).get(c, 1.0 if c.startswith("z") else 0.0)
+        for c in scored_pool.score_columns
+    ])
+
+
+def _daily_matrices(
+    scored_pool: ScoredPool,
+    days: List[date],
+    schedule: Dict[date, Set[int]],
+    team_map: Dict[int, int],
+    category_weights: Optional[Dict[str, float]],
+    daily_scores: Optional[Dict[date, ScoredPool]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ``(days, players)`` value and has-a-game matrices over *scored_pool*'s
+    rows: from each day's scored projection when *daily_scores* is given,
+    else the season value on every day the player's team is scheduled.
+    """
+    if daily_scores is None:
+        team_of = np.array([team_map.get(int(p), -1) for p in scored_pool.player_ids])
+        plays = np.array([
+            np.isin(team_of, list(schedule[day])) for day in days
+        ]).reshape(len(days), len(scored_pool))
+        values = np.tile(scored_pool.scores @ _weights(scored_pool, category_weights), (len(days), 1))
+        return values, plays
+
+    values = np.zeros((len(days), len(scored_pool)))
+    plays = np.zeros((len(days), len(scored_pool)), dtype=bool)
+    for d, day in enumerate(days):
+        slate = daily_scores.get(day)
+        if slate is None or len(slate) == 0:
+            continue
+        known = np.array([int(p) in scored_pool for p in slate.player_ids], dtype=bool)
+        cols = scored_pool.rows_of(slate.player_ids[known])
+        values[d, cols] = slate.scores[known] @ _weights(slate, category_weights)
+        plays[d, cols] = True
+    return values, plays
+
+
+def _prune(states, plays_left: np.ndarray, values: np.ndarray, n_slots: int, width: int):
+    """
+    Keep the *width* best distinct ``(roster, adds)`` states, ranked by
+    value so far plus holding the roster for the remaining days.
+    """
+    masks = np.array([s[0] for s in states])
+    rest = _day_values(masks, plays_left, values, n_slots).sum(axis=1)
+    score = np.array([s[2] for s in states]) + rest
+
+    kept, seen = [], set()
+    for k in np.argsort(-score, kind="stable"):
+        key = (states[k][0].tobytes(), states[k][1])
+        if key in seen:
+            continue
+        seen.add(key)
+        kept.append(states[k])
+        if len(kept) == width:
+            break
+    return kept
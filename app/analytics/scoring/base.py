@@ -14,6 +14,7 @@ or the evaluation engine without any other changes.
 
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 
 from app.domain.player import PlayerPool
@@ -38,3 +39,19 @@ class ScoringStrategy(ABC):
         :returns:    A new ScoredPool; does not share state with *pool*.
         """
         ...
+
+    def cache_key(self) -> str:
+        """
+        Stable description of this strategy's configuration, used to key
+        cached scoring results. Two strategies with equal keys must produce
+        identical ScoredPools for the same pool.
+
+        The default covers the class name and every instance attribute;
+        override when attributes are not JSON-serialisable or when
+        equivalent configurations should share a key.
+        """
+        return json.dumps(
+            {"class": type(self).__qualname__, "config": vars(self)},
+            sort_keys=True,
+            default=str,
+        )
@@ -0,0 +1,172 @@
+"""
+app/analytics/scoring/cache.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+ScoringCache — content-addressed cache of ScoredPools.
+
+Entries are keyed on ``PlayerPool.fingerprint()`` plus the strategy's
+``cache_key()`` (class, effective weights/punts, stats window) and
+``CACHE_VERSION``, so any entry point that scores the same data the same
+way shares one result.
+
+Two tiers:
+  - a bounded in-memory LRU (per process), and
+  - an optional on-disk tier of ``.npz`` files (shared across processes,
+    e.g. the CLI and the Streamlit app), pruned oldest-first.
+
+Usage::
+
+    cache = ScoringCache(CACHE_DIR / "scores")
+    scored_pool = cache.score(strategy, player_pool)
+    print(cache.stats)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.analytics.scoring.base import ScoringStrategy
+from app.domain.player import PlayerPool
+from app.domain.scoring import ScoredPool
+from app.repository import file_repository as file_repo
+
+# Bump when scoring results or the ScoredPool column layout change, so
+# on-disk entries written by older code are no longer hit.
+CACHE_VERSION = 1
+
+
+@dataclass
+class CacheStats:
+    """Hit / miss counters for a ScoringCache."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} hits ({self.memory_hits} memory, {self.disk_hits} disk), "
+            f"{self.misses} misses"
+        )
+
+
+class ScoringCache:
+    """
+    Two-tier (memory LRU + disk) cache of ScoredPools.
+
+    :param directory:        On-disk tier location; ``None`` disables it.
+    :param max_entries:      In-memory LRU capacity.
+    :param max_disk_entries: On-disk capacity; oldest files are pruned.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_entries: int = 8,
+        max_disk_entries: int = 64,
+    ) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, ScoredPool]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def key(strategy: ScoringStrategy, pool: PlayerPool) -> str:
+        """Content address of ``strategy.score(pool)``."""
+        h = hashlib.sha256()
+        h.update(f"v{CACHE_VERSION}".encode("utf-8"))
+        h.update(pool.fingerprint().encode("utf-8"))
+        h.update(strategy.cache_key().encode("utf-8"))
+        return h.hexdigest()
+
+    def score(self, strategy: ScoringStrategy, pool: PlayerPool) -> ScoredPool:
+        """Return ``strategy.score(pool)``, from cache when possible."""
+        key = self.key(strategy, pool)
+
+        scored = self._memory.get(key)
+        if scored is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            return scored
+
+        scored = self._load(key, pool)
+        if scored is not None:
+            self.stats.disk_hits += 1
+        else:
+            self.stats.misses += 1
+            scored = strategy.score(pool)
+            self._store(key, scored)
+
+        self._remember(key, scored)
+        return scored
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the on-disk tier is left intact)."""
+        self._memory.clear()
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+
+    def _remember(self, key: str, scored: ScoredPool) -> None:
+        self._memory[key] = scored
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> Optional[Path]:
+        return self.directory / f"{key}.npz" if self.directory else None
+
+    def _load(self, key: str, pool: PlayerPool) -> Optional[ScoredPool]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            arrays = file_repo.load_npz(path)
+        except (OSError, ValueError) as e:
+            print(f"  [WARN] Ignoring unreadable score cache {path.name}: {e}")
+            return None
+        try:
+            os.utime(path)   # keep recently used entries out of pruning
+        except FileNotFoundError:
+            pass             # pruned by another process since loading
+        return ScoredPool.from_columns(arrays, pool=pool)
+
+    def _store(self, key: str, scored: ScoredPool) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        file_repo.save_npz(path, scored.to_columns())
+        self._prune()
+
+    def _prune(self) -> None:
+        # Another process may prune the same directory concurrently
+        files = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        files.sort()
+        for _, stale in files[:max(0, len(files) - self.max_disk_entries)]:
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,291 @@
+"""
+app/analytics/scoring/incremental.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+IncrementalZScorer — keeps ZScoreStrategy results current under small
+add / remove / update deltas without rescanning the pool.
+
+The scorer keeps running moments per category (Σx, Σx²) plus the
+shooting sums needed for the FG%/FT% impact columns (ΣFGM, ΣFGA, ΣFGM²,
+ΣFGA², ΣFGM·FGA and the FT equivalents). A delta touching *k* players
+costs O(k): their old and new rows are folded into those sums by row
+index, and an added or removed player takes or frees the last row. The
+ScoredPool is then a single vectorised rescale written into the
+scorer's own score matrix — no stats window, PlayerPool or player index
+is rebuilt.
+
+Because impact = FGM − FGA·p with p = ΣFGM / ΣFGA, its mean and variance
+follow from the shooting sums in closed form, so a league-FG% shift
+never forces a rescan.
+
+Usage::
+
+    scorer = IncrementalZScorer(strategy, player_pool)
+    scored = scorer.apply(updated=[player_with_new_last10], removed=[out_id])
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.analytics.scoring.z_score import SCORE_COLUMNS, ZScoreStrategy
+from app.domain.player import Player, PlayerPool, StatsWindow
+from app.domain.scoring import ScoredPool
+from app.domain.stats import STAT_COLUMNS, STAT_MAP
+
+_COL = {name: i for i, name in enumerate(STAT_COLUMNS)}
+
+# STAT_MAP categories that are plain stat columns (everything but the impacts)
+_PLAIN = [(j, _COL[col]) for j, (_, col, _) in enumerate(STAT_MAP) if col in _COL]
+_PLAIN_CAT = np.array([j for j, _ in _PLAIN])
+_PLAIN_SRC = np.array([c for _, c in _PLAIN])
+_FG_CAT = next(j for j, (_, col, _) in enumerate(STAT_MAP) if col == "FG%_Impact")
+_FT_CAT = next(j for j, (_, col, _) in enumerate(STAT_MAP) if col == "FT%_Impact")
+_IMPACT_CAT = [_FG_CAT, _FT_CAT]
+_MADE = np.array([_COL["FGM"], _COL["FTM"]])
+_ATT = np.array([_COL["FGA"], _COL["FTA"]])
+_DIRECTION = np.array([1.0 if hb else -1.0 for _, _, hb in STAT_MAP])
+
+# Layout of the running-moment vector
+_P = len(_PLAIN)
+_SUM = slice(0, _P)
+_SQ = slice(_P, 2 * _P)
+_SHOOT = 2 * _P          # then M, A, M², A², M·A, each as (FG, FT)
+_M, _A, _MM, _AA, _MA = (slice(_SHOOT + 2 * k, _SHOOT + 2 * k + 2) for k in range(5))
+
+
+def _moments(values: np.ndarray, signs: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Sum of per-player moment contributions for the rows in *values*, each
+    counted ``signs[i]`` times (default once) — −1 takes a row back out.
+    """
+    plain = values[:, _PLAIN_SRC]
+    m, a = values[:, _MADE], values[:, _ATT]
+    contrib = np.hstack([plain, plain * plain, m, a, m * m, a * a, m * a])
+    if signs is None:
+        return contrib.sum(axis=0)
+    return signs @ contrib
+
+
+class IncrementalZScorer:
+    """
+    Maintains a ZScoreStrategy scoring of a pool under incremental deltas.
+
+    Produces the same scores as ``strategy.score(pool)`` on the current
+    pool state (up to floating-point drift in the running sums; call
+    :meth:`resync` to recompute them exactly), though not in the same row
+    order, and without a PlayerPool attached (see :meth:`to_player_pool`).
+
+    The returned ScoredPool is a live view of the scorer's buffers: the
+    next delta updates it in place.
+
+    :param strategy: Supplies weights, punts and ``stats_source``.
+    :param pool:     Initial PlayerPool. Not mutated.
+    """
+
+    def __init__(self, strategy: ZScoreStrategy, pool: PlayerPool) -> None:
+        self.strategy = strategy
+        self.stats_source = strategy.stats_source
+        self._weights = strategy.weight_vector()
+
+        window = pool.window(self.stats_source)
+        n = len(window)
+        capacity = max(16, 2 * n)
+
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._names = np.empty(capacity, dtype=object)
+        self._values = np.zeros((capacity, len(STAT_COLUMNS)))
+        self._categories = np.zeros((capacity, len(STAT_MAP)))   # impacts filled per rescale
+        self._scores = np.zeros((capacity, len(SCORE_COLUMNS)))
+        self._total = np.zeros(capacity)
+        self._ids[:n] = pool.player_ids[window.rows]
+        self._names[:n] = pool.names[window.rows]
+        self._values[:n] = window.values
+        self._categories[:n, _PLAIN_CAT] = window.values[:, _PLAIN_SRC]
+        self._positions: List[List[str]] = [list(pool.positions[r]) for r in window.rows]
+        self._count = n
+
+        self._scored = ScoredPool(
+            player_ids=self._ids[:n],
+            names=self._names[:n],
+            score_columns=SCORE_COLUMNS,
+            scores=self._scores[:n],
+            total_value=self._total[:n],
+        )
+        # The output's player → row index doubles as ours; deltas keep it
+        # current entry by entry.
+        self._row: Dict[int, int] = self._scored._index
+
+        self._sums = _moments(self._values[:n])
+        self._stale = True
+
+    def __len__(self) -> int:
+        return self._count
+
+    # ------------------------------------------------------------------
+    # Deltas
+    # ------------------------------------------------------------------
+
+    def apply(
+        self,
+        updated: Iterable[Player] = (),
+        removed: Iterable[int] = (),
+    ) -> ScoredPool:
+        """
+        Fold a delta into the running sums and return the rescored pool.
+
+        :param updated: Players to add or replace. A player with no stats
+                        for ``stats_source`` is removed from scoring.
+        :param removed: Player IDs to drop (unknown IDs are ignored).
+        :returns:       The ScoredPool for the updated state.
+        """
+        old: List[np.ndarray] = []
+        new: List[np.ndarray] = []
+        for pid in removed:
+            row = self._row.get(int(pid))
+            if row is not None:
+                old.append(self._values[row].copy())
+                self._remove_row(row)
+        for player in updated:
+            row = self._row.get(player.player_id)
+            if row is not None:
+                old.append(self._values[row].copy())
+            stats = player.get_stats(self.stats_source)
+            if stats is None:
+                if row is not None:
+                    self._remove_row(row)
+                continue
+            if row is None:
+                row = self._append_row(player.player_id)
+            self._values[row] = stats.to_row()
+            self._categories[row, _PLAIN_CAT] = self._values[row, _PLAIN_SRC]
+            self._names[row] = player.name
+            self._positions[row] = list(player.positions)
+            new.append(self._values[row].copy())
+
+        if old or new:
+            signs = np.concatenate([-np.ones(len(old)), np.ones(len(new))])
+            self._sums += _moments(np.array(old + new), signs)
+            self._stale = True
+        return self.scored_pool()
+
+    def _remove_row(self, row: int) -> None:
+        """Drop *row*, moving the last row into its place."""
+        last = self._count - 1
+        del self._row[int(self._ids[row])]
+        if row != last:
+            moved = int(self._ids[last])
+            self._ids[row] = moved
+            self._names[row] = self._names[last]
+            self._values[row] = self._values[last]
+            self._categories[row] = self._categories[last]
+            self._positions[row] = self._positions[last]
+            self._row[moved] = row
+        self._positions.pop()
+        self._count = last
+
+    def _append_row(self, pid: int) -> int:
+        if self._count == len(self._ids):
+            self._grow()
+        row = self._count
+        self._ids[row] = pid
+        self._positions.append([])
+        self._row[pid] = row
+        self._count += 1
+        return row
+
+    def _grow(self) -> None:
+        self._ids = np.concatenate([self._ids, np.zeros_like(self._ids)])
+        self._names = np.concatenate([self._names, np.empty(len(self._names), dtype=object)])
+        self._values = np.vstack([self._values, np.zeros_like(self._values)])
+        self._categories = np.vstack([self._categories, np.zeros_like(self._categories)])
+        self._scores = np.vstack([self._scores, np.zeros_like(self._scores)])
+        self._total = np.concatenate([self._total, np.zeros_like(self._total)])
+
+    def resync(self) -> None:
+        """Recompute the running sums from the stored rows (clears drift)."""
+        self._sums = _moments(self._values[:self._count])
+        self._stale = True
+
+    # ------------------------------------------------------------------
+    # Rescale
+    # ------------------------------------------------------------------
+
+    def _mean_std(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-category mean / sample std from the running sums, plus league (FG%, FT%)."""
+        n = self._count
+        s = self._sums
+        mean = np.zeros(len(STAT_MAP))
+        sq_dev = np.zeros(len(STAT_MAP))       # Σ(x − mean)²
+
+        mean[_PLAIN_CAT] = s[_SUM] / n
+        sq_dev[_PLAIN_CAT] = s[_SQ] - s[_SUM] ** 2 / n
+
+        m, a = s[_M], s[_A]
+        pct = np.divide(m, a, out=np.full(2, np.nan), where=a != 0)
+        # impact_i = M_i − p·A_i  →  Σ = M − pA,  Σ² = MM − 2p·MA + p²·AA
+        total = m - pct * a
+        mean[_IMPACT_CAT] = total / n
+        sq_dev[_IMPACT_CAT] = (s[_MM] - 2 * pct * s[_MA] + pct * pct * s[_AA]) - total ** 2 / n
+
+        std = np.sqrt(np.maximum(sq_dev, 0.0) / (n - 1))
+        # Running sums leave ~1e-12 residue where the exact answer is 0.
+        std = np.where(std <= 1e-9 * np.maximum(1.0, np.abs(mean)), 1.0, std)
+        return mean, std, pct
+
+    def scored_pool(self) -> ScoredPool:
+        """The ScoredPool for the current state (rescaled only after a delta)."""
+        n = self._count
+        if n == 0:
+            return ScoredPool()
+        if self._stale:
+            self._rescale()
+        scored = self._scored
+        scored.player_ids = self._ids[:n]
+        scored.names = self._names[:n]
+        scored.scores = self._scores[:n]
+        scored.total_value = self._total[:n]
+        return scored
+
+    def _rescale(self) -> None:
+        """Rewrite every row's scores from the stored lines and running sums."""
+        n = self._count
+        values = self._values[:n]
+        categories = self._categories[:n]
+        scores = self._scores[:n]
+        if n < 2:
+            pct = np.full(2, np.nan)
+        else:
+            mean, std, pct = self._mean_std()
+
+        impacts = values[:, _MADE] - values[:, _ATT] * pct
+        categories[:, _IMPACT_CAT] = impacts
+
+        if n < 2:
+            z = np.zeros_like(categories)
+        else:
+            z = categories - mean
+            z *= _DIRECTION * self._weights / std
+            np.round(z, 3, out=z)
+            z += 0.0                       # no -0.0, as in ZScoreStrategy.score
+        scores[:, :len(STAT_MAP)] = z
+        scores[:, len(STAT_MAP):] = np.round(impacts, 3) + 0.0
+        z.sum(axis=1, out=self._total[:n])
+        self._stale = False
+
+    def to_player_pool(self) -> PlayerPool:
+        """The current state as a PlayerPool (``stats_source`` window only)."""
+        n = self._count
+        values = self._values[:n].copy()
+        values.flags.writeable = False
+        return PlayerPool(
+            player_ids=self._ids[:n].copy(),
+            names=self._names[:n].copy(),
+            positions=list(self._positions),
+            windows={
+                self.stats_source: StatsWindow(
+                    rows=np.arange(n, dtype=np.int64), values=values
+                )
+            },
+        )
@@ -0,0 +1,190 @@
+"""
+app/analytics/scoring/punt_search.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Exhaustive punt-build search over every subset of the nine categories.
+
+Each build is a bitmask over STAT_MAP (bit *c* set = category *c* punted),
+so the 2^9 weight vectors form one ``(builds, 9)`` matrix ``W`` whose
+row *m* is the configured weights with the bits of *m* zeroed (punting
+all nine is left out — it scores every team 0). With the
+unweighted z-matrix ``Z`` computed once:
+
+  - every league team's build total is ``T @ W.T``, where ``T`` holds the
+    teams' summed z-rows (their ``RosterSnapshot.category_totals``);
+  - every free agent's build value is ``Z_fa @ W.T``, and the top free
+    agents per build come from one column-wise ``argpartition``.
+
+The whole sweep is a couple of small matmuls, well under a second.
+
+Usage::
+
+    result = search_punts(pool, weights, {"my_team": ids, "rival": ids}, "my_team")
+    result.to_dataframe().head(10)      # best builds for my_team first
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.analytics.scoring.scenarios import CATEGORIES
+from app.analytics.scoring.z_score import pool_z_matrix, weight_vector
+from app.domain.player import PlayerPool
+
+_N_CATS = len(CATEGORIES)
+
+
+# ---------------------------------------------------------------------------
+# Bitmask helpers
+# ---------------------------------------------------------------------------
+
+def punt_masks(max_size: Optional[int] = None) -> np.ndarray:
+    """Build bitmasks punting at most *max_size* categories (ascending, < 9)."""
+    masks = np.arange((1 << _N_CATS) - 1, dtype=np.int64)
+    if max_size is None:
+        return masks
+    sizes = ((masks[:, None] >> np.arange(_N_CATS)) & 1).sum(axis=1)
+    return masks[sizes <= max_size]
+
+
+def mask_weights(weights: Dict[str, float], masks: np.ndarray) -> np.ndarray:
+    """``(len(masks), 9)`` weight matrix: *weights* with punted bits zeroed."""
+    punted = (masks[:, None] >> np.arange(_N_CATS)) & 1
+    return np.where(punted == 1, 0.0, weight_vector(weights, [])[None, :])
+
+
+def punted_categories(mask: int) -> List[str]:
+    """Category names punted by *mask*."""
+    return [cat for c, cat in enumerate(CATEGORIES) if mask >> c & 1]
+
+
+# ---------------------------------------------------------------------------
+# Result type
+# ---------------------------------------------------------------------------
+
+@dataclass(eq=False)
+class PuntSearchResult:
+    """
+    One row per build (``masks[k]``).
+
+    ``team_totals[t, k]`` is league team ``team_names[t]``'s total under
+    build *k*; ``rank[k]`` is my team's place among them (1 = best) and
+    ``margin[k]`` my total minus the best rival's. ``top_free_agents[k]``
+    holds the best free-agent IDs under build *k*, best first.
+    """
+
+    masks: np.ndarray
+    team_names: List[str]
+    team_totals: np.ndarray               # (teams, builds)
+    my_team: str
+    rank: np.ndarray                      # (builds,)
+    margin: np.ndarray                    # (builds,)
+    category_ranks: Dict[str, int]        # my league rank per category (unweighted)
+    top_free_agents: np.ndarray           # (builds, top_n) player IDs
+    top_free_agent_names: np.ndarray      # (builds, top_n)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def best_builds(self) -> np.ndarray:
+        """Build indices ordered best-first: by league rank, then by margin."""
+        return np.lexsort((-self.margin, self.rank))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Builds best-first: punts, rank, my total, margin, top free agents."""
+        order = self.best_builds()
+        mine = self.team_names.index(self.my_team)
+        return pd.DataFrame({
+            "punt": ["+".join(punted_categories(int(m))) or "none" for m in self.masks[order]],
+            "n_punted": [len(punted_categories(int(m))) for m in self.masks[order]],
+            "league_rank": self.rank[order],
+            "my_total": np.round(self.team_totals[mine, order], 3),
+            "margin": np.round(self.margin[order], 3),
+            "top_free_agents": [", ".join(names) for names in self.top_free_agent_names[order]],
+        })
+
+
+# ---------------------------------------------------------------------------
+# Core engine
+# ---------------------------------------------------------------------------
+
+def search_punts(
+    pool: PlayerPool,
+    weights: Dict[str, float],
+    league: Dict[str, Sequence[int]],
+    my_team: str,
+    max_size: Optional[int] = None,
+    top_n: int = 5,
+    stats_source: str = "stats_curr_season",
+) -> PuntSearchResult:
+    """
+    Score every punt build for *my_team* against the rest of *league*.
+
+    :param pool:         PlayerPool to score. Not mutated.
+    :param weights:      Category weights shared by every build.
+    :param league:       ``{team name: player IDs}`` including *my_team*;
+                         players on any team are not free agents.
+    :param my_team:      Key of my roster in *league*.
+    :param max_size:     Only builds punting at most this many categories
+                         (``None`` = every build, 511).
+    :param top_n:        Free agents reported per build.
+    :param stats_source: Which PlayerStats window to score against.
+    :returns:            PuntSearchResult.
+    :raises KeyError:    If *my_team* is not in *league*.
+    """
+    if my_team not in league:
+        raise KeyError(f"{my_team!r} is not one of the league teams.")
+
+    rows, z, _ = pool_z_matrix(pool, stats_source)
+    ids = pool.player_ids[rows]
+    masks = punt_masks(max_size)
+    w = mask_weights(weights, masks)                              # (B, 9)
+
+    # League teams' unweighted category totals → every build's total
+    team_names = list(league)
+    position = {int(pid): i for i, pid in enumerate(ids)}
+    members = np.zeros((len(team_names), len(ids)))
+    for t, name in enumerate(team_names):
+        for pid in league[name]:
+            if int(pid) in position:
+                members[t, position[int(pid)]] = 1.0
+    team_z = members @ z                                          # (T, 9)
+    team_totals = team_z @ w.T                                    # (T, B)
+
+    mine = team_names.index(my_team)
+    rivals = np.delete(team_totals, mine, axis=0)
+    rank = 1 + (rivals > team_totals[mine]).sum(axis=0)
+    margin = (
+        team_totals[mine] - rivals.max(axis=0)
+        if len(rivals) else np.zeros(len(masks))
+    )
+    category_ranks = {
+        cat: int(1 + (np.delete(team_z[:, c], mine) > team_z[mine, c]).sum())
+        for c, cat in enumerate(CATEGORIES)
+    }
+
+    # Top free agents per build: one argpartition down each build column
+    fa = np.flatnonzero(members.sum(axis=0) == 0)
+    fa_values = z[fa] @ w.T                                       # (FA, B)
+    k = min(top_n, len(fa))
+    if k:
+        top = np.argpartition(-fa_values, k - 1, axis=0)[:k]      # (k, B), unordered
+        order = np.argsort(-np.take_along_axis(fa_values, top, axis=0), axis=0, kind="stable")
+        top = np.take_along_axis(top, order, axis=0).T            # (B, k)
+    else:
+        top = np.empty((len(masks), 0), dtype=np.int64)
+
+    return PuntSearchResult(
+        masks=masks,
+        team_names=team_names,
+        team_totals=team_totals,
+        my_team=my_team,
+        rank=rank,
+        margin=margin,
+        category_ranks=category_ranks,
+        top_free_agents=ids[fa[top]],
+        top_free_agent_names=pool.names[rows][fa[top]],
+    )
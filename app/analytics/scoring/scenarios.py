@@ -0,0 +1,215 @@
+"""
+app/analytics/scoring/scenarios.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Batch z-scoring of many weight / punt configurations in one pass.
+
+The unweighted z-matrix ``Z`` (players × 9 categories) is computed once;
+each scenario is a 9-vector of category weights (0.0 for punted
+categories), stacked into ``W`` (scenarios × 9). Every scenario's total
+value is then a single matrix product ``Z @ W.T``.
+
+Usage::
+
+    scenarios = [Scenario("base", weights), Scenario("punt TO", weights, ["TO"])]
+    result = score_scenarios(player_pool, scenarios)
+    result.ranking("punt TO")[:10]     # top-10 player IDs for that build
+    result.to_dataframe()              # players × scenarios Total_Value table
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.analytics.scoring.z_score import pool_z_matrix, weight_vector
+from app.domain.player import PlayerPool
+from app.domain.stats import STAT_MAP
+
+CATEGORIES: List[str] = [cat for cat, _, _ in STAT_MAP]
+
+
+# ---------------------------------------------------------------------------
+# Scenario definition
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Scenario:
+    """One weight / punt configuration to score the pool under."""
+
+    name: str
+    weights: Dict[str, float] = field(default_factory=dict)
+    punt_categories: List[str] = field(default_factory=list)
+
+    def weight_vector(self) -> np.ndarray:
+        return weight_vector(self.weights, self.punt_categories)
+
+    @classmethod
+    def from_dict(
+        cls, d: dict, default_weights: Optional[Dict[str, float]] = None
+    ) -> "Scenario":
+        """
+        Deserialise from the scenarios-file format::
+
+            { "name": ..., "category_weights": {...}, "punt_categories": [...] }
+
+        ``category_weights`` falls back to *default_weights* when omitted.
+        """
+        punts = [str(c) for c in d.get("punt_categories", [])]
+        weights = d.get("category_weights") or default_weights or {}
+        return cls(
+            name=str(d.get("name") or _punt_name(punts)),
+            weights={k: float(v) for k, v in weights.items()},
+            punt_categories=punts,
+        )
+
+
+def _punt_name(punts: Sequence[str]) -> str:
+    return "punt " + "+".join(punts) if punts else "no punt"
+
+
+def punt_subset_scenarios(
+    weights: Dict[str, float],
+    max_size: Optional[int] = None,
+) -> List[Scenario]:
+    """
+    One Scenario per punt subset of the nine categories (2^9 = 512 when
+    *max_size* is ``None``), all sharing *weights*.
+    """
+    max_size = len(CATEGORIES) if max_size is None else max_size
+    return [
+        Scenario(_punt_name(punts), dict(weights), list(punts))
+        for k in range(max_size + 1)
+        for punts in combinations(CATEGORIES, k)
+    ]
+
+
+def load_scenarios(
+    raw: dict, default_weights: Optional[Dict[str, float]] = None
+) -> List[Scenario]:
+    """
+    Build scenarios from a parsed scenarios file::
+
+        scenarios:                 # explicit builds
+          - name: punt-ft
+            punt_categories: [FT%]
+            category_weights: {...}   # optional, defaults to config.yaml
+        punt_subsets:              # optional: every punt subset ...
+          max_size: 3              # ... up to this size (omit for all 512)
+
+    Punt subsets that repeat an explicit scenario's name or weights (e.g.
+    ``punt FT%`` alongside an explicit ``punt FT%`` build) are dropped.
+
+    :raises ValueError: if the file defines no scenarios, or two explicit
+                        scenarios share a name.
+    """
+    scenarios = [
+        Scenario.from_dict(d, default_weights) for d in raw.get("scenarios") or []
+    ]
+    names = [s.name for s in scenarios]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate scenario names: {', '.join(duplicates)}")
+
+    subsets = raw.get("punt_subsets")
+    if subsets:
+        max_size = subsets.get("max_size") if isinstance(subsets, dict) else None
+        explicit = [s.weight_vector() for s in scenarios]
+        scenarios += [
+            s for s in punt_subset_scenarios(default_weights or {}, max_size)
+            if s.name not in names
+            and not any(np.array_equal(s.weight_vector(), w) for w in explicit)
+        ]
+    if not scenarios:
+        raise ValueError(
+            "Scenarios file defines no scenarios "
+            "(expected a `scenarios:` list and/or `punt_subsets:`)."
+        )
+    return scenarios
+
+
+# ---------------------------------------------------------------------------
+# Result type
+# ---------------------------------------------------------------------------
+
+@dataclass(eq=False)
+class ScenarioScores:
+    """
+    Total value of every player under every scenario.
+
+    ``total_value[i, k]`` is player ``player_ids[i]``'s total under
+    ``scenario_names[k]``. Totals are the unrounded ``Z @ W.T`` product, so
+    they can differ from ``ZScoreStrategy.score`` (which rounds each
+    category to 3 dp first) in the third decimal place.
+    """
+
+    player_ids: np.ndarray
+    names: np.ndarray
+    scenario_names: List[str]
+    total_value: np.ndarray          # (players, scenarios)
+
+    def __len__(self) -> int:
+        return len(self.scenario_names)
+
+    def _col(self, scenario: str) -> int:
+        try:
+            return self.scenario_names.index(scenario)
+        except ValueError:
+            raise KeyError(f"Unknown scenario: {scenario!r}") from None
+
+    def ranking(self, scenario: str) -> np.ndarray:
+        """Player IDs ordered best-first under *scenario*."""
+        order = np.argsort(-self.total_value[:, self._col(scenario)], kind="stable")
+        return self.player_ids[order]
+
+    def rankings(self) -> np.ndarray:
+        """``(scenarios, players)`` matrix of player IDs, each row best-first."""
+        order = np.argsort(-self.total_value, axis=0, kind="stable")
+        return self.player_ids[order].T
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Players × scenarios Total_Value table (player_id, name, <scenarios…>)."""
+        df = pd.DataFrame(self.total_value, columns=self.scenario_names)
+        df.insert(0, "player_id", self.player_ids)
+        df.insert(1, "name", self.names)
+        return df
+
+
+# ---------------------------------------------------------------------------
+# Core engine
+# ---------------------------------------------------------------------------
+
+def score_scenarios(
+    pool: PlayerPool,
+    scenarios: Sequence[Scenario],
+    stats_source: str = "stats_curr_season",
+) -> ScenarioScores:
+    """
+    Score *pool* under every scenario with one z-matrix and one matmul.
+
+    :param pool:         PlayerPool to score. Not mutated.
+    :param scenarios:    Weight / punt configurations to apply.
+    :param stats_source: Which PlayerStats window to score against.
+    :returns:            ScenarioScores (players × scenarios).
+    """
+    names = [s.name for s in scenarios]
+    if len(pool.window(stats_source)) == 0:
+        return ScenarioScores(
+            player_ids=np.empty(0, dtype=np.int64),
+            names=np.empty(0, dtype=object),
+            scenario_names=names,
+            total_value=np.empty((0, len(scenarios))),
+        )
+
+    rows, z, _ = pool_z_matrix(pool, stats_source)
+    weights = np.vstack([s.weight_vector() for s in scenarios])   # (K, 9)
+
+    return ScenarioScores(
+        player_ids=pool.player_ids[rows],
+        names=pool.names[rows],
+        scenario_names=names,
+        total_value=z @ weights.T,
+    )
@@ -0,0 +1,38 @@
+"""
+app/analytics/scoring/service.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+The configured scoring strategy and the process-wide scoring cache.
+
+Shared by every entry point (CLI commands and the Streamlit app) without
+pulling in the command layer; the cache's on-disk tier lets separate
+processes reuse each other's results.
+
+Usage::
+
+    from app.analytics.scoring.service import score_pool
+    scored_pool = score_pool(player_pool)
+"""
+
+from __future__ import annotations
+
+from app.analytics.scoring.cache import ScoringCache
+from app.analytics.scoring.z_score import ZScoreStrategy
+from app.config import CACHE_DIR, config
+from app.domain.player import PlayerPool
+from app.domain.scoring import ScoredPool
+
+scoring_cache = ScoringCache(CACHE_DIR / "scores")
+
+
+def default_strategy() -> ZScoreStrategy:
+    """ZScoreStrategy with config.yaml's ``scoring`` weights, punts and window."""
+    return ZScoreStrategy(
+        weights=config.scoring.category_weights,
+        punt_categories=config.scoring.punt_categories,
+        stats_source=config.scoring.stats_source,
+    )
+
+
+def score_pool(pool: PlayerPool) -> ScoredPool:
+    """Score *pool* with the configured strategy, via the scoring cache."""
+    return scoring_cache.score(default_strategy(), pool)
@@ -14,18 +14,146 @@ Usage::
         stats_source="stats_curr_season",
     )
     scored_pool = strategy.score(player_pool)
+
+    # Another pool's lines on the first pool's scale (e.g. one day's slate)
+    slate_scores = strategy.score(slate_pool, reference=strategy.reference(player_pool))
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 
 from app.analytics.scoring.base import ScoringStrategy
 from app.domain.player import PlayerPool
-from app.domain.scoring import CategoryScores, ScoredPlayer, ScoredPool
-from app.domain.stats import STAT_MAP
+from app.domain.scoring import ScoredPool
+from app.domain.stats import STAT_COLUMNS, STAT_MAP
+
+_COL = {name: i for i, name in enumerate(STAT_COLUMNS)}
+
+# Output score columns, in order: z-score per category, then impact columns.
+Z_SCORE_COLS: List[str] = [f"z{cat}" for cat, _, _ in STAT_MAP]
+SCORE_COLUMNS: List[str] = Z_SCORE_COLS + ["FG%_Impact", "FT%_Impact"]
+
+# +1 where higher is better, -1 where lower is better (TO)
+_DIRECTION = np.array([1.0 if hb else -1.0 for _, _, hb in STAT_MAP])
+
+
+def league_pct(values: np.ndarray) -> np.ndarray:
+    """League (FG%, FT%) of a stats-window matrix: total makes / total attempts."""
+    totals = values.sum(axis=0)
+    return totals[[_COL["FGM"], _COL["FTM"]]] / totals[[_COL["FGA"], _COL["FTA"]]]
+
+
+def category_matrix(
+    values: np.ndarray, league: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the per-category input matrix for a stats window.
+
+    :param values: ``(n, len(STAT_COLUMNS))`` stats-window matrix.
+    :param league: League (FG%, FT%) the impacts are measured against
+                   (default: *values*' own, see :func:`league_pct`).
+    :returns:      ``(categories, impacts)`` — an ``(n, 9)`` matrix laid out
+                   as STAT_MAP (FG%/FT% as volume-weighted impact) and the
+                   ``(n, 2)`` FG%/FT% impact columns themselves.
+    """
+    fgm, fga = values[:, _COL["FGM"]], values[:, _COL["FGA"]]
+    ftm, fta = values[:, _COL["FTM"]], values[:, _COL["FTA"]]
+
+    league_fg_pct, league_ft_pct = league_pct(values) if league is None else league
+    impacts = np.column_stack([
+        fgm - fga * league_fg_pct,
+        ftm - fta * league_ft_pct,
+    ])
+
+    categories = np.empty((len(values), len(STAT_MAP)))
+    for j, (_, col_name, _) in enumerate(STAT_MAP):
+        if col_name == "FG%_Impact":
+            categories[:, j] = impacts[:, 0]
+        elif col_name == "FT%_Impact":
+            categories[:, j] = impacts[:, 1]
+        else:
+            categories[:, j] = values[:, _COL[col_name]]
+    return categories, impacts
+
+
+def unweighted_z_matrix(
+    categories: np.ndarray, reference: Optional["ZReference"] = None
+) -> np.ndarray:
+    """
+    Direction-adjusted z-scores for every category in one matrix op.
+
+    Uses the sample standard deviation (ddof=1) to match pandas; a zero
+    deviation is treated as 1.0 to avoid division by zero. Pools with
+    fewer than two players score 0.0 everywhere.
+
+    :param reference: Mean / std to scale by (default: *categories*' own).
+    """
+    if reference is None:
+        if len(categories) < 2:
+            return np.zeros_like(categories)
+        mean = categories.mean(axis=0)
+        std = categories.std(axis=0, ddof=1)
+        std = np.where(std == 0, 1.0, std)
+    else:
+        mean, std = reference.mean, reference.std
+    return (categories - mean) / std * _DIRECTION
+
+
+@dataclass(frozen=True)
+class ZReference:
+    """
+    The scale a pool is z-scored on: per-category mean and std, and the
+    league (FG%, FT%) the impact columns are measured against.
+
+    Scoring another pool against it (``ZScoreStrategy.score(pool,
+    reference=…)``) puts the same line at the same value however many
+    other players that pool holds.
+    """
+
+    mean: np.ndarray
+    std: np.ndarray
+    league: np.ndarray
+
+    @classmethod
+    def of(cls, values: np.ndarray) -> "ZReference":
+        """The reference of a ``(n, len(STAT_COLUMNS))`` stats-window matrix."""
+        league = league_pct(values)
+        categories, _ = category_matrix(values, league)
+        if len(categories) < 2:
+            # Matches unweighted_z_matrix: too few players score 0.0
+            return cls(np.zeros(len(STAT_MAP)), np.full(len(STAT_MAP), np.inf), league)
+        std = categories.std(axis=0, ddof=1)
+        return cls(categories.mean(axis=0), np.where(std == 0, 1.0, std), league)
+
+
+def weight_vector(
+    weights: Dict[str, float], punt_categories: List[str]
+) -> np.ndarray:
+    """Per-category multipliers laid out as STAT_MAP (0.0 for punts)."""
+    return np.array([
+        0.0 if cat in punt_categories else weights.get(cat, 1.0)
+        for cat, _, _ in STAT_MAP
+    ])
+
+
+def pool_z_matrix(
+    pool: PlayerPool, stats_source: str
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Unweighted z-scores for one stats window of *pool*.
+
+    :returns: ``(rows, z, impacts)`` — pool rows that have the window,
+              the ``(n, 9)`` unweighted z-matrix and the ``(n, 2)``
+              FG%/FT% impact columns.
+    """
+    window = pool.window(stats_source)
+    categories, impacts = category_matrix(window.values)
+    return window.rows, unweighted_z_matrix(categories), impacts
 
 
 class ZScoreStrategy(ScoringStrategy):
@@ -49,70 +177,56 @@ class ZScoreStrategy(ScoringStrategy):
         self.punt_categories: List[str] = punt_categories or []
         self.stats_source = stats_source
 
+    def cache_key(self) -> str:
+        """Keyed on the effective per-category weights, not their spelling."""
+        return json.dumps({
+            "class": type(self).__qualname__,
+            "weights": self.weight_vector().tolist(),
+            "stats_source": self.stats_source,
+        })
+
+    def weight_vector(self) -> np.ndarray:
+        """Per-category multipliers laid out as STAT_MAP (0.0 for punts)."""
+        return weight_vector(self.weights, self.punt_categories)
+
     # ------------------------------------------------------------------
     # ScoringStrategy interface
     # ------------------------------------------------------------------
 
-    def score(self, pool: PlayerPool) -> ScoredPool:
+    def reference(self, pool: PlayerPool) -> ZReference:
+        """*pool*'s scale for ``stats_source`` (see :meth:`score`)."""
+        return ZReference.of(pool.window(self.stats_source).values)
+
+    def score(self, pool: PlayerPool, reference: Optional[ZReference] = None) -> ScoredPool:
         """
         Score every player in *pool* and return a ScoredPool.
 
-        :param pool: PlayerPool to score. Not mutated.
-        :returns:    ScoredPool keyed by player_id (int).
+        All nine categories are scored as one matrix operation over the
+        pool's stats window; the result is backed by that score matrix.
+
+        :param pool:      PlayerPool to score. Not mutated.
+        :param reference: Score against this scale (:meth:`reference` of
+                          another pool) instead of *pool*'s own.
+        :returns:         ScoredPool keyed by player_id (int).
         """
-        df = pool.to_dataframe(self.stats_source)
-        if df.empty:
+        if len(pool.window(self.stats_source)) == 0:
             return ScoredPool()
 
-        df = df.copy()   # never mutate the pool's dataframe
-
-        # --- FG% / FT% impact scores (volume-weighted) ---
-        league_fg_pct = df["FGM"].sum() / df["FGA"].sum()
-        league_ft_pct = df["FTM"].sum() / df["FTA"].sum()
-        df["FG%_Impact"] = df["FGM"] - (df["FGA"] * league_fg_pct)
-        df["FT%_Impact"] = df["FTM"] - (df["FTA"] * league_ft_pct)
-
-        # --- Z-scores per category ---
-        z_score_cols: List[str] = []
-
-        for cat_name, col_name, higher_better in STAT_MAP:
-            mean = df[col_name].mean()
-            std = df[col_name].std() or 1.0     # avoid division by zero
-
-            z_col = f"z{cat_name}"
-
-            if higher_better:
-                df[z_col] = (df[col_name] - mean) / std
-            else:
-                df[z_col] = (mean - df[col_name]) / std
-
-            weight = self.weights.get(cat_name, 1.0)
-            df[z_col] = 0.0 if cat_name in self.punt_categories else df[z_col] * weight
-
-            z_score_cols.append(z_col)
-
-        df = df.round(3)
-        df["Total_Value"] = df[z_score_cols].sum(axis=1)
-
-        # --- Build ScoredPool from the scored DataFrame ---
-        scored_players: Dict[int, ScoredPlayer] = {}
-
-        for _, row in df.iterrows():
-            pid = int(row["player_id"])
-            player = pool.get(pid)
-            if player is None:
-                continue
-
-            scores: Dict[str, float] = {col: float(row[col]) for col in z_score_cols}
-            scores["FG%_Impact"] = float(row["FG%_Impact"])
-            scores["FT%_Impact"] = float(row["FT%_Impact"])
-
-            scored_players[pid] = ScoredPlayer(
-                player=player,
-                category_scores=CategoryScores(
-                    scores=scores,
-                    total_value=float(row["Total_Value"]),
-                ),
-            )
-
-        return ScoredPool(scored_players=scored_players)
+        if reference is None:
+            rows, z, impacts = pool_z_matrix(pool, self.stats_source)
+        else:
+            window = pool.window(self.stats_source)
+            categories, impacts = category_matrix(window.values, reference.league)
+            rows, z = window.rows, unweighted_z_matrix(categories, reference)
+        # + 0.0 turns the -0.0 of punted (weight 0) columns and tiny
+        # negatives rounded to zero into 0.0
+        z = np.round(z * self.weight_vector(), 3) + 0.0
+
+        return ScoredPool(
+            player_ids=pool.player_ids[rows],
+            names=pool.names[rows],
+            score_columns=SCORE_COLUMNS,
+            scores=np.hstack([z, np.round(impacts, 3) + 0.0]),
+            total_value=z.sum(axis=1),
+            pool=pool,
+        )
@@ -0,0 +1 @@
+"""app/analytics/simulation — Monte Carlo matchup simulation."""
@@ -0,0 +1,288 @@
+"""
+app/analytics/simulation/matchup.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Monte Carlo head-to-head 9-category matchup simulator.
+
+Model: every player's period output is Poisson per category, with mean
+= per-game line × games. Shooting is modelled as attempts ~ Poisson and
+makes ~ Binomial(attempts, player's FG% / FT%), which by Poisson
+thinning is the same as independent makes ~ Poisson(FGM) and
+misses ~ Poisson(FGA − FGM).
+
+Since a sum of independent Poissons is Poisson with the summed mean,
+team totals are sampled directly from the team's summed rates — an
+exact shortcut that turns players × categories × simulations draws into
+categories × simulations. Team FG% / FT% = makes / (makes + misses).
+``distribution="normal"`` uses Normal(mean, √mean) team totals clipped
+at 0 instead.
+
+A category is won by the higher team total (lower for TO); the matchup
+is won by winning more categories than the opponent. Large simulation
+counts are split into chunks with independent seeds
+(``SeedSequence.spawn``) and can be spread across a process pool;
+results are reproducible for a given ``seed`` regardless of ``n_workers``.
+
+Usage::
+
+    result = simulate_matchup(pool, my_roster, opp_roster, n_sims=100_000, seed=7)
+    result.category_win_prob["BLK"], result.win_prob
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.domain.player import PlayerPool
+from app.domain.roster import Roster
+from app.domain.stats import STAT_COLUMNS, STAT_MAP
+
+CATEGORIES: List[str] = [cat for cat, _, _ in STAT_MAP]
+DISTRIBUTIONS = ("poisson", "normal")
+
+_COL = {name: i for i, name in enumerate(STAT_COLUMNS)}
+_COUNTING = ["3PTM", "PTS", "REB", "AST", "ST", "BLK", "TO"]
+
+
+# ---------------------------------------------------------------------------
+# Result type
+# ---------------------------------------------------------------------------
+
+@dataclass
+class MatchupResult:
+    """
+    Outcome probabilities for my team vs. the opponent.
+
+    Per-category probabilities are keyed by STAT_MAP display name
+    (``"FG%"``, ``"PTS"``, …, ``"TO"``). Ties are reported separately.
+    """
+
+    n_sims: int
+    category_win_prob: Dict[str, float] = field(default_factory=dict)
+    category_tie_prob: Dict[str, float] = field(default_factory=dict)
+    win_prob: float = 0.0
+    tie_prob: float = 0.0
+    expected_categories_won: float = 0.0
+
+    @property
+    def loss_prob(self) -> float:
+        return 1.0 - self.win_prob - self.tie_prob
+
+    def to_dict(self) -> dict:
+        return {
+            "n_sims": self.n_sims,
+            "win_prob": self.win_prob,
+            "tie_prob": self.tie_prob,
+            "loss_prob": self.loss_prob,
+            "expected_categories_won": self.expected_categories_won,
+            "category_win_prob": self.category_win_prob,
+            "category_tie_prob": self.category_tie_prob,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Sampling
+# ---------------------------------------------------------------------------
+
+# Independent Poisson rates sampled per team: makes and misses (not makes
+# and attempts) so that both stay independent, plus the counting stats.
+_RATES = ["FGM", "FG_MISS", "FTM", "FT_MISS"] + _COUNTING
+
+
+def _team_rates(lines: np.ndarray) -> np.ndarray:
+    """Team-level expected values laid out as ``_RATES``."""
+    total = lines.sum(axis=0)
+    return np.array(
+        [
+            total[_COL["FGM"]],
+            max(total[_COL["FGA"]] - total[_COL["FGM"]], 0.0),
+            total[_COL["FTM"]],
+            max(total[_COL["FTA"]] - total[_COL["FTM"]], 0.0),
+        ]
+        + [total[_COL[c]] for c in _COUNTING]
+    )
+
+
+def _team_totals(
+    rng: np.random.Generator, rates: np.ndarray, n: int, distribution: str
+) -> np.ndarray:
+    """
+    Simulate *n* periods for one team.
+
+    :param rates: Team expected values laid out as ``_RATES``.
+    :returns:     ``(n, 9)`` team category values laid out as STAT_MAP.
+    """
+    if distribution == "poisson":
+        draws = rng.poisson(rates, size=(n, len(rates))).astype(np.float64)
+    else:
+        draws = np.maximum(rng.normal(rates, np.sqrt(rates), size=(n, len(rates))), 0.0)
+
+    out = np.empty((n, len(CATEGORIES)))
+    for j, (made, miss) in enumerate(((0, 1), (2, 3))):
+        attempts = draws[:, made] + draws[:, miss]
+        out[:, j] = np.divide(
+            draws[:, made], attempts, out=np.zeros(n), where=attempts > 0
+        )
+    for k, stat in enumerate(_COUNTING):
+        out[:, CATEGORIES.index(stat)] = draws[:, 4 + k]
+    return out
+
+
+def _simulate_chunk(
+    args: Tuple[np.ndarray, np.ndarray, int, np.random.SeedSequence, str],
+) -> Tuple[np.ndarray, np.ndarray, int, int, float]:
+    """
+    Run one chunk of simulations (top-level so a process pool can pickle it).
+
+    :returns: ``(category wins, category ties, matchup wins, matchup ties,
+              Σ categories won)`` for the chunk.
+    """
+    my_rates, opp_rates, n, seed, distribution = args
+    rng = np.random.default_rng(seed)
+
+    mine = _team_totals(rng, my_rates, n, distribution)
+    theirs = _team_totals(rng, opp_rates, n, distribution)
+
+    direction = np.array([1.0 if hb else -1.0 for _, _, hb in STAT_MAP])
+    margin = (mine - theirs) * direction
+    won, tied = margin > 0, margin == 0
+    n_won, n_lost = won.sum(axis=1), (margin < 0).sum(axis=1)
+
+    return (
+        won.sum(axis=0),
+        tied.sum(axis=0),
+        int((n_won > n_lost).sum()),
+        int((n_won == n_lost).sum()),
+        float(n_won.sum()),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Core engine
+# ---------------------------------------------------------------------------
+
+def simulate(
+    my_lines: np.ndarray,
+    opp_lines: np.ndarray,
+    n_sims: int = 10_000,
+    seed: Optional[int] = None,
+    distribution: str = "poisson",
+    n_workers: int = 1,
+    chunk_size: int = 20_000,
+) -> MatchupResult:
+    """
+    Simulate a matchup from per-player expected stat lines.
+
+    :param my_lines:     ``(players, len(STAT_COLUMNS))`` expected totals for
+                         the period (per-game line × games played).
+    :param opp_lines:    Same for the opponent.
+    :param n_sims:       Number of simulated periods.
+    :param seed:         Seed for reproducible results.
+    :param distribution: ``"poisson"`` or ``"normal"``.
+    :param n_workers:    Processes to spread chunks over (1 = in-process).
+    :param chunk_size:   Simulations per chunk (bounds peak memory).
+    :returns:            MatchupResult.
+    :raises ValueError:  On an unknown distribution or non-positive n_sims.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution!r}; use one of {DISTRIBUTIONS}.")
+    if n_sims <= 0:
+        raise ValueError("n_sims must be positive.")
+
+    my_rates = _team_rates(np.nan_to_num(np.asarray(my_lines, dtype=np.float64)))
+    opp_rates = _team_rates(np.nan_to_num(np.asarray(opp_lines, dtype=np.float64)))
+
+    sizes = [chunk_size] * (n_sims // chunk_size)
+    if n_sims % chunk_size:
+        sizes.append(n_sims % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(my_rates, opp_rates, n, s, distribution) for n, s in zip(sizes, seeds)]
+
+    if n_workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, tasks))
+    else:
+        chunks = [_simulate_chunk(t) for t in tasks]
+
+    cat_wins = sum(c[0] for c in chunks)
+    cat_ties = sum(c[1] for c in chunks)
+    return MatchupResult(
+        n_sims=n_sims,
+        category_win_prob=dict(zip(CATEGORIES, (cat_wins / n_sims).tolist())),
+        category_tie_prob=dict(zip(CATEGORIES, (cat_ties / n_sims).tolist())),
+        win_prob=sum(c[2] for c in chunks) / n_sims,
+        tie_prob=sum(c[3] for c in chunks) / n_sims,
+        expected_categories_won=sum(c[4] for c in chunks) / n_sims,
+    )
+
+
+def roster_lines(
+    pool: PlayerPool,
+    roster: Roster,
+    stats_source: str = "stats_curr_season",
+    games: Optional[Dict[int, float]] = None,
+) -> np.ndarray:
+    """
+    Expected period lines for *roster*: each player's per-game line scaled
+    by their game count in *games* (default 1). Players missing from the
+    pool or the stats window are skipped.
+    """
+    values, present = pool.stats_rows(stats_source, np.asarray(roster.player_ids))
+    lines = values[present]
+    if games:
+        ids = np.asarray(roster.player_ids)[present]
+        scale = np.array([games.get(int(pid), 1.0) for pid in ids])
+        lines = _scale_counting(lines, scale)
+    return lines
+
+
+def lines_from_dataframe(df: pd.DataFrame) -> np.ndarray:
+    """
+    Expected lines from a flattened stat DataFrame (e.g. the
+    ``daily_projections_*.json`` files). Missing columns are zero;
+    FG%/FT% are recomputed from makes and attempts.
+    """
+    lines = np.zeros((len(df), len(STAT_COLUMNS)))
+    for col, j in _COL.items():
+        if col in df.columns:
+            lines[:, j] = pd.to_numeric(df[col], errors="coerce").fillna(0.0).to_numpy()
+    return _scale_counting(lines, np.ones(len(df)))
+
+
+def _scale_counting(lines: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Scale every stat except GP and the percentages; recompute FG%/FT%."""
+    out = lines.copy()
+    for col in STAT_COLUMNS:
+        if col not in ("GP", "FG%", "FT%"):
+            out[:, _COL[col]] *= scale
+    for made, att, pct in (("FGM", "FGA", "FG%"), ("FTM", "FTA", "FT%")):
+        a = out[:, _COL[att]]
+        out[:, _COL[pct]] = np.divide(
+            out[:, _COL[made]], a, out=np.zeros(len(out)), where=a > 0
+        )
+    return out
+
+
+def simulate_matchup(
+    pool: PlayerPool,
+    my_roster: Roster,
+    opp_roster: Roster,
+    stats_source: str = "stats_curr_season",
+    games: Optional[Dict[int, float]] = None,
+    **kwargs,
+) -> MatchupResult:
+    """
+    Simulate *my_roster* vs *opp_roster* from *pool*'s stat lines.
+
+    :param games:  ``{player_id: games in the period}`` (default 1 each).
+    :param kwargs: Forwarded to :func:`simulate` (n_sims, seed, …).
+    """
+    return simulate(
+        roster_lines(pool, my_roster, stats_source, games),
+        roster_lines(pool, opp_roster, stats_source, games),
+        **kwargs,
+    )
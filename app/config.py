@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import yaml
 
@@ -20,6 +20,7 @@ import yaml
 ROOT_DIR: Path = Path(__file__).parent.parent
 DATA_DIR: Path = ROOT_DIR / "data"
 CONFIG_FILE: Path = ROOT_DIR / "config.yaml"
+CACHE_DIR: Path = DATA_DIR / "cache"
 
 DATA_DIR.mkdir(exist_ok=True)
 
@@ -45,6 +46,106 @@ class RosterConfig:
     my_team: List[int]
     matchup_team: List[int]
     drop_candidate: int
+    # Other league teams (name → player IDs), used for league-wide ranks
+    league_teams: Dict[str, List[int]] = field(default_factory=dict)
+
+
+@dataclass
+class LineupConfig:
+    # Starting slot → count (PG, SG, G, SF, PF, F, C, UTIL); the rest is bench
+    slots: Dict[str, int] = field(default_factory=lambda: {
+        "PG": 1, "SG": 1, "G": 1, "SF": 1, "PF": 1, "F": 1, "C": 2, "UTIL": 2,
+    })
+
+
+@dataclass
+class StreamingConfig:
+    # Adds allowed per fantasy week (the league's transaction limit)
+    max_adds: int = 4
+    # my_team players the weekly planner may drop (empty = drop_candidate only)
+    droppable: List[int] = field(default_factory=list)
+
+
+@dataclass
+class ApiConfig:
+    # Shared token bucket for every NBA API request
+    requests_per_second: float = 1.0
+    burst: int = 4
+    # Parallel requests (e.g. the stat windows in `pull`)
+    max_workers: int = 4
+    max_retries: int = 3
+    backoff_seconds: float = 2.0
+    timeout_seconds: float = 30.0
+    # Override the stats host, e.g. a local stub: "http://127.0.0.1:8765/stats/{endpoint}"
+    base_url: Optional[str] = None
+
+
+@dataclass
+class HttpCacheConfig:
+    # live | record | replay | off (see app/repository/response_cache.py)
+    mode: str = "live"
+    # Cache root; defaults to data/cache/http
+    directory: Optional[str] = None
+    # Minutes before a response is refetched. Previous-season stats and
+    # past-date scoreboards never expire regardless of these.
+    ttl_minutes: Dict[str, float] = field(default_factory=lambda: {
+        "league_stats": 60, "positions": 1440, "team_map": 360,
+        "scoreboard": 10, "schedule": 1440,
+    })
+
+
+@dataclass
+class ProjectionConfig:
+    # How OUT players' minutes reach teammates: "rotation" or "proportional"
+    redistribution: str = "rotation"
+    # Minutes a team plays per game (5 × 48); the rotation solver never
+    # projects a roster beyond it.
+    team_minutes: float = 240.0
+    # Per-player ceiling: a player never goes past max_minutes, nor past
+    # max_scale × their average (but is never cut below their average).
+    max_minutes: float = 38.0
+    max_scale: float = 1.75
+    # Share of freed minutes by rotation role (rank by minutes on the team:
+    # top 5 = starter, next 4 = rotation, rest = bench).
+    role_weights: Dict[str, float] = field(default_factory=lambda: {
+        "starter": 1.0, "rotation": 1.0, "bench": 0.3,
+    })
+    # Extra pull towards teammates who share the OUT player's position
+    # (0 = position-blind).
+    position_weight: float = 1.0
+    # Play probability for each injuries.json status (an entry's own
+    # "play_probability" wins). Unlisted statuses count as available.
+    status_probabilities: Dict[str, float] = field(default_factory=lambda: {
+        "OUT": 0.0, "DOUBTFUL": 0.25, "QUESTIONABLE": 0.5, "GTD": 0.5, "PROBABLE": 0.9,
+    })
+    # Teams with up to this many uncertain players have every availability
+    # scenario enumerated; beyond it scenarios are sampled.
+    max_exact_uncertain: int = 8
+    n_samples: int = 512
+
+
+@dataclass
+class StorageConfig:
+    # data.json / data_zscores.json are loaded from binary .npz checkpoints;
+    # also write the JSON files as exports for other tools.
+    export_json: bool = True
+    # "files" (checkpoints only) or "sqlite": also keep players, stats,
+    # scores and projections in an indexed database that commands needing
+    # only a few players (e.g. `roster`) query instead.
+    backend: str = "files"
+    # Database path; defaults to data/fantasy.db
+    database: Optional[str] = None
+
+
+@dataclass
+class HistoryConfig:
+    # Append every pull, ranking and projection to the snapshot history
+    # (unchanged players are not stored again).
+    enabled: bool = True
+    # History root; defaults to data/history
+    directory: Optional[str] = None
+    # Snapshots older than this many days are thinned to one per day.
+    keep_days: int = 30
 
 
 @dataclass
@@ -52,6 +153,13 @@ class AppConfig:
     season: SeasonConfig
     scoring: ScoringConfig
     roster: RosterConfig
+    lineup: LineupConfig = field(default_factory=LineupConfig)
+    streaming: StreamingConfig = field(default_factory=StreamingConfig)
+    api: ApiConfig = field(default_factory=ApiConfig)
+    http_cache: HttpCacheConfig = field(default_factory=HttpCacheConfig)
+    projection: ProjectionConfig = field(default_factory=ProjectionConfig)
+    storage: StorageConfig = field(default_factory=StorageConfig)
+    history: HistoryConfig = field(default_factory=HistoryConfig)
 
 
 # ---------------------------------------------------------------------------
@@ -81,9 +189,85 @@ def load_config(path: Path = CONFIG_FILE) -> AppConfig:
         my_team=[int(p) for p in roster_raw["my_team"]],
         matchup_team=[int(p) for p in roster_raw["matchup_team"]],
         drop_candidate=int(roster_raw["drop_candidate"]),
+        league_teams={
+            str(name): [int(p) for p in ids]
+            for name, ids in (roster_raw.get("league_teams") or {}).items()
+        },
+    )
+
+    lineup_raw = raw.get("lineup") or {}
+    lineup = (
+        LineupConfig(slots={k: int(v) for k, v in lineup_raw["slots"].items()})
+        if "slots" in lineup_raw
+        else LineupConfig()
+    )
+
+    streaming_raw = raw.get("streaming") or {}
+    streaming = StreamingConfig(
+        max_adds=int(streaming_raw.get("max_adds", StreamingConfig.max_adds)),
+        droppable=[int(p) for p in streaming_raw.get("droppable") or []],
+    )
+
+    api_raw = raw.get("api") or {}
+    defaults = ApiConfig()
+    api = ApiConfig(
+        requests_per_second=float(api_raw.get("requests_per_second", defaults.requests_per_second)),
+        burst=int(api_raw.get("burst", defaults.burst)),
+        max_workers=int(api_raw.get("max_workers", defaults.max_workers)),
+        max_retries=int(api_raw.get("max_retries", defaults.max_retries)),
+        backoff_seconds=float(api_raw.get("backoff_seconds", defaults.backoff_seconds)),
+        timeout_seconds=float(api_raw.get("timeout_seconds", defaults.timeout_seconds)),
+        base_url=api_raw.get("base_url") or None,
+    )
+
+    cache_raw = raw.get("http_cache") or {}
+    http_cache = HttpCacheConfig(
+        mode=str(cache_raw.get("mode", "live")),
+        directory=cache_raw.get("directory") or None,
+    )
+    http_cache.ttl_minutes.update(
+        {k: float(v) for k, v in (cache_raw.get("ttl_minutes") or {}).items()}
     )
 
-    return AppConfig(season=season, scoring=scoring, roster=roster)
+    projection_raw = raw.get("projection") or {}
+    defaults = ProjectionConfig()
+    projection = ProjectionConfig(
+        redistribution=str(projection_raw.get("redistribution", defaults.redistribution)),
+        team_minutes=float(projection_raw.get("team_minutes", defaults.team_minutes)),
+        max_minutes=float(projection_raw.get("max_minutes", defaults.max_minutes)),
+        max_scale=float(projection_raw.get("max_scale", defaults.max_scale)),
+        position_weight=float(projection_raw.get("position_weight", defaults.position_weight)),
+    )
+    projection.role_weights.update(
+        {k: float(v) for k, v in (projection_raw.get("role_weights") or {}).items()}
+    )
+    projection.status_probabilities.update(
+        {str(k).upper(): float(v) for k, v in (projection_raw.get("status_probabilities") or {}).items()}
+    )
+    projection.max_exact_uncertain = int(
+        projection_raw.get("max_exact_uncertain", defaults.max_exact_uncertain)
+    )
+    projection.n_samples = int(projection_raw.get("n_samples", defaults.n_samples))
+
+    storage_raw = raw.get("storage") or {}
+    storage = StorageConfig(
+        export_json=bool(storage_raw.get("export_json", StorageConfig.export_json)),
+        backend=str(storage_raw.get("backend", StorageConfig.backend)),
+        database=storage_raw.get("database") or None,
+    )
+
+    history_raw = raw.get("history") or {}
+    history = HistoryConfig(
+        enabled=bool(history_raw.get("enabled", HistoryConfig.enabled)),
+        directory=history_raw.get("directory") or None,
+        keep_days=int(history_raw.get("keep_days", HistoryConfig.keep_days)),
+    )
+
+    return AppConfig(
+        season=season, scoring=scoring, roster=roster, lineup=lineup,
+        streaming=streaming, api=api, http_cache=http_cache, projection=projection,
+        storage=storage, history=history,
+    )
 
 
 # ---------------------------------------------------------------------------
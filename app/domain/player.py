@@ -2,16 +2,31 @@
 app/domain/player.py
 ~~~~~~~~~~~~~~~~~~~~~
 Player and PlayerPool domain objects.
+
+PlayerPool is stored column-wise: each stats window is one contiguous
+float matrix (rows = players, columns = ``STAT_COLUMNS``) plus an index
+back to the pool's player arrays. ``Player`` objects are only built on
+demand via :meth:`PlayerPool.get`.
 """
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from app.domain.stats import PlayerStats
+from app.domain.stats import STAT_COLUMNS, PlayerStats
+
+
+# Names of the stat windows a Player / PlayerPool can carry.
+STATS_WINDOWS: Tuple[str, ...] = (
+    "stats_curr_season",
+    "stats_prev_season",
+    "stats_last_10",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -45,30 +60,279 @@ class Player:
         }.get(source)
 
 
+# ---------------------------------------------------------------------------
+# StatsWindow
+# ---------------------------------------------------------------------------
+
+@dataclass(eq=False)
+class StatsWindow:
+    """
+    One stats window of a PlayerPool in columnar form.
+
+    ``values[i]`` is the stat line (laid out as ``STAT_COLUMNS``) of the
+    player at pool row ``rows[i]``. Players without stats for the window
+    simply have no row.
+    """
+
+    rows: np.ndarray     # int64, indices into PlayerPool.player_ids
+    values: np.ndarray   # float64, shape (len(rows), len(STAT_COLUMNS))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def empty(cls) -> "StatsWindow":
+        return cls(
+            rows=np.empty(0, dtype=np.int64),
+            values=np.empty((0, len(STAT_COLUMNS)), dtype=np.float64),
+        )
+
+
+def _row_from_stat_dict(d: dict) -> List[float]:
+    """Lay out a data.json stat dict as a ``STAT_COLUMNS`` row (derives FG%/FT%)."""
+    fgm = float(d.get("FGM", 0))
+    fga = float(d.get("FGA", 0))
+    ftm = float(d.get("FTM", 0))
+    fta = float(d.get("FTA", 0))
+    return [
+        fgm, fga, ftm, fta,
+        float(d.get("3PTM", 0)),
+        float(d.get("PTS", 0)),
+        float(d.get("REB", 0)),
+        float(d.get("AST", 0)),
+        float(d.get("ST", 0)),
+        float(d.get("BLK", 0)),
+        float(d.get("TO", 0)),
+        float(int(d.get("GP", 0))),
+        float(d.get("MIN", 0)),
+        fgm / fga if fga > 0 else 0.0,
+        ftm / fta if fta > 0 else 0.0,
+    ]
+
+
+def _build_window(rows: List[int], values: List[List[float]]) -> StatsWindow:
+    if len(rows) == 0:
+        return StatsWindow.empty()
+    window = StatsWindow(
+        rows=np.asarray(rows, dtype=np.int64),
+        values=np.asarray(values, dtype=np.float64).reshape(len(rows), len(STAT_COLUMNS)),
+    )
+    # Windows are shared by every DataFrame view handed out by the pool.
+    window.values.flags.writeable = False
+    return window
+
+
 # ---------------------------------------------------------------------------
 # PlayerPool
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(eq=False)
 class PlayerPool:
     """
     The full set of players with their raw stat lines.
 
     Produced by the ingestion layer; consumed by the analytics layer.
     Does not contain any scores — scoring is a separate step.
+
+    Storage is columnar: ``player_ids`` / ``names`` / ``positions`` are
+    parallel per-player arrays and ``windows`` maps each stats-window
+    name to a :class:`StatsWindow`. Build pools with :meth:`from_players`
+    or :meth:`from_raw_dict` rather than the raw constructor.
     """
 
-    players: Dict[int, Player]   # player_id (int) → Player
+    player_ids: np.ndarray                                  # int64, one per player
+    names: np.ndarray                                       # object (str), one per player
+    positions: List[List[str]] = field(default_factory=list)
+    windows: Dict[str, StatsWindow] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.player_ids = np.asarray(self.player_ids, dtype=np.int64)
+        self.names = np.asarray(self.names, dtype=object)
+        if not self.positions:
+            self.positions = [[] for _ in range(len(self.player_ids))]
+        for source in STATS_WINDOWS:
+            self.windows.setdefault(source, StatsWindow.empty())
+
+        self._index: Dict[int, int] = {
+            int(pid): i for i, pid in enumerate(self.player_ids)
+        }
+        # pool row → window row (-1 when the player has no stats for it)
+        self._window_pos: Dict[str, np.ndarray] = {}
+        for source, window in self.windows.items():
+            pos = np.full(len(self.player_ids), -1, dtype=np.int64)
+            pos[window.rows] = np.arange(len(window.rows), dtype=np.int64)
+            self._window_pos[source] = pos
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> "PlayerPool":
+        """Build a columnar pool from Player objects (later duplicates win)."""
+        by_id: Dict[int, Player] = {p.player_id: p for p in players}
+
+        rows: Dict[str, List[int]] = {s: [] for s in STATS_WINDOWS}
+        values: Dict[str, List[List[float]]] = {s: [] for s in STATS_WINDOWS}
+        for i, player in enumerate(by_id.values()):
+            for source in STATS_WINDOWS:
+                stats = player.get_stats(source)
+                if stats is not None:
+                    rows[source].append(i)
+                    values[source].append(stats.to_row())
+
+        return cls(
+            player_ids=np.fromiter(by_id.keys(), dtype=np.int64, count=len(by_id)),
+            names=np.array([p.name for p in by_id.values()], dtype=object),
+            positions=[list(p.positions) for p in by_id.values()],
+            windows={s: _build_window(rows[s], values[s]) for s in STATS_WINDOWS},
+        )
+
+    def window_from_rows(self, stat_rows: Dict[int, List[float]]) -> StatsWindow:
+        """
+        Lay ``{player_id: STAT_COLUMNS row}`` out as a StatsWindow of this
+        pool (IDs not in the pool are ignored).
+        """
+        pairs = sorted(
+            (self._index[int(pid)], row)
+            for pid, row in stat_rows.items()
+            if int(pid) in self._index
+        )
+        return _build_window([r for r, _ in pairs], [v for _, v in pairs])
+
+    def take(self, rows: np.ndarray) -> "PlayerPool":
+        """
+        A new pool of the players at pool *rows* (in that order), with
+        every window re-indexed by array ops — no Player objects built.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        windows = {}
+        for source, window in self.windows.items():
+            pos = self._window_pos[source][rows]
+            present = pos >= 0
+            windows[source] = _build_window(
+                np.flatnonzero(present), window.values[pos[present]]
+            )
+        return PlayerPool(
+            player_ids=self.player_ids[rows],
+            names=self.names[rows],
+            positions=[list(self.positions[i]) for i in rows],
+            windows=windows,
+        )
+
+    def with_windows(self, windows: Dict[str, StatsWindow]) -> "PlayerPool":
+        """
+        A new pool with the given windows replaced; players and the other
+        windows are shared, not copied.
+        """
+        return PlayerPool(
+            player_ids=self.player_ids,
+            names=self.names,
+            positions=self.positions,
+            windows={**self.windows, **windows},
+        )
 
     # ------------------------------------------------------------------
     # Collection interface
     # ------------------------------------------------------------------
 
     def get(self, player_id: int) -> Optional[Player]:
-        return self.players.get(player_id)
+        """Materialise the Player for *player_id*, or ``None`` if absent."""
+        i = self._index.get(int(player_id))
+        if i is None:
+            return None
+        return self._player_at(i)
 
     def __len__(self) -> int:
-        return len(self.players)
+        return len(self.player_ids)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._index
+
+    def __iter__(self) -> Iterator[Player]:
+        for i in range(len(self.player_ids)):
+            yield self._player_at(i)
+
+    @property
+    def players(self) -> Dict[int, Player]:
+        """
+        ``{player_id: Player}`` for every player.
+
+        Materialises every Player — prefer :meth:`get` or the columnar
+        accessors on hot paths.
+        """
+        return {p.player_id: p for p in self}
+
+    def fingerprint(self) -> str:
+        """
+        Content hash of the pool (ids, names, positions and every window).
+
+        Computed once per instance — pools are treated as immutable.
+        """
+        cached = getattr(self, "_fingerprint", None)
+        if cached is not None:
+            return cached
+
+        h = hashlib.sha256()
+        h.update(self.player_ids.tobytes())
+        h.update("\x1f".join(map(str, self.names)).encode("utf-8"))
+        h.update(repr(self.positions).encode("utf-8"))
+        for source in sorted(self.windows):
+            window = self.windows[source]
+            h.update(source.encode("utf-8"))
+            h.update(np.ascontiguousarray(window.rows).tobytes())
+            h.update(np.ascontiguousarray(window.values).tobytes())
+        self._fingerprint: str = h.hexdigest()
+        return self._fingerprint
+
+    def row_of(self, player_id: int) -> Optional[int]:
+        """Pool row index of *player_id*, or ``None`` if absent."""
+        return self._index.get(int(player_id))
+
+    def window(self, stats_source: str) -> StatsWindow:
+        """The columnar :class:`StatsWindow` for *stats_source* (empty if unknown)."""
+        return self.windows.get(stats_source) or StatsWindow.empty()
+
+    def stats_rows(
+        self, stats_source: str, player_ids: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gather the *stats_source* rows for *player_ids* in one indexing op.
+
+        :returns: ``(values, present)`` — a ``(len(player_ids), len(STAT_COLUMNS))``
+                  matrix (NaN rows where absent) and a boolean presence mask.
+        """
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        rows = np.fromiter(
+            (self._index.get(int(pid), -1) for pid in player_ids),
+            dtype=np.int64, count=len(player_ids),
+        )
+        window = self.window(stats_source)
+        pos = self._window_pos.get(stats_source)
+        win_rows = np.full(len(player_ids), -1, dtype=np.int64)
+        if pos is not None:
+            win_rows[rows >= 0] = pos[rows[rows >= 0]]
+        present = win_rows >= 0
+
+        values = np.full((len(player_ids), len(STAT_COLUMNS)), np.nan)
+        values[present] = window.values[win_rows[present]]
+        return values, present
+
+    def _player_at(self, i: int) -> Player:
+        def _stats(source: str) -> Optional[PlayerStats]:
+            pos = self._window_pos.get(source)
+            if pos is None or pos[i] < 0:
+                return None
+            return PlayerStats.from_row(self.windows[source].values[pos[i]])
+
+        return Player(
+            player_id=int(self.player_ids[i]),
+            name=str(self.names[i]),
+            positions=list(self.positions[i]),
+            stats_curr_season=_stats("stats_curr_season"),
+            stats_prev_season=_stats("stats_prev_season"),
+            stats_last_10=_stats("stats_last_10"),
+        )
 
     # ------------------------------------------------------------------
     # Conversion to DataFrame (used by scoring strategies)
@@ -82,20 +346,63 @@ class PlayerPool:
         The ``"3PTM"`` column name is used (not ``"three_ptm"``) so it
         matches the STAT_MAP column references.
 
+        The stat columns are a view over the window's (read-only) matrix;
+        no per-player rows are built. Callers that need to write into the
+        frame must ``copy()`` it first.
+
         :param stats_source: Which window to flatten.
         :returns: DataFrame with columns:
                   player_id, name, FGM, FGA, FTM, FTA, 3PTM, PTS, REB,
                   AST, ST, BLK, TO, GP, MIN, FG%, FT%
         """
-        rows = []
-        for player in self.players.values():
-            stats = player.get_stats(stats_source)
-            if stats is None:
-                continue
-            row = {"player_id": player.player_id, "name": player.name}
-            row.update(stats.to_dict())
-            rows.append(row)
-        return pd.DataFrame(rows)
+        window = self.window(stats_source)
+        if len(window) == 0:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(window.values, columns=STAT_COLUMNS, copy=False)
+        df.insert(0, "player_id", self.player_ids[window.rows])
+        df.insert(1, "name", self.names[window.rows])
+        return df
+
+    # ------------------------------------------------------------------
+    # Serialisation (columnar checkpoint)
+    # ------------------------------------------------------------------
+
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Flat arrays for a binary checkpoint: ``player_ids``, ``names`` and
+        ``positions`` (comma-joined) as fixed-width arrays, plus
+        ``<window>.rows`` / ``<window>.values`` for every window.
+        """
+        columns: Dict[str, np.ndarray] = {
+            "player_ids": self.player_ids,
+            "names": self.names.astype(str),
+            "positions": np.array([",".join(p) for p in self.positions], dtype=str),
+        }
+        for source, window in self.windows.items():
+            columns[f"{source}.rows"] = window.rows
+            columns[f"{source}.values"] = window.values
+        return columns
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> "PlayerPool":
+        """
+        Rebuild a pool from :meth:`to_columns` arrays. Windows whose arrays
+        are absent (not loaded) come back empty; window matrices are used
+        as-is, so memory-mapped arrays stay mapped.
+        """
+        windows: Dict[str, StatsWindow] = {}
+        for source in STATS_WINDOWS:
+            rows = columns.get(f"{source}.rows")
+            values = columns.get(f"{source}.values")
+            if rows is not None and values is not None and len(rows):
+                windows[source] = StatsWindow(rows=rows, values=values)
+        return cls(
+            player_ids=columns["player_ids"],
+            names=columns["names"].astype(object),
+            positions=[p.split(",") if p else [] for p in columns["positions"].tolist()],
+            windows=windows,
+        )
 
     # ------------------------------------------------------------------
     # Serialisation (data.json format)
@@ -111,45 +418,53 @@ class PlayerPool:
                 "stats_curr_season": {...}, "stats_prev_season": {...},
                 "stats_last_10": {...}
               }, ... }
+
+        Stat dicts are laid straight into the window matrices; no
+        intermediate Player / PlayerStats objects are created.
         """
-        players: Dict[int, Player] = {}
-        for pid_str, info in raw.items():
-            pid = int(pid_str)
-
-            def _load(key: str) -> Optional[PlayerStats]:
-                d = info.get(key)
-                return PlayerStats.from_dict(d) if d else None
-
-            players[pid] = Player(
-                player_id=pid,
-                name=info.get("name", "Unknown"),
-                positions=info.get("positions", []),
-                stats_curr_season=_load("stats_curr_season"),
-                stats_prev_season=_load("stats_prev_season"),
-                stats_last_10=_load("stats_last_10"),
-            )
-        return cls(players=players)
+        player_ids: List[int] = []
+        names: List[str] = []
+        positions: List[List[str]] = []
+        rows: Dict[str, List[int]] = {s: [] for s in STATS_WINDOWS}
+        values: Dict[str, List[List[float]]] = {s: [] for s in STATS_WINDOWS}
+
+        for i, (pid_str, info) in enumerate(raw.items()):
+            player_ids.append(int(pid_str))
+            names.append(info.get("name", "Unknown"))
+            positions.append(list(info.get("positions", [])))
+            for source in STATS_WINDOWS:
+                d = info.get(source)
+                if d:
+                    rows[source].append(i)
+                    values[source].append(_row_from_stat_dict(d))
+
+        return cls(
+            player_ids=np.asarray(player_ids, dtype=np.int64),
+            names=np.array(names, dtype=object),
+            positions=positions,
+            windows={s: _build_window(rows[s], values[s]) for s in STATS_WINDOWS},
+        )
 
     def to_raw_dict(self) -> dict:
         """Serialise to the ``data.json`` format."""
+        stat_dicts: Dict[str, Dict[int, dict]] = {}
+        for source in STATS_WINDOWS:
+            window = self.window(source)
+            stat_dicts[source] = {
+                int(r): PlayerStats.from_row(v).to_dict()
+                for r, v in zip(window.rows, window.values)
+            }
+
         result: dict = {}
-        for pid, player in self.players.items():
+        for i, pid in enumerate(self.player_ids):
+            pid = int(pid)
             result[str(pid)] = {
                 "player_id": pid,
-                "name": player.name,
-                "positions": player.positions,
-                "stats_curr_season": (
-                    player.stats_curr_season.to_dict()
-                    if player.stats_curr_season else {}
-                ),
-                "stats_prev_season": (
-                    player.stats_prev_season.to_dict()
-                    if player.stats_prev_season else {}
-                ),
-                "stats_last_10": (
-                    player.stats_last_10.to_dict()
-                    if player.stats_last_10 else {}
-                ),
+                "name": str(self.names[i]),
+                "positions": list(self.positions[i]),
+                "stats_curr_season": stat_dicts["stats_curr_season"].get(i, {}),
+                "stats_prev_season": stat_dicts["stats_prev_season"].get(i, {}),
+                "stats_last_10": stat_dicts["stats_last_10"].get(i, {}),
                 "combined_stats": {},
             }
         return result
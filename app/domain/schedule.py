@@ -0,0 +1,222 @@
+"""
+app/domain/schedule.py
+~~~~~~~~~~~~~~~~~~~~~~~
+SeasonSchedule — every regular-season game, indexed for in-memory lookups.
+
+Games are stored as three parallel arrays sorted by date (``datetime64[D]``
+dates, home and visitor team IDs). On construction they are indexed both
+ways — date → teams playing and team → its game dates — so "who plays on
+Thursday", "how many games does this team have left" or "which nights are
+back-to-backs" never touch the network.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, FrozenSet, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+
+def _day(d: date) -> np.datetime64:
+    return np.datetime64(d, "D")
+
+
+def _monday(d: date) -> date:
+    return d - timedelta(days=d.weekday())
+
+
+@dataclass(eq=False)
+class SeasonSchedule:
+    """
+    One season's games.
+
+    :param season:     e.g. ``"2025-26"``.
+    :param game_dates: ``datetime64[D]``, one per game.
+    :param home:       Home team ID per game.
+    :param away:       Visiting team ID per game.
+    """
+
+    season: str
+    game_dates: np.ndarray
+    home: np.ndarray
+    away: np.ndarray
+
+    def __post_init__(self) -> None:
+        order = np.argsort(np.asarray(self.game_dates, dtype="datetime64[D]"), kind="stable")
+        self.game_dates = np.asarray(self.game_dates, dtype="datetime64[D]")[order]
+        self.home = np.asarray(self.home, dtype=np.int64)[order]
+        self.away = np.asarray(self.away, dtype=np.int64)[order]
+
+        # date → teams playing
+        self._by_date: Dict[date, FrozenSet[int]] = {}
+        days, first = np.unique(self.game_dates, return_index=True)
+        bounds = list(first) + [len(self.game_dates)]
+        for i, day in enumerate(days):
+            lo, hi = bounds[i], bounds[i + 1]
+            self._by_date[day.item()] = frozenset(
+                np.concatenate([self.home[lo:hi], self.away[lo:hi]]).tolist()
+            )
+
+        # team → sorted game dates
+        teams = np.concatenate([self.home, self.away])
+        dates = np.concatenate([self.game_dates, self.game_dates])
+        order = np.lexsort((dates, teams))
+        teams, dates = teams[order], dates[order]
+        split = np.flatnonzero(np.diff(teams)) + 1
+        self._team_dates: Dict[int, np.ndarray] = {
+            int(group[0]): d
+            for group, d in zip(np.split(teams, split), np.split(dates, split))
+            if len(group)
+        }
+
+    # ------------------------------------------------------------------
+    # Construction / serialisation
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_frame(cls, season: str, df: pd.DataFrame) -> "SeasonSchedule":
+        """From a ``GAME_DATE`` / ``HOME_TEAM_ID`` / ``VISITOR_TEAM_ID`` frame."""
+        if df.empty:
+            return cls.empty(season)
+        return cls(
+            season=season,
+            game_dates=pd.to_datetime(df["GAME_DATE"]).values.astype("datetime64[D]"),
+            home=df["HOME_TEAM_ID"].to_numpy(),
+            away=df["VISITOR_TEAM_ID"].to_numpy(),
+        )
+
+    @classmethod
+    def empty(cls, season: str) -> "SeasonSchedule":
+        return cls(
+            season=season,
+            game_dates=np.empty(0, dtype="datetime64[D]"),
+            home=np.empty(0, dtype=np.int64),
+            away=np.empty(0, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "SeasonSchedule":
+        games = d.get("games", [])
+        return cls(
+            season=d["season"],
+            game_dates=np.array([g[0] for g in games], dtype="datetime64[D]"),
+            home=np.array([g[1] for g in games], dtype=np.int64),
+            away=np.array([g[2] for g in games], dtype=np.int64),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "season": self.season,
+            "games": [
+                [str(d), int(h), int(a)]
+                for d, h, a in zip(self.game_dates, self.home, self.away)
+            ],
+        }
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.game_dates)
+
+    @property
+    def first_day(self) -> Optional[date]:
+        return self.game_dates[0].item() if len(self) else None
+
+    @property
+    def last_day(self) -> Optional[date]:
+        return self.game_dates[-1].item() if len(self) else None
+
+    @property
+    def teams(self) -> List[int]:
+        return sorted(self._team_dates)
+
+    def covers(self, day: date) -> bool:
+        """Whether *day* falls within the season (game day or not)."""
+        return bool(len(self)) and self.first_day <= day <= self.last_day
+
+    def teams_on(self, day: date) -> Set[int]:
+        """Team IDs with a game on *day* (empty on off days)."""
+        return set(self._by_date.get(day, frozenset()))
+
+    def days(self, start: date, end: date) -> Dict[date, Set[int]]:
+        """``{day: teams playing}`` for every day from *start* to *end* inclusive."""
+        return {
+            start + timedelta(days=i): self.teams_on(start + timedelta(days=i))
+            for i in range((end - start).days + 1)
+        }
+
+    def team_dates(self, team_id: int) -> List[date]:
+        """*team_id*'s game dates, in order."""
+        return [d.item() for d in self._team_dates.get(int(team_id), [])]
+
+    def games_between(self, team_id: int, start: date, end: date) -> int:
+        """Games *team_id* plays from *start* to *end* inclusive."""
+        dates = self._team_dates.get(int(team_id))
+        if dates is None:
+            return 0
+        return int(
+            np.searchsorted(dates, _day(end), side="right")
+            - np.searchsorted(dates, _day(start), side="left")
+        )
+
+    def games_remaining(self, team_id: int, from_day: date) -> int:
+        """Games *team_id* plays on or after *from_day*."""
+        dates = self._team_dates.get(int(team_id))
+        if dates is None:
+            return 0
+        return int(len(dates) - np.searchsorted(dates, _day(from_day), side="left"))
+
+    def back_to_backs(
+        self, team_id: int, start: Optional[date] = None, end: Optional[date] = None
+    ) -> List[date]:
+        """Second nights of *team_id*'s back-to-backs within [*start*, *end*]."""
+        dates = self._team_dates.get(int(team_id))
+        if dates is None or len(dates) < 2:
+            return []
+        second = dates[1:][np.diff(dates) == np.timedelta64(1, "D")]
+        if start is not None:
+            second = second[second >= _day(start)]
+        if end is not None:
+            second = second[second <= _day(end)]
+        return [d.item() for d in second]
+
+    def game_counts(self, start: date, end: date) -> Dict[int, int]:
+        """``{team_id: games from start to end inclusive}`` for every team."""
+        in_range = (self.game_dates >= _day(start)) & (self.game_dates <= _day(end))
+        teams, counts = np.unique(
+            np.concatenate([self.home[in_range], self.away[in_range]]), return_counts=True
+        )
+        counts_by_team = {t: 0 for t in self._team_dates}
+        counts_by_team.update({int(t): int(c) for t, c in zip(teams, counts)})
+        return counts_by_team
+
+    def week_counts(self, start: Optional[date] = None, end: Optional[date] = None) -> pd.DataFrame:
+        """
+        Games per team per fantasy week (Monday–Sunday).
+
+        :returns: DataFrame indexed by team ID, one column per week's
+                  Monday, covering *start* … *end* (default: whole season).
+        """
+        if not len(self):
+            return pd.DataFrame()
+        first = _monday(start or self.first_day)
+        last = end or self.last_day
+        n_weeks = (last - first).days // 7 + 1
+
+        in_range = (self.game_dates >= _day(start or first)) & (self.game_dates <= _day(last))
+        week = ((self.game_dates[in_range] - _day(first)).astype(np.int64) // 7)
+        teams = np.array(self.teams, dtype=np.int64)
+        counts = np.zeros((len(teams), n_weeks), dtype=np.int64)
+        for side in (self.home[in_range], self.away[in_range]):
+            np.add.at(counts, (np.searchsorted(teams, side), week), 1)
+
+        return pd.DataFrame(
+            counts,
+            index=pd.Index(teams, name="team_id"),
+            columns=[first + timedelta(weeks=w) for w in range(n_weeks)],
+        )
@@ -11,12 +11,14 @@ only data and the structural operations needed to navigate that data.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
+import numpy as np
 import pandas as pd
 
-from app.domain.player import Player
+from app.domain.player import Player, PlayerPool
 from app.domain.roster import Roster
+from app.domain.stats import STAT_COLUMNS
 
 
 # ---------------------------------------------------------------------------
@@ -95,26 +97,98 @@ class RosterSnapshot:
 # Full scored player pool
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(eq=False)
 class ScoredPool:
     """
     The full set of players after a ScoringStrategy has been applied.
 
     Produced by analytics/scoring; consumed by analytics/evaluation and
     the pipeline layer.
+
+    Backed by a score matrix: row *i* of ``scores`` holds the
+    ``score_columns`` values of ``player_ids[i]`` and ``total_value[i]``
+    its total. ``ScoredPlayer`` objects are only built on demand.
+    ``pool`` (optional) is the PlayerPool that was scored; it supplies the
+    full Player objects and raw stat columns.
     """
 
-    scored_players: Dict[int, ScoredPlayer] = field(default_factory=dict)
+    player_ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    names: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))
+    score_columns: List[str] = field(default_factory=list)
+    scores: np.ndarray = field(default_factory=lambda: np.empty((0, 0)))
+    total_value: np.ndarray = field(default_factory=lambda: np.empty(0))
+    pool: Optional[PlayerPool] = None
+
+    def __post_init__(self) -> None:
+        self.player_ids = np.asarray(self.player_ids, dtype=np.int64)
+        self.names = np.asarray(self.names, dtype=object)
+        self.scores = np.asarray(self.scores, dtype=np.float64).reshape(
+            len(self.player_ids), len(self.score_columns)
+        )
+        self.total_value = np.asarray(self.total_value, dtype=np.float64)
+        self._index: Dict[int, int] = {
+            int(pid): i for i, pid in enumerate(self.player_ids)
+        }
 
     # ------------------------------------------------------------------
     # Collection interface
     # ------------------------------------------------------------------
 
     def get(self, player_id: int) -> Optional[ScoredPlayer]:
-        return self.scored_players.get(player_id)
+        i = self._index.get(int(player_id))
+        if i is None:
+            return None
+        return self.scored_player_at(i)
 
     def __len__(self) -> int:
-        return len(self.scored_players)
+        return len(self.player_ids)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._index
+
+    @property
+    def scored_players(self) -> Dict[int, ScoredPlayer]:
+        """
+        ``{player_id: ScoredPlayer}`` for every player.
+
+        Materialises every ScoredPlayer — prefer :meth:`get` or the
+        matrix attributes on hot paths.
+        """
+        return {
+            int(pid): self.scored_player_at(i)
+            for i, pid in enumerate(self.player_ids)
+        }
+
+    def row_of(self, player_id: int) -> Optional[int]:
+        """Matrix row of *player_id*, or ``None`` if absent."""
+        return self._index.get(int(player_id))
+
+    def rows_of(self, player_ids: Iterable[int]) -> np.ndarray:
+        """Matrix rows of the *player_ids* that are present, in input order."""
+        return np.asarray(
+            [self._index[int(p)] for p in player_ids if int(p) in self._index],
+            dtype=np.int64,
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        """The score column *name* as a 1-D view (zeros if absent)."""
+        if name not in self.score_columns:
+            return np.zeros(len(self.player_ids))
+        return self.scores[:, self.score_columns.index(name)]
+
+    def scored_player_at(self, i: int) -> ScoredPlayer:
+        """Materialise the ScoredPlayer at matrix row *i*."""
+        pid = int(self.player_ids[i])
+        player = self.pool.get(pid) if self.pool is not None else None
+        if player is None:
+            player = Player(player_id=pid, name=str(self.names[i]))
+        return ScoredPlayer(
+            player=player,
+            category_scores=CategoryScores(
+                scores=dict(zip(self.score_columns, self.scores[i].tolist())),
+                total_value=float(self.total_value[i]),
+            ),
+        )
 
     # ------------------------------------------------------------------
     # Roster operations
@@ -123,9 +197,9 @@ class ScoredPool:
     def get_roster_snapshot(self, roster: Roster) -> RosterSnapshot:
         """Slice this pool to the players on *roster*."""
         scored = {
-            pid: self.scored_players[pid]
+            int(pid): self.scored_player_at(self._index[int(pid)])
             for pid in roster.player_ids
-            if pid in self.scored_players
+            if int(pid) in self._index
         }
         return RosterSnapshot(roster=roster, scored_players=scored)
 
@@ -138,28 +212,70 @@ class ScoredPool:
         Flatten to a DataFrame suitable for saving or Streamlit display.
 
         Columns: player_id, name, Total_Value, <score columns>,
-        and raw stat columns when the ScoredPlayer's player object has
+        and raw stat columns when the pool's players have
         ``stats_curr_season`` populated (i.e. when built from a full
         PlayerPool rather than from a checkpoint file).
+
+        Built directly from the score matrix — no per-player rows.
         """
-        rows: List[dict] = []
-        for pid, sp in self.scored_players.items():
-            row: dict = {
-                "player_id": pid,
-                "name": sp.player.name,
-                "Total_Value": sp.category_scores.total_value,
-                **sp.category_scores.scores,
-            }
-            # Include raw stats when available (pool built from data.json)
-            if sp.player.stats_curr_season is not None:
-                row.update(sp.player.stats_curr_season.to_dict())
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
-        return (
-            df.sort_values("Total_Value", ascending=False)
-            if not df.empty
-            else df
+        if len(self.player_ids) == 0:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(self.scores, columns=self.score_columns)
+        df.insert(0, "player_id", self.player_ids)
+        df.insert(1, "name", self.names)
+        df.insert(2, "Total_Value", self.total_value)
+
+        # Include raw stats when available (pool built from data.json)
+        if self.pool is not None:
+            values, present = self.pool.stats_rows("stats_curr_season", self.player_ids)
+            if present.any():
+                df = pd.concat(
+                    [df, pd.DataFrame(values, columns=STAT_COLUMNS)], axis=1
+                )
+
+        return df.sort_values("Total_Value", ascending=False, kind="stable")
+
+    # ------------------------------------------------------------------
+    # Columnar checkpoint (data_zscores.npz, score cache)
+    # ------------------------------------------------------------------
+
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """Flat arrays for a binary checkpoint (names as fixed-width strings)."""
+        return {
+            "player_ids": self.player_ids,
+            "names": self.names.astype(str),
+            "score_columns": np.asarray(self.score_columns, dtype=str),
+            "scores": self.scores,
+            "total_value": self.total_value,
+        }
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, np.ndarray],
+        score_columns: Optional[List[str]] = None,
+        pool: Optional[PlayerPool] = None,
+    ) -> "ScoredPool":
+        """
+        Rebuild from :meth:`to_columns` arrays.
+
+        :param score_columns: Keep only these score columns (in this order);
+                              default all.
+        :param pool:          PlayerPool to attach (see class docstring).
+        """
+        stored = columns["score_columns"].tolist()
+        scores = columns["scores"]
+        if score_columns is not None:
+            scores = scores[:, [stored.index(c) for c in score_columns]]
+            stored = list(score_columns)
+        return cls(
+            player_ids=columns["player_ids"],
+            names=columns["names"].astype(object),
+            score_columns=stored,
+            scores=scores,
+            total_value=columns["total_value"],
+            pool=pool,
         )
 
     # ------------------------------------------------------------------
@@ -175,28 +291,35 @@ class ScoredPool:
         since the checkpoint file stores only scores. This is sufficient
         for evaluation and roster operations.
         """
-        scored_players: Dict[int, ScoredPlayer] = {}
-
-        for pid_str, data in raw.items():
-            pid = int(pid_str)
-
-            scores = {
-                k: float(v)
-                for k, v in data.items()
-                if k not in ("name", "Total_Value") and isinstance(v, (int, float))
-            }
-            total_value = float(data.get("Total_Value", 0.0))
-
-            player = Player(
-                player_id=pid,
-                name=str(data.get("name", "Unknown")),
-            )
-            scored_players[pid] = ScoredPlayer(
-                player=player,
-                category_scores=CategoryScores(
-                    scores=scores,
-                    total_value=total_value,
-                ),
-            )
-
-        return cls(scored_players=scored_players)
+        score_columns: List[str] = []
+        for data in raw.values():
+            for k, v in data.items():
+                if (
+                    k not in ("name", "Total_Value")
+                    and isinstance(v, (int, float))
+                    and k not in score_columns
+                ):
+                    score_columns.append(k)
+
+        n = len(raw)
+        player_ids = np.empty(n, dtype=np.int64)
+        names = np.empty(n, dtype=object)
+        scores = np.zeros((n, len(score_columns)))
+        total_value = np.zeros(n)
+
+        for i, (pid_str, data) in enumerate(raw.items()):
+            player_ids[i] = int(pid_str)
+            names[i] = str(data.get("name", "Unknown"))
+            total_value[i] = float(data.get("Total_Value", 0.0))
+            for j, col in enumerate(score_columns):
+                v = data.get(col)
+                if isinstance(v, (int, float)):
+                    scores[i, j] = float(v)
+
+        return cls(
+            player_ids=player_ids,
+            names=names,
+            score_columns=score_columns,
+            scores=scores,
+            total_value=total_value,
+        )
@@ -9,7 +9,7 @@ since they are properties of the stat domain, not of any service.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -96,6 +96,29 @@ class PlayerStats:
             "FT%": self.ft_pct,
         }
 
+    @classmethod
+    def from_row(cls, row: Sequence[float]) -> "PlayerStats":
+        """Deserialise from a row laid out as :data:`STAT_COLUMNS`."""
+        return cls(
+            FGM=float(row[0]),
+            FGA=float(row[1]),
+            FTM=float(row[2]),
+            FTA=float(row[3]),
+            three_ptm=float(row[4]),
+            PTS=float(row[5]),
+            REB=float(row[6]),
+            AST=float(row[7]),
+            ST=float(row[8]),
+            BLK=float(row[9]),
+            TO=float(row[10]),
+            GP=int(row[11]),
+            MIN=float(row[12]),
+        )
+
+    def to_row(self) -> List[float]:
+        """Serialise to a row laid out as :data:`STAT_COLUMNS`."""
+        return list(self.to_dict().values())
+
 
 # ---------------------------------------------------------------------------
 # Stat-schema constants
@@ -123,6 +146,15 @@ SCALABLE_STAT_COLS: List[str] = [
     "ST", "BLK", "TO",
 ]
 
+# Column layout of one row of a columnar stats window (PlayerPool storage).
+# Same order as PlayerStats.to_dict(); FG%/FT% are derived and stored alongside.
+STAT_COLUMNS: List[str] = [
+    "FGM", "FGA", "FTM", "FTA",
+    "3PTM", "PTS", "REB", "AST",
+    "ST", "BLK", "TO", "GP",
+    "MIN", "FG%", "FT%",
+]
+
 # Raw stat columns present in a flattened stat DataFrame
 RAW_STAT_COLS: List[str] = [
     "FGM", "FGA", "FTM", "FTA",
@@ -0,0 +1,219 @@
+"""
+app/ingestion/availability.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Expected minute factors under uncertain player availability.
+
+Each player on the slate has a probability of playing (1 unless
+``data/injuries.json`` says otherwise; 0 = OUT). A team's *scenario* is
+one combination of its uncertain players sitting or playing; in each
+scenario the :class:`MinuteRedistributor` hands the sitting players'
+minutes to the rest. A player's stat line scales linearly with their
+minute factor (``projected / average``, 0 when sitting), so the expected
+line and its variance over scenarios follow from the factor's first two
+moments:
+
+    E[line] = line × E[f]        Var[line] = line² × Var[f]
+
+Scenarios are enumerated exactly (``2^k`` for ``k`` uncertain players,
+weighted by their probabilities) up to ``max_exact`` uncertain players
+per team and sampled beyond it. Every scenario of every team is stacked
+into one slate, so the engine runs once per call rather than once per
+scenario. Results are cached per team, keyed by the team's stat rows,
+probabilities and the engine configuration — reprojecting a slate where
+only one team's injury news changed only recomputes that team.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.ingestion.minute_redistribution import MinuteRedistributor, Slate
+
+_EPS = 1e-12
+
+
+class AvailabilityModel:
+    """
+    Expected minute factors over each team's availability scenarios.
+
+    :param redistributor: Engine that redistributes minutes per scenario.
+    :param max_exact:     Max uncertain players per team to enumerate.
+    :param n_samples:     Scenarios drawn for larger teams.
+    :param seed:          Seed for sampled teams (fixed → reproducible).
+    :param max_cached:    Team results kept in the in-memory LRU cache.
+    """
+
+    def __init__(
+        self,
+        redistributor: MinuteRedistributor,
+        max_exact: int = 8,
+        n_samples: int = 512,
+        seed: int = 0,
+        max_cached: int = 1024,
+    ) -> None:
+        self.redistributor = redistributor
+        self.max_exact = max_exact
+        self.n_samples = n_samples
+        self.seed = seed
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[str, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def factor_moments(
+        self, slate: Slate, play_prob: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean and variance of each row's minute factor.
+
+        :param slate:     The slate (``slate.is_out`` is ignored — availability
+                          comes from *play_prob*).
+        :param play_prob: ``(n,)`` probability each row plays.
+        :returns:         ``(mean, var)``, each ``(n,)``.
+        """
+        mean = np.zeros(len(play_prob))
+        var = np.zeros(len(play_prob))
+
+        prefix = hashlib.sha256(
+            f"{self.redistributor.cache_key()}:{self.max_exact}:{self.n_samples}:{self.seed}".encode("utf-8")
+        )
+        order = np.argsort(slate.team_codes, kind="stable")
+        bounds = np.searchsorted(slate.team_codes[order], np.arange(slate.n_teams + 1))
+        pending: List[Tuple[str, np.ndarray]] = []
+        for t in range(slate.n_teams):
+            rows = order[bounds[t]:bounds[t + 1]]
+            key = self._key(prefix, slate, rows, play_prob)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                mean[rows], var[rows] = cached
+            else:
+                self.misses += 1
+                pending.append((key, rows))
+
+        if pending:
+            self._solve(slate, play_prob, pending, mean, var)
+        return mean, var
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(prefix, slate: Slate, rows: np.ndarray, play_prob: np.ndarray) -> str:
+        """Content key of one team: *prefix* (engine settings) + its rows."""
+        h = prefix.copy()
+        for arr in (slate.minutes[rows], slate.games[rows], slate.positions[rows], play_prob[rows]):
+            h.update(np.ascontiguousarray(arr, dtype=np.float64).tobytes())
+        return h.hexdigest()
+
+    def _scenarios(self, p: np.ndarray, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ``(plays, weight)`` for one team: ``plays`` is ``(s, n)`` bool,
+        ``weight`` the ``(s,)`` scenario probabilities (summing to 1).
+        """
+        uncertain = np.flatnonzero((p > _EPS) & (p < 1 - _EPS))
+        base = p >= 1 - _EPS
+        k = len(uncertain)
+
+        if k <= self.max_exact:
+            bits = ((np.arange(2 ** k)[:, None] >> np.arange(k)) & 1).astype(bool)
+            pu = p[uncertain]
+            weight = np.where(bits, pu, 1 - pu).prod(axis=1)
+        else:
+            bits = rng.random((self.n_samples, k)) < p[uncertain]
+            weight = np.full(self.n_samples, 1.0 / self.n_samples)
+
+        plays = np.repeat(base[None, :], len(bits), axis=0)
+        plays[:, uncertain] = bits
+        return plays, weight
+
+    def _solve(
+        self,
+        slate: Slate,
+        play_prob: np.ndarray,
+        pending: List[Tuple[str, np.ndarray]],
+        mean: np.ndarray,
+        var: np.ndarray,
+    ) -> None:
+        """Stack every scenario of every pending team into one slate and project it."""
+        rows_parts, plays_parts, weight_parts, group_parts = [], [], [], []
+
+        # Teams with no uncertain player have one scenario: stack them in one go.
+        certain = play_prob <= _EPS
+        certain |= play_prob >= 1 - _EPS
+        fixed = [rows for _, rows in pending if certain[rows].all()]
+        if fixed:
+            rows = np.concatenate(fixed)
+            rows_parts.append(rows)
+            plays_parts.append(play_prob[rows] >= 1 - _EPS)
+            weight_parts.append(np.ones(len(rows)))
+            group_parts.append(np.repeat(np.arange(len(fixed)), [len(r) for r in fixed]))
+        n_groups = len(fixed)
+
+        for key, rows in pending:
+            if certain[rows].all():
+                continue
+            # Seeded per team, so a sampled team's result never depends on
+            # which other teams happened to miss the cache alongside it.
+            rng = np.random.default_rng([self.seed, int(key[:16], 16)])
+            plays, weight = self._scenarios(play_prob[rows], rng)
+            s = len(weight)
+            rows_parts.append(np.tile(rows, s))
+            plays_parts.append(plays.ravel())
+            weight_parts.append(np.repeat(weight, len(rows)))
+            group_parts.append(np.repeat(np.arange(n_groups, n_groups + s), len(rows)))
+            n_groups += s
+
+        rows = np.concatenate(rows_parts)
+        plays = np.concatenate(plays_parts)
+        weight = np.concatenate(weight_parts)
+        stacked = Slate(
+            minutes=slate.minutes[rows],
+            games=slate.games[rows],
+            team_codes=np.concatenate(group_parts),
+            is_out=~plays,
+            positions=slate.positions[rows],
+        )
+        projected = self.redistributor.project(stacked)
+        factor = np.divide(
+            projected, stacked.minutes,
+            out=plays.astype(float), where=stacked.minutes > 0,
+        )
+
+        n = len(play_prob)
+        m1 = np.bincount(rows, weights=weight * factor, minlength=n)
+        m2 = np.bincount(rows, weights=weight * factor ** 2, minlength=n)
+        mean_all, var_all = m1, np.maximum(m2 - m1 ** 2, 0.0)
+
+        for key, team_rows in pending:
+            result = (mean_all[team_rows], var_all[team_rows])
+            mean[team_rows], var[team_rows] = result
+            self._cache[key] = result
+            if len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+
+
+def cached_model(redistributor: MinuteRedistributor, **kwargs) -> AvailabilityModel:
+    """
+    Process-wide :class:`AvailabilityModel` per engine configuration, so
+    repeated projections (e.g. every day of a week) share one cache.
+    """
+    key = (redistributor.cache_key(), tuple(sorted(kwargs.items())))
+    model = _models.get(key)
+    if model is None:
+        model = _models[key] = AvailabilityModel(redistributor, **kwargs)
+    return model
+
+
+_models: Dict[tuple, AvailabilityModel] = {}
+
+
+def clear_models() -> None:
+    """Drop every cached model (and its per-team results)."""
+    _models.clear()
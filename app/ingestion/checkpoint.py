@@ -0,0 +1,264 @@
+"""
+app/ingestion/checkpoint.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Binary checkpoints for the PlayerPool (``data.json``) and the scored pool
+(``data_zscores.json``).
+
+Each is saved next to its JSON file as an uncompressed ``.npz``
+(``data.npz``, ``data_zscores.npz``) holding the pool's columns plus a
+schema header, and loaded memory-mapped (``file_repository.load_columnar``)
+— no text is parsed and no per-player objects are built, and callers can
+load just the columns they need. The JSON files are still written as
+exports unless ``storage.export_json`` is off; they are only read when no
+current checkpoint exists (e.g. data.json edited by hand, or written by
+an older version).
+
+With ``storage.backend: sqlite`` the same data is also kept in an
+indexed SQLite database (:func:`database`); :func:`load_scored_players`,
+:func:`load_top_scored`, :func:`load_player` and
+:func:`load_player_projections` read a few rows from it instead of the
+whole checkpoint or export whenever it is at least as new.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import DATA_DIR, config
+from app.domain.player import STATS_WINDOWS, Player, PlayerPool, StatsWindow
+from app.domain.scoring import ScoredPool
+from app.domain.stats import RAW_STAT_COLS, STAT_COLUMNS
+from app.repository import file_repository as file_repo
+from app.repository.sqlite_repository import SqliteRepository
+
+# Bump when the column layout changes; older checkpoints are then ignored
+# in favour of the JSON export until rewritten.
+CHECKPOINT_VERSION = 1
+
+_database: Optional[SqliteRepository] = None
+
+
+def checkpoint_path(path: Path) -> Path:
+    """The ``.npz`` checkpoint stored alongside JSON file *path*."""
+    return path.with_suffix(".npz")
+
+
+def exists(path: Path) -> bool:
+    """Whether *path* (a JSON file name) has a checkpoint or JSON copy on disk."""
+    return checkpoint_path(path).exists() or path.exists()
+
+
+def _schema(kind: str) -> dict:
+    return {"kind": kind, "version": CHECKPOINT_VERSION, "stat_columns": STAT_COLUMNS}
+
+
+def _load(path: Path, kind: str, names: Optional[Iterable[str]]) -> Optional[dict]:
+    """
+    Columns of *path*'s checkpoint, or ``None`` when there is no current,
+    compatible one (the caller then falls back to the JSON file).
+    """
+    npz = checkpoint_path(path)
+    if not file_repo.is_newer(npz, path):
+        return None
+    try:
+        schema, columns = file_repo.load_columnar(npz, names)
+    except (OSError, ValueError) as e:
+        print(f"  [WARN] Ignoring unreadable checkpoint {npz.name}: {e}")
+        return None
+    if schema != _schema(kind):
+        print(f"  [WARN] {npz.name} was written with a different schema; reading {path.name}.")
+        return None
+    return columns
+
+
+# ---------------------------------------------------------------------------
+# PlayerPool (data.json)
+# ---------------------------------------------------------------------------
+
+def save_pool(pool: PlayerPool, path: Path) -> None:
+    """Write *pool*'s checkpoint (and the JSON export) for *path*."""
+    if config.storage.export_json:
+        file_repo.save_json(path, pool.to_raw_dict())
+    file_repo.save_npz(checkpoint_path(path), pool.to_columns(), schema=_schema("player_pool"))
+    print(f"  Saved → {checkpoint_path(path)}")
+
+
+def load_pool(path: Path, windows: Optional[Iterable[str]] = None) -> PlayerPool:
+    """
+    Load the PlayerPool for *path*.
+
+    :param windows: Stats windows to load (default all); the rest come back
+                    empty.
+    :raises FileNotFoundError: if neither the checkpoint nor *path* exists.
+    """
+    names = None
+    if windows is not None:
+        names = ["player_ids", "names", "positions"]
+        names += [f"{w}.{part}" for w in windows for part in ("rows", "values")]
+    columns = _load(path, "player_pool", names)
+    if columns is not None:
+        return PlayerPool.from_columns(columns)
+
+    pool = PlayerPool.from_raw_dict(file_repo.load_json(path))
+    if windows is not None:
+        keep = set(windows)
+        pool = pool.with_windows({w: StatsWindow.empty() for w in STATS_WINDOWS if w not in keep})
+    return pool
+
+
+# ---------------------------------------------------------------------------
+# ScoredPool (data_zscores.json)
+# ---------------------------------------------------------------------------
+
+def save_scored_pool(
+    scored_pool: ScoredPool, path: Path, export: Optional[pd.DataFrame] = None
+) -> None:
+    """
+    Write *scored_pool*'s checkpoint (and the JSON export) for *path*.
+    Rows are stored by descending Total_Value, like the JSON file.
+
+    :param export: Frame to write as the JSON export (default: the pool's
+                   scores without raw stat columns).
+    """
+    if config.storage.export_json:
+        if export is None:
+            export = scored_pool.to_dataframe().drop(columns=RAW_STAT_COLS, errors="ignore")
+        file_repo.save_dataframe_as_json(path, export)
+
+    columns = scored_pool.to_columns()
+    order = np.argsort(-scored_pool.total_value, kind="stable")
+    for key in ("player_ids", "names", "scores", "total_value"):
+        columns[key] = columns[key][order]
+    file_repo.save_npz(checkpoint_path(path), columns, schema=_schema("scored_pool"))
+    print(f"  Saved → {checkpoint_path(path)}")
+
+
+def load_scored_pool(path: Path, score_columns: Optional[List[str]] = None) -> ScoredPool:
+    """
+    Load the scored-pool checkpoint for *path* (scores only, no raw stats).
+
+    :param score_columns: Score columns to keep (default all).
+    :raises FileNotFoundError: if neither the checkpoint nor *path* exists.
+    """
+    columns = _load(path, "scored_pool", None)
+    if columns is not None:
+        return ScoredPool.from_columns(columns, score_columns)
+
+    scored_pool = ScoredPool.from_zscores_dict(file_repo.load_json(path))
+    if score_columns is not None:
+        scored_pool = ScoredPool.from_columns(scored_pool.to_columns(), score_columns)
+    return scored_pool
+
+
+# ---------------------------------------------------------------------------
+# SQLite backend
+# ---------------------------------------------------------------------------
+
+def database() -> Optional[SqliteRepository]:
+    """
+    The SQLite store when ``storage.backend`` is ``sqlite`` (opened once
+    per process), else ``None``.
+    """
+    global _database
+    backend = config.storage.backend
+    if backend == "files":
+        return None
+    if backend != "sqlite":
+        raise ValueError(
+            f"Unknown storage.backend {backend!r}; expected 'files' or 'sqlite'."
+        )
+    if _database is None:
+        path = Path(config.storage.database) if config.storage.database else DATA_DIR / "fantasy.db"
+        _database = SqliteRepository(path, STAT_COLUMNS, STATS_WINDOWS)
+    return _database
+
+
+def _current_database(table: str, *paths: Path) -> Optional[SqliteRepository]:
+    """
+    The SQLite store if it is configured and its *table* was saved no
+    earlier than any of *paths* (or their checkpoints) — e.g. not after a
+    ``rank`` under ``backend: files`` — else ``None``.
+    """
+    db = database()
+    if db is None:
+        return None
+    saved_at = db.saved_at(table)
+    files = [
+        f.stat().st_mtime for p in paths for f in (checkpoint_path(p), p) if f.exists()
+    ]
+    if saved_at is None or saved_at < max(files, default=0.0):
+        return None
+    return db
+
+
+def load_scored_players(path: Path, player_ids: Iterable[int]) -> ScoredPool:
+    """
+    Scores for just *player_ids*: an index lookup in the SQLite store when
+    it is current (see :func:`_current_database`) and has every requested
+    player, else the whole checkpoint.
+    """
+    player_ids = list(player_ids)
+    db = _current_database("scores", path)
+    if db is not None:
+        columns = db.load_scores(player_ids)
+        if columns is not None and len(columns["player_ids"]) >= len(set(player_ids)):
+            return ScoredPool.from_columns(columns)
+    return load_scored_pool(path)
+
+
+def load_top_scored(path: Path, n: int, exclude_ids: Iterable[int] = ()) -> ScoredPool:
+    """
+    The *n* highest Total_Value players not in *exclude_ids*: an index scan
+    of the SQLite store when it is current, else the checkpoint's leading
+    rows (it is stored by descending Total_Value).
+    """
+    exclude_ids = list(exclude_ids)
+    db = _current_database("scores", path)
+    if db is not None:
+        columns = db.top_scores(n, exclude_ids)
+        if columns is not None:
+            return ScoredPool.from_columns(columns)
+    scored_pool = load_scored_pool(path)
+    keep = ~np.isin(scored_pool.player_ids, exclude_ids)
+    order = np.argsort(-scored_pool.total_value, kind="stable")
+    rows = order[keep[order]][:n]
+    return ScoredPool.from_columns({
+        **scored_pool.to_columns(),
+        "player_ids": scored_pool.player_ids[rows],
+        "names": scored_pool.names[rows].astype(str),
+        "scores": scored_pool.scores[rows],
+        "total_value": scored_pool.total_value[rows],
+    })
+
+
+def load_player(path: Path, player_id: int) -> Optional[Player]:
+    """
+    *player_id* with its stat windows from *path*'s pool (data.json): an
+    index lookup in the SQLite store when it is current, else the whole
+    checkpoint. ``None`` if the player is unknown.
+    """
+    db = _current_database("stats", path)
+    if db is not None:
+        columns = db.load_players([player_id])
+        if columns is not None and len(columns["player_ids"]):
+            return PlayerPool.from_columns(columns).get(player_id)
+    return load_pool(path).get(player_id)
+
+
+def load_player_projections(path: Path, player_id: int) -> pd.DataFrame:
+    """
+    *player_id*'s saved projections, latest first: every projected day in
+    the SQLite store when it is current, else its row of *path*
+    (daily_projections.json). Empty if there are none.
+    """
+    db = _current_database("projections", path)
+    if db is not None:
+        return db.player_projections(player_id)
+    row = file_repo.load_json(path).get(str(player_id)) if path.exists() else None
+    if row is None:
+        return pd.DataFrame()
+    return pd.DataFrame([{"player_id": player_id, **row}])
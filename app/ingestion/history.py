@@ -0,0 +1,178 @@
+"""
+app/ingestion/history.py
+~~~~~~~~~~~~~~~~~~~~~~~~~
+Versioned history of pulls, rankings and projections.
+
+``pull``, ``rank`` and ``predict`` overwrite their output files; each of
+them also appends what it produced to a :class:`SnapshotStore` under
+``data/history`` (``history.directory``):
+
+  * ``pool``        — every stats window of every player, one row each
+  * ``scores``      — per-category scores plus Total_Value
+  * ``projections`` — the numeric columns of ``daily_projections.json``
+
+Only players whose numbers changed since their last stored version are
+written, and snapshots older than ``history.keep_days`` are compacted to
+one per day. The query helpers rebuild a PlayerPool / ScoredPool as of
+any date, or return one player's trajectory, reading only the rows they
+need.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from app.config import DATA_DIR, config
+from app.domain.player import STATS_WINDOWS, PlayerPool
+from app.domain.scoring import ScoredPool
+from app.domain.stats import STAT_COLUMNS
+from app.repository.snapshot_store import SnapshotRows, SnapshotStore
+
+POOL = "pool"
+SCORES = "scores"
+PROJECTIONS = "projections"
+
+# Pool labels carry name and positions: "<name>\t<PG,SG>"
+_LABEL_SEP = "\t"
+
+_POOL_COLUMNS = [f"{w}.{c}" for w in STATS_WINDOWS for c in STAT_COLUMNS]
+
+
+def store() -> Optional[SnapshotStore]:
+    """The history store, or ``None`` when ``history.enabled`` is off."""
+    if not config.history.enabled:
+        return None
+    directory = Path(config.history.directory) if config.history.directory else DATA_DIR / "history"
+    return SnapshotStore(directory)
+
+
+def _record(kind: str, keys, values, columns, labels, meta: Optional[dict] = None) -> None:
+    history = store()
+    if history is None:
+        return
+    info = history.append(kind, keys, values, columns, labels, meta=meta)
+    removed = history.compact(kind, datetime.now() - timedelta(days=config.history.keep_days))
+    note = f", {removed} old snapshots compacted" if removed else ""
+    print(
+        f"  Saved → {history.directory / kind} "
+        f"(snapshot {info.snapshot_id}: {info.n_rows} changed rows{note})"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+def record_pool(pool: PlayerPool) -> None:
+    """Append *pool*'s stats windows to the ``pool`` history."""
+    n_stats = len(STAT_COLUMNS)
+    values = np.full((len(pool), len(_POOL_COLUMNS)), np.nan)
+    for w, source in enumerate(STATS_WINDOWS):
+        window = pool.window(source)
+        values[window.rows, w * n_stats:(w + 1) * n_stats] = window.values
+    labels = [
+        f"{name}{_LABEL_SEP}{','.join(positions)}"
+        for name, positions in zip(pool.names.tolist(), pool.positions)
+    ]
+    _record(POOL, pool.player_ids, values, _POOL_COLUMNS, labels)
+
+
+def record_scores(scored_pool: ScoredPool) -> None:
+    """Append *scored_pool*'s scores and Total_Value to the ``scores`` history."""
+    values = np.column_stack([scored_pool.scores, scored_pool.total_value])
+    _record(
+        SCORES, scored_pool.player_ids, values,
+        list(scored_pool.score_columns) + ["Total_Value"], scored_pool.names.astype(str),
+    )
+
+
+def record_projection(df: pd.DataFrame, game_date: date) -> None:
+    """Append one day's projection frame (numeric columns) to the ``projections`` history."""
+    numeric = df.drop(columns=["player_id"]).select_dtypes("number")
+    _record(
+        PROJECTIONS, df["player_id"].to_numpy(), numeric.to_numpy(dtype=float),
+        list(numeric.columns), df["name"].astype(str).to_numpy(),
+        meta={"game_date": game_date.isoformat()},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def pool_as_of(when: Union[date, datetime]) -> PlayerPool:
+    """The PlayerPool as last pulled by *when* (a date means end of that day)."""
+    rows = _require().as_of(POOL, when)
+    columns = {
+        "player_ids": rows.keys,
+        "names": np.array([l.split(_LABEL_SEP)[0] for l in rows.labels.tolist()], dtype=str),
+        "positions": np.array([l.partition(_LABEL_SEP)[2] for l in rows.labels.tolist()], dtype=str),
+    }
+    n_stats = len(STAT_COLUMNS)
+    for source in STATS_WINDOWS:
+        block = rows.values[:, [rows.columns.index(f"{source}.{c}") for c in STAT_COLUMNS]] \
+            if len(rows) else np.empty((0, n_stats))
+        present = np.flatnonzero(~np.isnan(block).all(axis=1))
+        columns[f"{source}.rows"] = present
+        columns[f"{source}.values"] = block[present]
+    return PlayerPool.from_columns(columns)
+
+
+def scores_as_of(when: Union[date, datetime]) -> Optional[ScoredPool]:
+    """
+    The rankings as last computed by *when* (a date means end of that
+    day), or ``None`` if nothing had been ranked by then.
+    """
+    rows = _require().as_of(SCORES, when)
+    if not len(rows):
+        return None
+    score_columns = [c for c in rows.columns if c != "Total_Value"]
+    return ScoredPool.from_columns({
+        "player_ids": rows.keys,
+        "names": rows.labels,
+        "score_columns": np.array(score_columns, dtype=str),
+        "scores": rows.values[:, [rows.columns.index(c) for c in score_columns]],
+        "total_value": rows.values[:, rows.columns.index("Total_Value")],
+    })
+
+
+def trajectory(player_id: int, kind: str = SCORES) -> pd.DataFrame:
+    """
+    One player's stored versions in *kind*'s history, oldest first: a
+    ``recorded_at`` column plus that history's value columns. A row is
+    stored only when the player's numbers changed.
+    """
+    return _frame(_require().trajectory(kind, player_id))
+
+
+def player_history(player_id: int, stats_source: str = "stats_curr_season") -> pd.DataFrame:
+    """
+    One player's rankings over time, each row joined with the
+    *stats_source* stat line current when it was recorded.
+    """
+    scores = trajectory(player_id, SCORES)
+    stats = trajectory(player_id, POOL)
+    stat_cols = [c for c in stats.columns if c.startswith(f"{stats_source}.")]
+    stats = stats[["recorded_at", *stat_cols]].rename(columns=lambda c: c.split(".", 1)[-1])
+    if scores.empty:
+        return stats
+    return pd.merge_asof(scores, stats, on="recorded_at")
+
+
+def _frame(rows: SnapshotRows) -> pd.DataFrame:
+    df = pd.DataFrame(rows.values, columns=rows.columns)
+    df.insert(0, "name", [l.split(_LABEL_SEP)[0] for l in rows.labels.tolist()])
+    df.insert(0, "recorded_at", pd.to_datetime(rows.taken_at))
+    return df
+
+
+def _require() -> SnapshotStore:
+    history = store()
+    if history is None:
+        raise RuntimeError("history.enabled is off in config.yaml; there is no history to query.")
+    return history
@@ -0,0 +1,255 @@
+"""
+app/ingestion/minute_redistribution.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Engines that decide how OUT players' minutes reach their teammates.
+
+A :class:`MinuteRedistributor` maps one slate (every player on every
+team playing, as flat arrays) to projected minutes per player;
+``projection_ingestion`` then scales each player's counting stats by
+``projected / average`` minutes. All engines work on the whole slate at
+once — per-team sums are ``np.bincount`` over dense team codes, never a
+loop over teams.
+
+  - :class:`ProportionalRedistributor`: every active teammate gets the same
+    factor ``1 + missing / total_active`` (the original behaviour).
+  - :class:`RotationRedistributor`: role- and position-weighted
+    water-filling under the team minute budget and per-player ceilings.
+
+Pick one with ``projection.redistribution`` in config.yaml
+(:func:`make_redistributor`).
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.config import ProjectionConfig
+
+# Fantasy position → position group used for position affinity
+_POSITION_GROUPS: Dict[str, int] = {"PG": 0, "SG": 0, "SF": 1, "PF": 1, "C": 2}
+N_POSITION_GROUPS = 3
+
+# Rotation roles by minutes rank on the team: [0, 5) starter, [5, 9) rotation
+_ROLE_BOUNDS = (("starter", 5), ("rotation", 9))
+
+_EPS = 1e-9
+
+
+def position_matrix(positions: List[List[str]]) -> np.ndarray:
+    """
+    ``(n, 3)`` guard / forward / center eligibility, each row summing to
+    1 (a player with no listed position counts equally for all three).
+    """
+    m = np.zeros((len(positions), N_POSITION_GROUPS))
+    for i, player_positions in enumerate(positions):
+        for pos in player_positions:
+            group = _POSITION_GROUPS.get(pos)
+            if group is not None:
+                m[i, group] = 1.0
+    counts = m.sum(axis=1, keepdims=True)
+    return np.where(counts > 0, m / np.maximum(counts, 1.0), 1.0 / N_POSITION_GROUPS)
+
+
+@dataclass
+class Slate:
+    """
+    Every player on the slate as parallel arrays.
+
+    :param minutes:    Average minutes per game played.
+    :param games:      Games played (``GP``), for availability.
+    :param team_codes: Dense team index, 0 … n_teams-1.
+    :param is_out:     True for players ruled OUT.
+    :param positions:  ``(n, 3)`` position-group matrix (:func:`position_matrix`).
+    """
+    minutes: np.ndarray
+    games: np.ndarray
+    team_codes: np.ndarray
+    is_out: np.ndarray
+    positions: Optional[np.ndarray] = None
+
+    def __post_init__(self) -> None:
+        if self.positions is None:
+            self.positions = np.full((len(self.minutes), N_POSITION_GROUPS), 1.0 / N_POSITION_GROUPS)
+
+    @property
+    def n_teams(self) -> int:
+        return int(self.team_codes.max()) + 1 if len(self.team_codes) else 0
+
+    def team_sum(self, values: np.ndarray) -> np.ndarray:
+        """Per-team sum of *values* (one entry per team)."""
+        return np.bincount(self.team_codes, weights=values, minlength=self.n_teams)
+
+
+class MinuteRedistributor(ABC):
+    """Interface for minute-redistribution engines."""
+
+    @abstractmethod
+    def project(self, slate: Slate) -> np.ndarray:
+        """
+        Projected minutes for every row of *slate* (0 for OUT players).
+        Must not mutate *slate*.
+        """
+        ...
+
+    def cache_key(self) -> str:
+        """Stable description of this engine's configuration."""
+        return json.dumps(
+            {"class": type(self).__qualname__, "config": vars(self)},
+            sort_keys=True,
+            default=str,
+        )
+
+
+class ProportionalRedistributor(MinuteRedistributor):
+    """
+    Scale every active teammate by ``1 + missing / total_active`` — no
+    team cap, no per-player ceiling.
+    """
+
+    def project(self, slate: Slate) -> np.ndarray:
+        active = ~slate.is_out
+        missing = slate.team_sum(slate.minutes * slate.is_out)
+        active_total = slate.team_sum(slate.minutes * active)
+
+        factor = np.ones(slate.n_teams)
+        scaled = (missing > 0) & (active_total > 0)
+        factor[scaled] += missing[scaled] / active_total[scaled]
+        return np.where(active, slate.minutes * factor[slate.team_codes], 0.0)
+
+
+class RotationRedistributor(MinuteRedistributor):
+    """
+    Hand freed minutes to the rotation by weighted water-filling.
+
+    Per team:
+      - *occupancy* of a player is ``minutes × GP / team max GP`` — what
+        they contribute to an average game, so the roster sums to about
+        ``team_minutes`` even though per-game averages do not;
+      - the budget is the OUT players' occupancy, capped so the active
+        roster's occupancy plus the budget stays within ``team_minutes``;
+      - each active player's weight is ``minutes × role weight × (1 +
+        position_weight × affinity)``, affinity being the share of the
+        missing minutes that came from their position group;
+      - each player is capped at ``max(minutes, min(max_minutes,
+        max_scale × minutes))``.
+
+    Water-filling: the budget is split by weight among players below their
+    ceiling; whatever a capped player cannot take is re-split among the
+    rest, until the budget is spent or everyone is capped. Every round is
+    one vectorised step across all teams and caps at least one player, so
+    it ends within (players per team) rounds.
+    """
+
+    def __init__(
+        self,
+        team_minutes: float = 240.0,
+        max_minutes: float = 38.0,
+        max_scale: float = 1.75,
+        role_weights: Optional[Dict[str, float]] = None,
+        position_weight: float = 1.0,
+    ) -> None:
+        self.team_minutes = team_minutes
+        self.max_minutes = max_minutes
+        self.max_scale = max_scale
+        self.role_weights = {"starter": 1.0, "rotation": 1.0, "bench": 0.3, **(role_weights or {})}
+        self.position_weight = position_weight
+
+    def project(self, slate: Slate) -> np.ndarray:
+        minutes = slate.minutes
+        active = ~slate.is_out
+        team = slate.team_codes
+
+        max_games = np.zeros(slate.n_teams)
+        np.maximum.at(max_games, team, slate.games)
+        availability = np.divide(
+            slate.games, max_games[team], out=np.ones_like(minutes), where=max_games[team] > 0,
+        )
+        occupancy = minutes * np.clip(availability, 0.0, 1.0)
+
+        missing = slate.team_sum(occupancy * slate.is_out)
+        room = np.maximum(self.team_minutes - slate.team_sum(occupancy * active), 0.0)
+        budget = np.minimum(missing, room)
+
+        weight = minutes * self._role_weights(slate) * (1.0 + self.position_weight * self._affinity(slate, occupancy, missing))
+        ceiling = np.maximum(minutes, np.minimum(self.max_minutes, self.max_scale * minutes))
+        headroom = np.where(active, ceiling - minutes, 0.0)
+
+        added = self._water_fill(slate, weight, headroom, budget)
+        return np.where(active, minutes + added, 0.0)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _role_weights(self, slate: Slate) -> np.ndarray:
+        """Weight of each row's role, by minutes rank within its team."""
+        order = np.lexsort((-slate.minutes, slate.team_codes))
+        first = np.searchsorted(slate.team_codes[order], np.arange(slate.n_teams))
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order)) - first[slate.team_codes[order]]
+
+        weights = np.full(len(rank), self.role_weights["bench"])
+        lower = 0
+        for role, upper in _ROLE_BOUNDS:
+            weights[(rank >= lower) & (rank < upper)] = self.role_weights[role]
+            lower = upper
+        return weights
+
+    def _affinity(self, slate: Slate, occupancy: np.ndarray, missing: np.ndarray) -> np.ndarray:
+        """Share of each row's team's missing minutes from its position groups."""
+        missing_by_group = np.stack([
+            slate.team_sum(occupancy * slate.is_out * slate.positions[:, g])
+            for g in range(N_POSITION_GROUPS)
+        ], axis=1)
+        share = np.divide(
+            missing_by_group, missing[:, None],
+            out=np.zeros_like(missing_by_group), where=missing[:, None] > 0,
+        )
+        return (slate.positions * share[slate.team_codes]).sum(axis=1)
+
+    @staticmethod
+    def _water_fill(
+        slate: Slate, weight: np.ndarray, headroom: np.ndarray, budget: np.ndarray
+    ) -> np.ndarray:
+        team = slate.team_codes
+        added = np.zeros_like(weight)
+        remaining = budget.astype(float).copy()
+        open_ = (headroom > _EPS) & (weight > 0)
+
+        for _ in range(len(weight) + 1):
+            total = slate.team_sum(np.where(open_, weight, 0.0))
+            live = (remaining > _EPS) & (total > 0)
+            if not live.any():
+                break
+            share = np.divide(
+                remaining[team] * weight, total[team],
+                out=np.zeros_like(weight), where=open_ & live[team],
+            )
+            give = np.minimum(share, headroom - added)
+            added += give
+            remaining -= slate.team_sum(give)
+            open_ &= (headroom - added) > _EPS
+        return added
+
+
+def make_redistributor(cfg: ProjectionConfig) -> MinuteRedistributor:
+    """Build the engine selected by ``projection.redistribution``."""
+    if cfg.redistribution == "proportional":
+        return ProportionalRedistributor()
+    if cfg.redistribution == "rotation":
+        return RotationRedistributor(
+            team_minutes=cfg.team_minutes,
+            max_minutes=cfg.max_minutes,
+            max_scale=cfg.max_scale,
+            role_weights=cfg.role_weights,
+            position_weight=cfg.position_weight,
+        )
+    raise ValueError(
+        f"Unknown projection.redistribution {cfg.redistribution!r}; "
+        f"expected 'rotation' or 'proportional'."
+    )
@@ -3,18 +3,26 @@ app/ingestion/player_ingestion.py
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 Fetches raw NBA stats from the API, merges stat windows, and builds a
 typed PlayerPool. Also provides load/save helpers for the data.json checkpoint.
+
+:func:`refresh_pool` is the incremental variant: it refetches only the
+windows that move during the season (``_VOLATILE_WINDOWS``), diffs them
+against a stored pool and reports which players actually changed.
 """
 
 from __future__ import annotations
 
 import json
-import time
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
 
-from app.domain.player import Player, PlayerPool
+from app.domain.player import Player, PlayerPool, StatsWindow
 from app.domain.stats import PlayerStats
 from app.config import config
-from app.repository import file_repository as file_repo
+from app.ingestion import checkpoint
 from app.repository import nba_api_repository as nba_repo
 
 # NBA API column name → internal app column name
@@ -38,6 +46,42 @@ _STATS_MAPPING: dict[str, str] = {
 }
 
 
+# Player field → (season key, last_n_games) for each stat window pulled.
+# All windows are fetched concurrently, so another entry costs roughly
+# one rate-limiter token rather than one more sequential request.
+_STAT_WINDOWS: dict[str, tuple[str, int]] = {
+    "stats_curr_season": ("current", 0),
+    "stats_prev_season": ("previous", 0),
+    "stats_last_10":     ("current", 10),
+}
+
+
+# Windows that change between games. The previous season is final and
+# positions rarely move, so an incremental pull skips both.
+_VOLATILE_WINDOWS: Tuple[str, ...] = ("stats_curr_season", "stats_last_10")
+
+# Absolute tolerance when deciding whether a stat value changed
+_CHANGE_TOLERANCE = 1e-9
+
+
+# NBA listed position letter → fantasy positions it makes a player eligible for
+_POSITION_ELIGIBILITY: dict[str, list[str]] = {
+    "G": ["PG", "SG"],
+    "F": ["SF", "PF"],
+    "C": ["C"],
+}
+
+
+def _fantasy_positions(nba_position: str) -> list[str]:
+    """Expand an NBA listed position (e.g. ``"G-F"``) to fantasy positions."""
+    positions: list[str] = []
+    for part in nba_position.split("-"):
+        for pos in _POSITION_ELIGIBILITY.get(part.strip().upper(), []):
+            if pos not in positions:
+                positions.append(pos)
+    return positions
+
+
 def _extract_stats(row: dict) -> dict:
     """Map NBA API column names to internal app column names."""
     return {
@@ -47,29 +91,97 @@ def _extract_stats(row: dict) -> dict:
     }
 
 
+def _fetch_windows(fields: Iterable[str], with_positions: bool = False) -> Dict[str, dict]:
+    """
+    Fetch the stat windows *fields* (keys of ``_STAT_WINDOWS``), and
+    optionally listed positions, concurrently.
+
+    :returns: ``{field: {player_id: api_row}}``, plus ``"positions"``
+              (``{player_id: position}``) when requested.
+    """
+    tasks = {
+        name: partial(
+            nba_repo.fetch_league_stats,
+            getattr(config.season, _STAT_WINDOWS[name][0]),
+            last_n_games=_STAT_WINDOWS[name][1],
+        )
+        for name in fields
+    }
+    if with_positions:
+        tasks["positions"] = partial(nba_repo.fetch_player_positions, config.season.current)
+    results = nba_repo.fetch_concurrently(tasks)
+
+    return {
+        name: (
+            result if name == "positions"
+            else result.set_index("PLAYER_ID").to_dict(orient="index") if not result.empty
+            else {}
+        )
+        for name, result in results.items()
+    }
+
+
+def _changed_rows(old: StatsWindow, new: StatsWindow, n_players: int) -> np.ndarray:
+    """
+    Pool rows whose stat line differs between two windows of the same
+    pool — a line appearing, disappearing, or any value moving by more
+    than ``_CHANGE_TOLERANCE``.
+    """
+    before = np.full((n_players, old.values.shape[1]), np.nan)
+    after = np.full_like(before, np.nan)
+    before[old.rows] = old.values
+    after[new.rows] = new.values
+    same = np.isclose(before, after, rtol=0.0, atol=_CHANGE_TOLERANCE, equal_nan=True)
+    return np.flatnonzero(~same.all(axis=1))
+
+
 # ---------------------------------------------------------------------------
 # Public functions
 # ---------------------------------------------------------------------------
 
+@dataclass
+class PoolDelta:
+    """
+    What an incremental pull changed.
+
+    :param windows:     Stat windows that were refetched.
+    :param changed:     ``{window: [player_id, ...]}`` whose line changed.
+    :param unknown_ids: Players the API returned who are not in the stored
+                        pool (new signings, call-ups) — a full pull adds them.
+    """
+    windows: List[str]
+    changed: Dict[str, List[int]] = field(default_factory=dict)
+    unknown_ids: List[int] = field(default_factory=list)
+
+    @property
+    def changed_ids(self) -> List[int]:
+        """Players changed in any refetched window."""
+        ids: Set[int] = set()
+        for pids in self.changed.values():
+            ids.update(pids)
+        return sorted(ids)
+
+    def to_dict(self) -> dict:
+        return {
+            "windows": list(self.windows),
+            "changed_player_ids": self.changed_ids,
+            "changed_by_window": {w: list(p) for w, p in self.changed.items()},
+            "unknown_player_ids": list(self.unknown_ids),
+        }
+
+
 def fetch_and_build_pool() -> PlayerPool:
     """
     Hit the NBA API for current season, previous season, and last-10-games
-    stats, merge them into a PlayerPool, and return it.
+    stats plus listed positions, merge them into a PlayerPool, and return it.
 
-    Applies a 1-second sleep between API calls to be polite to the rate limiter.
+    The requests run concurrently under the repository's shared rate
+    limiter (see ``api`` in config.yaml).
     """
     print("=== Data Ingestion ===")
 
-    df_curr   = nba_repo.fetch_league_stats(config.season.current)
-    time.sleep(1)
-    df_prev   = nba_repo.fetch_league_stats(config.season.previous)
-    time.sleep(1)
-    df_last10 = nba_repo.fetch_league_stats(config.season.current, last_n_games=10)
-    time.sleep(1)
-
-    curr_dict  = df_curr.set_index("PLAYER_ID").to_dict(orient="index")  if not df_curr.empty  else {}
-    prev_dict  = df_prev.set_index("PLAYER_ID").to_dict(orient="index")  if not df_prev.empty  else {}
-    l10_dict   = df_last10.set_index("PLAYER_ID").to_dict(orient="index") if not df_last10.empty else {}
+    windows = _fetch_windows(_STAT_WINDOWS, with_positions=True)
+    positions = windows.pop("positions")
 
     active_players = nba_repo.fetch_active_players()
     print(f"  Processing {len(active_players)} active players...")
@@ -84,38 +196,79 @@ def fetch_and_build_pool() -> PlayerPool:
         players[pid] = Player(
             player_id=pid,
             name=p["full_name"],
-            positions=[],
-            stats_curr_season=_stats(curr_dict.get(pid, {})),
-            stats_prev_season=_stats(prev_dict.get(pid, {})),
-            stats_last_10=_stats(l10_dict.get(pid, {})),
+            positions=_fantasy_positions(positions.get(pid, "")),
+            **{name: _stats(rows.get(pid, {})) for name, rows in windows.items()},
         )
 
-    return PlayerPool(players=players)
+    return PlayerPool.from_players(players.values())
+
+
+def refresh_pool(pool: PlayerPool) -> Tuple[PlayerPool, PoolDelta]:
+    """
+    Incremental pull: refetch only ``_VOLATILE_WINDOWS`` and apply them
+    to *pool*'s existing players.
+
+    Windows with no changed player are kept as-is (the returned pool
+    shares them), so callers can skip rescoring / rewriting entirely
+    when ``delta.changed_ids`` is empty. Players, positions and the
+    previous-season window are never touched; new players are only
+    reported in ``delta.unknown_ids``.
+
+    :returns: ``(updated pool, delta)``.
+    """
+    print("=== Data Ingestion (incremental) ===")
+
+    fetched = _fetch_windows(_VOLATILE_WINDOWS)
+    delta = PoolDelta(windows=list(_VOLATILE_WINDOWS))
+    updates: Dict[str, StatsWindow] = {}
+    unknown: Set[int] = set()
+
+    for name, rows in fetched.items():
+        if not rows:
+            print(f"  [WARN] No rows returned for {name}; keeping stored window.")
+            continue
+        unknown.update(int(pid) for pid in rows if int(pid) not in pool)
+        window = pool.window_from_rows({
+            int(pid): PlayerStats.from_dict(_extract_stats(d)).to_row()
+            for pid, d in rows.items()
+        })
+        changed = _changed_rows(pool.window(name), window, len(pool))
+        if len(changed):
+            updates[name] = window
+            delta.changed[name] = [int(pid) for pid in pool.player_ids[changed]]
+        print(f"  {name}: {len(changed)} of {len(rows)} players changed")
+
+    delta.unknown_ids = sorted(unknown)
+    if delta.unknown_ids:
+        print(f"  [INFO] {len(delta.unknown_ids)} players not in the stored pool; "
+              f"run a full `pull` to add them.")
+
+    return (pool.with_windows(updates) if updates else pool), delta
 
 
-def load_pool_from_file(path: Path) -> PlayerPool:
+def load_pool_from_file(path: Path, windows: Optional[Iterable[str]] = None) -> PlayerPool:
     """
-    Load a PlayerPool from a data.json-format file.
+    Load the PlayerPool saved as *path* (data.json), from its binary
+    checkpoint when current (see ``checkpoint``).
 
-    :raises FileNotFoundError: if *path* does not exist.
+    :param windows: Stats windows to load (default all).
+    :raises FileNotFoundError: if neither the checkpoint nor *path* exists.
     """
-    if not path.exists():
+    if not checkpoint.exists(path):
         raise FileNotFoundError(
             f"{path} not found. Run `python main.py pull` first."
         )
-    raw = file_repo.load_json(path)
-    return PlayerPool.from_raw_dict(raw)
+    return checkpoint.load_pool(path, windows)
 
 
 def save_pool(pool: PlayerPool, path: Path) -> None:
-    """Persist a PlayerPool to *path* in data.json format."""
-    file_repo.save_json(path, pool.to_raw_dict())
+    """Persist a PlayerPool as *path* (binary checkpoint + data.json export)."""
+    checkpoint.save_pool(pool, path)
 
-    # Print a one-player sample as a sanity check
-    sample = next(iter(pool.players.values()), None)
-    if sample:
+    # Print a one-player sample as a sanity check (serialising just that player)
+    if len(pool):
         print("\nSample (first player):")
-        raw_sample = pool.to_raw_dict().get(str(sample.player_id), {})
+        raw_sample = pool.take(np.array([0])).to_raw_dict().get(str(int(pool.player_ids[0])), {})
         print(json.dumps(raw_sample, indent=2))
 
     print(f"\nData ingestion complete — {len(pool)} players written to {path}")
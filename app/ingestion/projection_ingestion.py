@@ -1,173 +1,365 @@
 """
 app/ingestion/projection_ingestion.py
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-Builds a projected PlayerPool for today's games by:
-  1. Fetching today's NBA schedule (or reading from cache)
-  2. Filtering the base pool to players with a game today
-  3. Loading the injury list and marking OUT players
-  4. Redistributing the missing minutes to active teammates (per team)
+Builds a projected PlayerPool for a day's games by:
+  1. Looking the day's slate up in the season schedule index
+  2. Filtering the base pool to players with a game that day
+  3. Loading the injury list as per-player play probabilities
+  4. Redistributing the missing minutes to active teammates (all teams
+     in one vectorised pass, by the engine chosen under ``projection`` in
+     config.yaml — see ``minute_redistribution.py``), in expectation over
+     each team's availability scenarios (``availability.py``)
 
 Returns a new PlayerPool where each player's ``stats_curr_season`` has been
-replaced with their projected (injury-adjusted) stat line. OUT players and
-players on teams with no game are excluded entirely.
+replaced with their expected (injury-adjusted) stat line; ``project_slate``
+also returns each line's variance. OUT players and players on teams with
+no game are excluded entirely.
 
 This is a data-transformation step — no scoring is performed here.
 """
 
 from __future__ import annotations
 
-from dataclasses import replace as dc_replace
-from pathlib import Path
-from typing import Optional
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
-from app.config import DATA_DIR
-from app.domain.player import Player, PlayerPool
-from app.domain.stats import PlayerStats, SCALABLE_STAT_COLS
+from app.config import DATA_DIR, config
+from app.domain.player import PlayerPool, StatsWindow
+from app.domain.stats import SCALABLE_STAT_COLS, STAT_COLUMNS
+from app.ingestion import schedule_ingestion
+from app.ingestion.availability import cached_model
+from app.ingestion.minute_redistribution import (
+    MinuteRedistributor,
+    Slate,
+    make_redistributor,
+    position_matrix,
+)
 from app.repository import file_repository as file_repo
 from app.repository import nba_api_repository as nba_repo
 
-pd.options.mode.chained_assignment = None   # suppress chained-assignment warning
-
-
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
 
-def _get_player_team_map() -> dict[int, int]:
-    """Return player→team map, preferring the on-disk cache."""
-    cached = file_repo.load_team_map_cache()
-    if cached:
-        return cached
-
+def get_player_team_map() -> dict[int, int]:
+    """
+    Return the player→team map (cached by the repository with a TTL),
+    falling back to a legacy ``team_map_cache.json`` if the fetch fails.
+    """
     team_map = nba_repo.fetch_player_team_map()
     if team_map:
-        file_repo.save_team_map_cache(team_map)
-    return team_map
+        return team_map
+    return file_repo.load_team_map_cache() or {}
 
 
-def _load_out_player_ids() -> set[int]:
+def load_play_probabilities() -> Dict[int, float]:
     """
-    Load the manual injury list from data/injuries.json.
-    Returns an empty set if the file does not exist.
+    Load the manual injury list from data/injuries.json as
+    ``{player_id: probability of playing}``.
+
+    Each entry's ``play_probability`` is used when present, otherwise its
+    ``status`` is looked up in ``projection.status_probabilities``
+    (``OUT`` → 0). Players certain to play are omitted. Returns an empty
+    dict if the file does not exist.
     """
     path = DATA_DIR / "injuries.json"
     if not path.exists():
-        return set()
-    injuries = file_repo.load_json(path)
-    return {int(p["id"]) for p in injuries if p.get("status") == "OUT"}
+        return {}
+    statuses = config.projection.status_probabilities
+    probs: Dict[int, float] = {}
+    for entry in file_repo.load_json(path):
+        if "play_probability" in entry:
+            p = float(entry["play_probability"])
+        else:
+            p = statuses.get(str(entry.get("status", "")).upper(), 1.0)
+        if p < 1.0:
+            probs[int(entry["id"])] = min(max(p, 0.0), 1.0)
+    return probs
 
 
-def _redistribute_minutes(team_df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Scale active players' counting stats proportionally to absorb the
-    minutes lost to OUT players on the same team.
-
-    :param team_df: DataFrame for a single NBA team.
-                    Must have ``IS_OUT`` and ``MIN`` columns.
-    :returns:       DataFrame containing only active (non-OUT) players
-                    with adjusted stat columns.
-    """
-    out_mask    = team_df["IS_OUT"]
-    active_mask = ~out_mask
+def load_out_player_ids() -> set[int]:
+    """IDs from data/injuries.json certain not to play (probability 0)."""
+    return {pid for pid, p in load_play_probabilities().items() if p <= 0.0}
 
-    missing_minutes = team_df.loc[out_mask, "MIN"].sum()
-    if missing_minutes <= 0:
-        return team_df.loc[active_mask]
 
-    active_df = team_df.loc[active_mask].copy()
-    total_active_min = active_df["MIN"].sum()
-    if total_active_min == 0:
-        return active_df
+# Column positions in a STAT_COLUMNS row
+_COL = {c: i for i, c in enumerate(STAT_COLUMNS)}
+_SCALED = np.array([_COL[c] for c in SCALABLE_STAT_COLS + ["MIN"]])
 
-    factor = 1 + (missing_minutes / total_active_min)
 
-    for col in SCALABLE_STAT_COLS:
-        if col in active_df.columns:
-            active_df[col] = active_df[col] * factor
+def _scale_lines(
+    values: np.ndarray, mean: np.ndarray, var: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expected stat rows and their variances for minute factors with the
+    given *mean* / *var*: counting stats and minutes scale linearly, so
+    ``E = line × mean`` and ``Var = line² × var``. FG%/FT% are recomputed
+    from the expected makes / attempts (variance 0); GP is unchanged.
+    """
+    lines = values.copy()
+    lines[:, _SCALED] *= mean[:, None]
+    variance = np.zeros_like(values)
+    variance[:, _SCALED] = values[:, _SCALED] ** 2 * var[:, None]
 
     # Recalculate percentage columns after scaling
-    active_df["FG%"] = active_df.apply(
-        lambda r: r["FGM"] / r["FGA"] if r["FGA"] > 0 else 0.0, axis=1
-    )
-    active_df["FT%"] = active_df.apply(
-        lambda r: r["FTM"] / r["FTA"] if r["FTA"] > 0 else 0.0, axis=1
-    )
-    active_df["MIN"] = active_df["MIN"] * factor
+    for pct, made, att in (("FG%", "FGM", "FGA"), ("FT%", "FTM", "FTA")):
+        lines[:, _COL[pct]] = np.divide(
+            lines[:, _COL[made]], lines[:, _COL[att]],
+            out=np.zeros(len(lines)), where=lines[:, _COL[att]] > 0,
+        )
+    return lines, variance
+
 
-    return active_df
+@dataclass
+class SlateProjection:
+    """
+    Projected lines for one slate.
 
+    :param pool:             Players who may play, with their expected
+                             line as ``stats_curr_season``.
+    :param variance:         ``(len(pool), len(STAT_COLUMNS))`` variance of
+                             each expected stat from availability uncertainty.
+    :param play_probability: ``(len(pool),)`` probability each player plays.
+    """
+    pool: PlayerPool
+    variance: np.ndarray
+    play_probability: np.ndarray
 
-def _row_to_player_stats(row: pd.Series) -> PlayerStats:
-    """Convert a DataFrame row (post-redistribution) to a PlayerStats object."""
-    return PlayerStats.from_dict(row.to_dict())
+    def uncertainty_frame(self) -> pd.DataFrame:
+        """``player_id``, ``play_prob`` and ``<stat>_sd`` for the scaled stats."""
+        df = pd.DataFrame({"player_id": self.pool.player_ids, "play_prob": self.play_probability})
+        for col in SCALABLE_STAT_COLS + ["MIN"]:
+            df[f"{col}_sd"] = np.sqrt(self.variance[:, _COL[col]])
+        return df
 
 
 # ---------------------------------------------------------------------------
-# Public function
+# Public functions
 # ---------------------------------------------------------------------------
 
-def build_projected_pool(base_pool: PlayerPool) -> Optional[PlayerPool]:
+def fetch_week_schedule(start: date, end: Optional[date] = None) -> Dict[date, Set[int]]:
     """
-    Build a projected PlayerPool for today's games.
+    Which teams play on each day from *start* through *end*, from the
+    season schedule index (see ``schedule_ingestion``).
+
+    :param start: First day (inclusive).
+    :param end:   Last day (inclusive); defaults to the Sunday ending
+                  *start*'s fantasy week (Monday–Sunday).
+    :returns:     Dict {date: set of team IDs}; days without games map to
+                  an empty set.
+    """
+    if end is None:
+        end = start + timedelta(days=6 - start.weekday())
+    return schedule_ingestion.schedule_days(start, end)
 
-    :param base_pool: The full PlayerPool from data.json (current season stats).
-    :returns:         A new PlayerPool with projected ``stats_curr_season``
-                      for each active player playing today, or ``None`` if
-                      there are no games today or no players remain after
-                      injury filtering.
+
+@dataclass(eq=False)
+class ProjectionBase:
+    """
+    A pool flattened once for projecting any number of slates: every
+    player with current-season stats and a known team, as parallel arrays.
+    Projecting a slate only masks these by team — nothing is rebuilt.
+
+    :param pool:      The source pool.
+    :param rows:      Pool row of each player.
+    :param teams:     Team ID of each player.
+    :param values:    Current-season stat rows (``STAT_COLUMNS``).
+    :param prob:      Probability each player plays.
+    :param positions: ``(n, 3)`` position-group matrix.
     """
-    print("  Fetching today's schedule and team map...")
+    pool: PlayerPool
+    rows: np.ndarray
+    teams: np.ndarray
+    values: np.ndarray
+    prob: np.ndarray
+    positions: np.ndarray
+
+
+def flatten_pool(
+    base_pool: PlayerPool,
+    team_map: Dict[int, int],
+    play_probability: Dict[int, float],
+) -> ProjectionBase:
+    """
+    Flatten *base_pool* for :func:`project_slate`.
 
-    team_map = _get_player_team_map()
-    if not team_map:
-        print("  [ERROR] Could not load player→team map. Aborting.")
-        return None
+    :param play_probability: ``{player_id: probability of playing}``;
+                             absent = 1, 0 = OUT.
+    """
+    window = base_pool.window("stats_curr_season")
+    pids = base_pool.player_ids[window.rows]
+    teams = np.fromiter(
+        (team_map.get(int(pid), -1) for pid in pids), dtype=np.int64, count=len(pids)
+    )
+    known = teams >= 0
+    pids = pids[known]
+    return ProjectionBase(
+        pool=base_pool,
+        rows=window.rows[known],
+        teams=teams[known],
+        values=window.values[known],
+        prob=np.fromiter(
+            (play_probability.get(int(pid), 1.0) for pid in pids),
+            dtype=np.float64, count=len(pids),
+        ),
+        positions=position_matrix([base_pool.positions[r] for r in window.rows[known]]),
+    )
 
-    playing_teams = nba_repo.fetch_todays_playing_teams()
-    if not playing_teams:
-        print("  [INFO] No games scheduled today. Nothing to project.")
-        return None
 
-    # Flatten the pool to a DataFrame for groupby operations
-    df = base_pool.to_dataframe("stats_curr_season")
-    df["TEAM_ID"] = df["player_id"].map(team_map)
-    df = df.dropna(subset=["TEAM_ID"])
-    df["TEAM_ID"] = df["TEAM_ID"].astype(int)
+def project_slate(
+    base: ProjectionBase,
+    playing_teams: Set[int],
+    redistributor: Optional[MinuteRedistributor] = None,
+) -> Optional[SlateProjection]:
+    """
+    Project the flattened pool's current-season lines onto one slate.
+
+    Pure array work over the whole slate: players are filtered to
+    *playing_teams*; each team's availability scenarios are projected by
+    the :class:`AvailabilityModel` (minutes redistributed by
+    *redistributor*), and the expected lines laid out as a new pool with
+    :meth:`PlayerPool.take` — no Player objects or DataFrame rows are
+    built. OUT players (probability 0) are dropped.
+
+    :param redistributor: Minute engine; defaults to the one configured
+                          under ``projection`` in config.yaml.
+    :returns: The projection, or ``None`` if nobody remains.
+    """
+    if redistributor is None:
+        redistributor = make_redistributor(config.projection)
+    model = cached_model(
+        redistributor,
+        max_exact=config.projection.max_exact_uncertain,
+        n_samples=config.projection.n_samples,
+    )
 
-    df_today = df[df["TEAM_ID"].isin(playing_teams)].copy()
+    on_slate = np.isin(base.teams, np.fromiter(playing_teams, dtype=np.int64))
     print(
         f"  Teams playing: {len(playing_teams)} | "
-        f"Players loaded: {len(df_today)}"
+        f"Players loaded: {int(on_slate.sum())}"
     )
 
-    # Mark injured / OUT players
-    out_ids = _load_out_player_ids()
-    df_today["IS_OUT"] = df_today["player_id"].isin(out_ids)
-
-    # Redistribute minutes per team
-    projected_dfs = [
-        _redistribute_minutes(team_df)
-        for _, team_df in df_today.groupby("TEAM_ID")
-    ]
+    values = base.values[on_slate]
+    prob = base.prob[on_slate]
+    _, team_codes = np.unique(base.teams[on_slate], return_inverse=True)
+    slate = Slate(
+        minutes=values[:, _COL["MIN"]],
+        games=values[:, _COL["GP"]],
+        team_codes=team_codes,
+        is_out=prob <= 0.0,
+        positions=base.positions[on_slate],
+    )
+    mean, var = model.factor_moments(slate, prob)
 
-    if not projected_dfs:
+    keep = ~slate.is_out
+    if not keep.any():
         print("  [INFO] No players remaining after injury filtering.")
         return None
 
-    final_df = pd.concat(projected_dfs).reset_index(drop=True)
+    lines, variance = _scale_lines(values[keep], mean[keep], var[keep])
+    lines.flags.writeable = False
+    pool = base.pool.take(base.rows[on_slate][keep])
+    return SlateProjection(
+        pool=pool.with_windows({
+            "stats_curr_season": StatsWindow(np.arange(len(pool), dtype=np.int64), lines),
+        }),
+        variance=variance,
+        play_probability=prob[keep],
+    )
+
+
+def project_pool(
+    base_pool: PlayerPool,
+    team_map: Dict[int, int],
+    playing_teams: Set[int],
+    play_probability: Dict[int, float],
+    redistributor: Optional[MinuteRedistributor] = None,
+) -> Optional[PlayerPool]:
+    """Flatten *base_pool* and project one slate; the expected-line pool (or ``None``)."""
+    projection = project_slate(
+        flatten_pool(base_pool, team_map, play_probability), playing_teams, redistributor
+    )
+    return projection.pool if projection is not None else None
+
+
+def project_range(
+    base_pool: PlayerPool,
+    start: date,
+    end: date,
+    team_map: Optional[Dict[int, int]] = None,
+    play_probability: Optional[Dict[int, float]] = None,
+) -> Dict[date, SlateProjection]:
+    """
+    Project every day from *start* to *end* inclusive.
+
+    The pool is flattened once and each day's slate comes from the
+    schedule index, so a range costs one team-mask per day; teams whose
+    inputs repeat across days are served from the availability cache.
+    Today's injury list applies to every day.
 
-    # Rebuild a PlayerPool with projected stats
-    projected_players: dict[int, Player] = {}
-    for _, row in final_df.iterrows():
-        pid = int(row["player_id"])
-        original = base_pool.get(pid)
-        if original is None:
+    :param team_map:         Defaults to :func:`get_player_team_map`.
+    :param play_probability: Defaults to :func:`load_play_probabilities`.
+    :returns: ``{day: projection}`` for days with games (others omitted).
+    """
+    team_map = team_map if team_map is not None else get_player_team_map()
+    if play_probability is None:
+        play_probability = load_play_probabilities()
+    base = flatten_pool(base_pool, team_map, play_probability)
+
+    projections: Dict[date, SlateProjection] = {}
+    for day, teams in fetch_week_schedule(start, end).items():
+        if not teams:
             continue
+        projection = project_slate(base, teams)
+        if projection is not None:
+            projections[day] = projection
+    return projections
+
+
+def build_projection(
+    base_pool: PlayerPool, game_date: Optional[date] = None
+) -> Optional[SlateProjection]:
+    """
+    Build one day's :class:`SlateProjection` (expected lines plus
+    variances) from the schedule index, team map and data/injuries.json.
 
-        projected_stats = _row_to_player_stats(row)
-        projected_player = dc_replace(original, stats_curr_season=projected_stats)
-        projected_players[pid] = projected_player
+    :param game_date: Day to project (default today).
+    :returns: ``None`` if there are no games that day or no players remain
+              after injury filtering.
+    """
+    game_date = game_date or date.today()
+    print(f"  Loading the {game_date} slate and team map...")
+
+    team_map = get_player_team_map()
+    if not team_map:
+        print("  [ERROR] Could not load player→team map. Aborting.")
+        return None
+
+    playing_teams = schedule_ingestion.playing_teams(game_date)
+    if not playing_teams:
+        print(f"  [INFO] No games scheduled on {game_date}. Nothing to project.")
+        return None
 
-    return PlayerPool(players=projected_players)
+    base = flatten_pool(base_pool, team_map, load_play_probabilities())
+    return project_slate(base, playing_teams)
+
+
+def build_projected_pool(
+    base_pool: PlayerPool, game_date: Optional[date] = None
+) -> Optional[PlayerPool]:
+    """
+    Build a projected PlayerPool for one day's games.
+
+    :param base_pool: The full PlayerPool from data.json (current season stats).
+    :param game_date: Day to project (default today).
+    :returns:         A new PlayerPool with projected ``stats_curr_season``
+                      for each active player playing that day, or ``None``
+                      if there are no games or no players remain after
+                      injury filtering.
+    """
+    projection = build_projection(base_pool, game_date)
+    return projection.pool if projection is not None else None
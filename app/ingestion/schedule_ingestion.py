@@ -0,0 +1,83 @@
+"""
+app/ingestion/schedule_ingestion.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Loads the season schedule once and serves it from memory.
+
+The full regular-season schedule is one ScheduleLeagueV2 request; it is
+stored as ``data/schedule_<season>.json`` and indexed into a
+:class:`SeasonSchedule`. Later lookups — today's slate, a week's days,
+games remaining, back-to-backs — are answered from that index without
+any request, so past and future dates can be projected offline.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from functools import partial
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from app.config import DATA_DIR, config
+from app.domain.schedule import SeasonSchedule
+from app.repository import file_repository as file_repo
+from app.repository import nba_api_repository as nba_repo
+
+# One index per season per process
+_schedules: Dict[str, SeasonSchedule] = {}
+
+
+def _schedule_path(season: str) -> Path:
+    return DATA_DIR / f"schedule_{season}.json"
+
+
+def load_season_schedule(season: Optional[str] = None, refresh: bool = False) -> SeasonSchedule:
+    """
+    Return *season*'s (default: current) schedule index.
+
+    Reads ``data/schedule_<season>.json`` when present; otherwise — or
+    with *refresh* — fetches the schedule and rewrites that file. An
+    empty schedule is returned (and not saved) if the fetch fails.
+    """
+    season = season or config.season.current
+    if not refresh and season in _schedules:
+        return _schedules[season]
+
+    path = _schedule_path(season)
+    if not refresh and path.exists():
+        schedule = SeasonSchedule.from_dict(file_repo.load_json(path))
+    else:
+        schedule = SeasonSchedule.from_frame(season, nba_repo.fetch_season_schedule(season))
+        if len(schedule):
+            file_repo.save_json(path, schedule.to_dict(), indent=None)
+        else:
+            print(f"  [WARN] No schedule available for {season}.")
+
+    _schedules[season] = schedule
+    return schedule
+
+
+def playing_teams(day: date) -> Set[int]:
+    """
+    Teams with a game on *day*, from the schedule index; falls back to
+    the live scoreboard for days outside the indexed season.
+    """
+    schedule = load_season_schedule()
+    if schedule.covers(day):
+        return schedule.teams_on(day)
+    return nba_repo.fetch_playing_teams(day)
+
+
+def schedule_days(start: date, end: date) -> Dict[date, Set[int]]:
+    """
+    ``{day: teams playing}`` from *start* to *end* inclusive, from the
+    schedule index (live scoreboard for days it does not cover).
+    """
+    schedule = load_season_schedule()
+    days = schedule.days(start, end)
+    uncovered = [day for day in days if not schedule.covers(day)]
+    if uncovered:
+        live = nba_repo.fetch_concurrently({
+            day.isoformat(): partial(nba_repo.fetch_playing_teams, day) for day in uncovered
+        })
+        days.update({day: live[day.isoformat()] for day in uncovered})
+    return days
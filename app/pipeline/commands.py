@@ -15,62 +15,218 @@ No business logic lives here — commands are glue.
 from __future__ import annotations
 
 import sys
-from typing import Optional
-
-from app.analytics.evaluation.candidate_evaluator import evaluate_replacements
-from app.analytics.scoring.z_score import ZScoreStrategy
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from app.analytics.evaluation.candidate_evaluator import (
+    EvaluationResult,
+    evaluate_replacements,
+    evaluate_roster_swaps,
+)
+from app.analytics.evaluation.trade_evaluator import evaluate_trades
+from app.analytics.optimization.lineup import optimize_lineup, optimize_lineup_for_matchup
+from app.analytics.optimization.portfolio import PortfolioRoster, optimize_portfolio
+from app.analytics.optimization.streaming import plan_week
+from app.analytics.scoring.punt_search import search_punts
+from app.analytics.scoring.scenarios import load_scenarios, score_scenarios
+from app.analytics.scoring.service import default_strategy, score_pool, scoring_cache
+from app.analytics.simulation import matchup as matchup_sim
 from app.config import DATA_DIR, config
+from app.domain.player import PlayerPool
 from app.domain.roster import Roster
 from app.domain.scoring import ScoredPool
 from app.domain.stats import RAW_STAT_COLS
-from app.ingestion import player_ingestion, projection_ingestion, roster_ingestion
+from app.ingestion import (
+    checkpoint,
+    history,
+    player_ingestion,
+    projection_ingestion,
+    roster_ingestion,
+    schedule_ingestion,
+)
 from app.repository import file_repository as file_repo
 
 sys.stdout.reconfigure(encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
-# Convenience: build the configured ZScoreStrategy in one place
+# Convenience: players who are never free agents
 # ---------------------------------------------------------------------------
 
-def _default_strategy() -> ZScoreStrategy:
-    return ZScoreStrategy(
-        weights=config.scoring.category_weights,
-        punt_categories=config.scoring.punt_categories,
-        stats_source=config.scoring.stats_source,
-    )
+def _unavailable_ids() -> List[int]:
+    """
+    Players on another fantasy roster — matchup_team and every
+    ``roster.league_teams`` team — and so never free agents.
+    """
+    ids = list(config.roster.matchup_team)
+    for team_ids in config.roster.league_teams.values():
+        ids += team_ids
+    return ids
 
 
 # ---------------------------------------------------------------------------
 # pull — fetch raw NBA stats → data/data.json
 # ---------------------------------------------------------------------------
 
-def pull() -> None:
-    """Fetch raw NBA stats and persist to data/data.json."""
-    pool = player_ingestion.fetch_and_build_pool()
-    player_ingestion.save_pool(pool, DATA_DIR / "data.json")
+def pull(incremental: bool = False) -> None:
+    """
+    Fetch raw NBA stats and persist to data/data.json.
+
+    :param incremental: Refetch only the in-season windows, apply them to
+                        the stored data.json and, when any player changed,
+                        list them in data/pull_delta.json. Falls back to a
+                        full pull when there is no data.json yet.
+    """
+    path = DATA_DIR / "data.json"
+    if not incremental or not checkpoint.exists(path):
+        if incremental:
+            print(f"  [INFO] {path} not found — running a full pull.")
+        pool = player_ingestion.fetch_and_build_pool()
+        player_ingestion.save_pool(pool, path)
+        _store_pool(pool)
+        return
+
+    stored = player_ingestion.load_pool_from_file(path)
+    pool, delta = player_ingestion.refresh_pool(stored)
+
+    if not delta.changed_ids:
+        print(f"\nNo stat changes — {path} left untouched.")
+        return
+    file_repo.save_json(DATA_DIR / "pull_delta.json", {
+        "pulled_at": datetime.now().isoformat(timespec="seconds"),
+        **delta.to_dict(),
+    })
+    player_ingestion.save_pool(pool, path)
+    _store_pool(pool)
+    print(f"  {len(delta.changed_ids)} players changed since the last pull.")
+
+
+def _store_pool(pool: PlayerPool) -> None:
+    """
+    Record today's pool in the history and (with each player's team) in
+    the SQLite store, if configured.
+    """
+    history.record_pool(pool)
+    db = checkpoint.database()
+    if db is None:
+        return
+    db.save_players(
+        pool.to_columns(), date.today().isoformat(),
+        team_map=projection_ingestion.get_player_team_map(),
+    )
+    print(f"  Saved → {db.path}")
 
 
 # ---------------------------------------------------------------------------
 # rank — score all players → data/data_zscores.json + fantasy_rankings.csv
 # ---------------------------------------------------------------------------
 
-def rank() -> None:
-    """Load data.json, apply ZScoreStrategy, save checkpoint and CSV."""
+def rank(scenarios_path: Optional[Path] = None) -> None:
+    """
+    Load data.json, apply ZScoreStrategy, save checkpoint and CSV.
+
+    :param scenarios_path: When given, also score every weight/punt scenario
+                           in this YAML file in one pass and save the
+                           players × scenarios table (see :func:`rank_scenarios`).
+    """
     pool = player_ingestion.load_pool_from_file(DATA_DIR / "data.json")
 
-    scored_pool = _default_strategy().score(pool)
+    scored_pool = score_pool(pool)
 
     df = scored_pool.to_dataframe()
 
     # Strip raw stat columns before saving the checkpoint
     df_scores = df.drop(columns=RAW_STAT_COLS, errors="ignore")
 
-    file_repo.save_dataframe_as_json(DATA_DIR / "data_zscores.json", df_scores)
+    checkpoint.save_scored_pool(scored_pool, DATA_DIR / "data_zscores.json", export=df_scores)
     file_repo.save_csv(DATA_DIR / "fantasy_rankings.csv", df_scores)
+    history.record_scores(scored_pool)
+    db = checkpoint.database()
+    if db is not None:
+        db.save_scores(scored_pool.to_columns(), date.today().isoformat())
+        print(f"  Saved → {db.path}")
 
     print(f"\nRanking complete — {len(scored_pool)} players ranked.")
     print(f"Punt categories: {config.scoring.punt_categories or 'none'}")
+    print(f"Scoring cache: {scoring_cache.stats}")
+
+    if scenarios_path is not None:
+        print()
+        rank_scenarios(pool, scenarios_path)
+
+
+def rank_scenarios(pool: PlayerPool, scenarios_path: Path, show: int = 5) -> None:
+    """
+    Score *pool* under every scenario in *scenarios_path* and save
+    data/scenario_rankings.csv (one Total_Value column per scenario).
+    """
+    scenarios = load_scenarios(
+        file_repo.load_yaml(Path(scenarios_path)),
+        default_weights=config.scoring.category_weights,
+    )
+    result = score_scenarios(pool, scenarios, config.scoring.stats_source)
+
+    df = result.to_dataframe().round(3)
+    file_repo.save_csv(DATA_DIR / "scenario_rankings.csv", df)
+
+    names = dict(zip(result.player_ids.tolist(), result.names.tolist()))
+    for scenario, ranking in list(zip(result.scenario_names, result.rankings()))[:20]:
+        top = ", ".join(names[int(pid)] for pid in ranking[:show])
+        print(f"  {scenario:<24} {top}")
+    if len(result) > 20:
+        print(f"  ... and {len(result) - 20} more scenarios (see scenario_rankings.csv)")
+
+    print(
+        f"\nScenario ranking complete — {len(result.player_ids)} players "
+        f"× {len(result)} scenarios."
+    )
+
+
+# ---------------------------------------------------------------------------
+# punt — every punt build ranked for my_team → data/punt_search.csv
+# ---------------------------------------------------------------------------
+
+def punt(max_size: Optional[int] = None, top_n: int = 5, show: int = 10) -> None:
+    """
+    Score every punt build (or those punting ≤ *max_size* categories).
+
+    Ranks my_team's category totals against matchup_team and any
+    ``roster.league_teams`` under each build, with the top free agents.
+    """
+    print("=== Punt Search ===")
+    pool = player_ingestion.load_pool_from_file(DATA_DIR / "data.json")
+
+    league = {
+        "my_team": config.roster.my_team,
+        "matchup_team": config.roster.matchup_team,
+        **config.roster.league_teams,
+    }
+    result = search_punts(
+        pool,
+        config.scoring.category_weights,
+        league,
+        "my_team",
+        max_size=max_size,
+        top_n=top_n,
+        stats_source=config.scoring.stats_source,
+    )
+
+    df = result.to_dataframe()
+    file_repo.save_csv(DATA_DIR / "punt_search.csv", df)
+
+    print(f"\n  Category ranks (of {len(league)} teams): " + ", ".join(
+        f"{cat} {r}" for cat, r in result.category_ranks.items()
+    ))
+    print("  Best builds:")
+    for row in df.head(show).itertuples(index=False):
+        print(
+            f"    {row.punt:<22} rank {row.league_rank:>2}  "
+            f"total {row.my_total:>8.2f}  margin {row.margin:+8.2f}  | {row.top_free_agents}"
+        )
+    print(f"\nPunt search complete — {len(result)} builds scored.")
 
 
 # ---------------------------------------------------------------------------
@@ -79,12 +235,14 @@ def rank() -> None:
 
 def roster() -> None:
     """Slice the scored pool for my_team and matchup_team, save all outputs."""
-    raw = file_repo.load_json(DATA_DIR / "data_zscores.json")
-    scored_pool = ScoredPool.from_zscores_dict(raw)
-
     my_roster      = Roster("my_team",      config.roster.my_team)
     matchup_roster = Roster("matchup_team", config.roster.matchup_team)
 
+    # With an up-to-date SQLite store only the rostered players are read
+    scored_pool = checkpoint.load_scored_players(
+        DATA_DIR / "data_zscores.json", my_roster.player_ids + matchup_roster.player_ids
+    )
+
     my_snap      = roster_ingestion.build_roster_snapshot(scored_pool, my_roster)
     matchup_snap = roster_ingestion.build_roster_snapshot(scored_pool, matchup_roster)
 
@@ -96,11 +254,9 @@ def roster() -> None:
     cumulative = {"TEAM_CATEGORY_STATS": {"name": "TEAM", **my_snap.category_totals}}
     file_repo.save_json(DATA_DIR / "data_myteam_cumulative.json", cumulative)
 
-    # --- CSV: my team slice from the full rankings ---
-    rankings_path = DATA_DIR / "fantasy_rankings.csv"
-    if rankings_path.exists():
-        import pandas as pd
-        df = pd.read_csv(rankings_path)
+    # --- CSV: my team's rows of fantasy_rankings.csv ---
+    df = scored_pool.to_dataframe()
+    if not df.empty:
         my_csv = df[df["player_id"].isin(set(config.roster.my_team))]
         file_repo.save_csv(DATA_DIR / "fantasy_rankings_myteam.csv", my_csv)
 
@@ -111,32 +267,92 @@ def roster() -> None:
     )
 
 
+# ---------------------------------------------------------------------------
+# top — best free agents, or one player's scores, stats and projections
+# ---------------------------------------------------------------------------
+
+def top(top_n: int = 20, player_id: Optional[int] = None) -> None:
+    """
+    Print the *top_n* free agents by Total_Value, or everything stored
+    about *player_id*. Both are index lookups when the SQLite store is
+    current (see ``checkpoint``), so nothing else is loaded.
+
+    :param top_n:     Number of free agents to list.
+    :param player_id: Instead, show this player's category scores, stat
+                      line and saved projections.
+    """
+    zscores = DATA_DIR / "data_zscores.json"
+    if player_id is not None:
+        scored = checkpoint.load_scored_players(zscores, [player_id])
+        player = checkpoint.load_player(DATA_DIR / "data.json", player_id)
+        if player_id not in scored and player is None:
+            print(f"  [WARN] Player {player_id} is not in the pool.")
+            return
+        if player_id in scored:
+            i = scored.row_of(player_id)
+            print(f"\n{scored.names[i]}  Total_Value {scored.total_value[i]:+.3f}")
+            scores = pd.DataFrame(scored.scores[i:i + 1], columns=scored.score_columns)
+            print(scores.to_string(index=False))
+        source = config.scoring.stats_source
+        stats = PlayerPool.from_players([player] if player else []).to_dataframe(source)
+        if not stats.empty:
+            print(f"\n{source}:")
+            print(stats.drop(columns=["player_id", "name"], errors="ignore").to_string(index=False))
+        projections = checkpoint.load_player_projections(
+            DATA_DIR / "daily_projections.json", player_id
+        )
+        if not projections.empty:
+            cols = [c for c in ("game_date", "Total_Value", "MIN", "play_prob") if c in projections]
+            print("\nProjections:")
+            print(projections[cols].to_string(index=False))
+        return
+
+    free_agents = checkpoint.load_top_scored(
+        zscores, top_n, exclude_ids=config.roster.my_team + _unavailable_ids()
+    )
+    df = free_agents.to_dataframe()
+    print(f"\nTop {len(df)} free agents:")
+    print(df[["player_id", "name", "Total_Value"]].to_string(index=False))
+
+
 # ---------------------------------------------------------------------------
 # evaluate — rank free-agent replacements → data/data_top_n_replacements.json
 # ---------------------------------------------------------------------------
 
-def evaluate(drop_candidate_id: Optional[int] = None, top_n: int = 50) -> None:
+def evaluate(
+    drop_candidate_id: Optional[int] = None,
+    top_n: int = 50,
+    all_roster: bool = False,
+) -> None:
     """
     Evaluate replacement candidates for a drop candidate.
 
-    Loads the scored-pool checkpoint (data_zscores.json) and builds the
+    Loads the scored-pool checkpoint (data_zscores.npz) and builds the
     roster snapshot in memory — no dependency on data_myteam.json.
+    Candidates are free agents: not on my_team, matchup_team or any
+    ``roster.league_teams`` team.
 
     :param drop_candidate_id: Overrides config.roster.drop_candidate when provided.
     :param top_n:             Number of top candidates to output.
+    :param all_roster:        Evaluate every my_team player against every
+                              free agent instead (see :func:`evaluate_roster`).
     """
+    if all_roster:
+        evaluate_roster()
+        return
+
     player_to_drop = int(drop_candidate_id or config.roster.drop_candidate)
     print(f"  Drop candidate: {player_to_drop}")
 
-    raw = file_repo.load_json(DATA_DIR / "data_zscores.json")
-    scored_pool = ScoredPool.from_zscores_dict(raw)
+    scored_pool = checkpoint.load_scored_pool(DATA_DIR / "data_zscores.json")
 
     my_roster   = Roster("my_team", config.roster.my_team)
     my_snapshot = roster_ingestion.build_roster_snapshot(scored_pool, my_roster)
 
     try:
         result = evaluate_replacements(
-            scored_pool, player_to_drop, my_snapshot, top_n=top_n
+            scored_pool, player_to_drop, my_snapshot, top_n=top_n,
+            excluded_ids=config.roster.my_team + _unavailable_ids(),
         )
     except ValueError as e:
         print(f"  [ERROR] {e}")
@@ -158,32 +374,181 @@ def evaluate(drop_candidate_id: Optional[int] = None, top_n: int = 50) -> None:
     print(f"\nEvaluation complete — top {len(output)} replacements saved.")
 
 
+def _pair_to_dict(result: EvaluationResult) -> dict:
+    """Serialise a single-pair EvaluationResult (drop → add)."""
+    opt = result.replacements[0]
+    return {
+        "drop_id": result.drop_candidate.player.player_id,
+        "drop_name": result.drop_candidate.player.name,
+        "add_id": opt.candidate.player.player_id,
+        "add_name": opt.candidate.player.name,
+        "ValueAdded": opt.value_added,
+        "Total_Added_Value": opt.total_added_value,
+    }
+
+
+def evaluate_roster(top_n: int = 10) -> None:
+    """
+    Evaluate every my_team player as a drop against every free agent in one
+    pass and save data/data_roster_swaps.json (best pairs overall, best
+    pair per category, and the top adds for each drop candidate).
+
+    Free agents exclude my_team, matchup_team and ``roster.league_teams``.
+    """
+    scored_pool = checkpoint.load_scored_pool(DATA_DIR / "data_zscores.json")
+
+    my_snapshot = roster_ingestion.build_roster_snapshot(
+        scored_pool, Roster("my_team", config.roster.my_team)
+    )
+
+    try:
+        result = evaluate_roster_swaps(
+            scored_pool, my_snapshot,
+            excluded_ids=_unavailable_ids(), top_n=top_n,
+        )
+    except ValueError as e:
+        print(f"  [ERROR] {e}")
+        return
+
+    output = {
+        "best_pairs": [_pair_to_dict(r) for r in result.best_pairs],
+        "best_by_category": {
+            cat: _pair_to_dict(r) for cat, r in result.best_by_category.items()
+        },
+        "by_drop": {
+            str(pid): {
+                "name": r.drop_candidate.player.name,
+                "replacements": {
+                    str(opt.candidate.player.player_id): {
+                        "name": opt.candidate.player.name,
+                        "Total_Added_Value": opt.total_added_value,
+                    }
+                    for opt in r.replacements
+                },
+            }
+            for pid, r in result.by_drop.items()
+        },
+    }
+    file_repo.save_json(DATA_DIR / "data_roster_swaps.json", output)
+
+    print("\n  Best drop → add pairs:")
+    for pair in output["best_pairs"][:5]:
+        print(
+            f"    {pair['drop_name']:<24} → {pair['add_name']:<24} "
+            f"{pair['Total_Added_Value']:+.3f}"
+        )
+    print(
+        f"\nRoster evaluation complete — {len(result.drop_ids)} drops "
+        f"× {len(result.add_ids)} free agents."
+    )
+
+
+# ---------------------------------------------------------------------------
+# trade — multi-player trades with matchup_team → data/data_trades.json
+# ---------------------------------------------------------------------------
+
+def trade(top_n: int = 20, min_partner_gain: Optional[float] = 0.0) -> None:
+    """
+    Search 2-for-1, 2-for-2 and 3-for-2 trades between my_team and
+    matchup_team and save the best packages.
+
+    :param top_n:            Number of trades to output.
+    :param min_partner_gain: Only keep trades the partner does not lose
+                             Total_Value on (``None`` disables the check).
+    """
+    scored_pool = checkpoint.load_scored_pool(DATA_DIR / "data_zscores.json")
+
+    my_snap      = roster_ingestion.build_roster_snapshot(
+        scored_pool, Roster("my_team", config.roster.my_team)
+    )
+    partner_snap = roster_ingestion.build_roster_snapshot(
+        scored_pool, Roster("matchup_team", config.roster.matchup_team)
+    )
+
+    try:
+        result = evaluate_trades(
+            scored_pool, my_snap, partner_snap,
+            top_n=top_n, min_partner_gain=min_partner_gain,
+            excluded_ids=_unavailable_ids(),
+        )
+    except ValueError as e:
+        print(f"  [ERROR] {e}")
+        return
+
+    output = [
+        {
+            "give": {str(p.player.player_id): p.player.name for p in opt.give},
+            "receive": {str(p.player.player_id): p.player.name for p in opt.receive},
+            "CategoryDelta": opt.category_delta,
+            "Total_Delta": opt.total_delta,
+            "Partner_Delta": opt.partner_delta,
+        }
+        for opt in result.options
+    ]
+    file_repo.save_json(DATA_DIR / "data_trades.json", output)
+
+    for opt in result.options[:5]:
+        give = ", ".join(p.player.name for p in opt.give)
+        recv = ", ".join(p.player.name for p in opt.receive)
+        print(f"    {opt.total_delta:+7.3f}  give [{give}] for [{recv}]")
+    print(
+        f"\nTrade search complete — {len(output)} trades saved "
+        f"({result.explored} packages scored"
+        f"{'' if result.complete else ', candidate cap reached'})."
+    )
+
+
 # ---------------------------------------------------------------------------
 # predict — daily projections → data/daily_projections*.json
 # ---------------------------------------------------------------------------
 
-def predict() -> None:
+def _daily_projection(
+    game_date: Optional[date] = None,
+) -> Optional[projection_ingestion.SlateProjection]:
+    """One day's (default today) injury-adjusted expected lines (``None`` if no games)."""
+    base_pool = player_ingestion.load_pool_from_file(DATA_DIR / "data.json")
+    return projection_ingestion.build_projection(base_pool, game_date)
+
+
+def _projected_scored_pool(game_date: Optional[date] = None) -> Optional[ScoredPool]:
+    """One day's injury-adjusted projections, scored (``None`` if no games)."""
+    projection = _daily_projection(game_date)
+    if projection is None:
+        return None
+
+    return score_pool(projection.pool)
+
+
+def predict(game_date: Optional[date] = None) -> None:
     """
     Build injury-adjusted daily projections, score them, and save three
     output files (all players, my team, matchup team).
+
+    :param game_date: Day to project (default today); any day of the
+                      season works offline once the schedule is indexed.
     """
     print("=== Daily Prediction ===")
 
-    base_pool = player_ingestion.load_pool_from_file(DATA_DIR / "data.json")
-
-    projected_pool = projection_ingestion.build_projected_pool(base_pool)
-    if projected_pool is None:
+    projection = _daily_projection(game_date)
+    if projection is None:
         return
 
-    scored_pool = _default_strategy().score(projected_pool)
-    df = scored_pool.to_dataframe()
+    # Expected lines, plus play probability and per-stat standard deviations
+    # from questionable / game-time-decision players (data/injuries.json)
+    df = score_pool(projection.pool).to_dataframe()
+    df = df.merge(projection.uncertainty_frame(), on="player_id", how="left")
     df = df.sort_values("Total_Value", ascending=False)
 
-    print("\nTop 20 Predicted Players for Tonight:")
+    print(f"\nTop 20 Predicted Players for {game_date or 'Tonight'}:")
     print(df[["name", "Total_Value", "MIN"]].head(20).to_string(index=False))
 
     # All players
     file_repo.save_dataframe_as_json(DATA_DIR / "daily_projections.json", df)
+    history.record_projection(df, game_date or date.today())
+    db = checkpoint.database()
+    if db is not None:
+        db.save_projections(df, (game_date or date.today()).isoformat())
+        print(f"  Saved → {db.path}")
 
     # My team
     my_ids  = set(config.roster.my_team)
@@ -202,3 +567,340 @@ def predict() -> None:
     print(f"\nMatchup Team Projections ({len(matchup_df)} players):")
     if not matchup_df.empty:
         print(matchup_df[["name", "Total_Value", "MIN"]].to_string(index=False))
+
+
+# ---------------------------------------------------------------------------
+# simulate — Monte Carlo matchup odds → data/matchup_simulation.json
+# ---------------------------------------------------------------------------
+
+def simulate(n_sims: int = 100_000, seed: Optional[int] = None) -> None:
+    """
+    Simulate today's my_team vs matchup_team from the daily projection
+    files written by ``predict`` and save win probabilities.
+
+    :param n_sims: Number of simulated days.
+    :param seed:   Seed for reproducible results.
+    """
+    frames = {}
+    for label in ("myteam", "matchup"):
+        path = DATA_DIR / f"daily_projections_{label}.json"
+        if not path.exists():
+            print(f"  [ERROR] {path} not found. Run `python main.py predict` first.")
+            return
+        frames[label] = pd.DataFrame.from_dict(file_repo.load_json(path), orient="index")
+
+    result = matchup_sim.simulate(
+        matchup_sim.lines_from_dataframe(frames["myteam"]),
+        matchup_sim.lines_from_dataframe(frames["matchup"]),
+        n_sims=n_sims,
+        seed=seed,
+    )
+    file_repo.save_json(DATA_DIR / "matchup_simulation.json", result.to_dict())
+
+    for cat, p in result.category_win_prob.items():
+        print(f"    {cat:<5} {p:6.1%}")
+    print(
+        f"\nSimulation complete — win {result.win_prob:.1%}, "
+        f"tie {result.tie_prob:.1%}, loss {result.loss_prob:.1%} "
+        f"({n_sims} simulations)."
+    )
+
+
+# ---------------------------------------------------------------------------
+# lineup — today's start/sit decisions → data/daily_lineup.json
+# ---------------------------------------------------------------------------
+
+def lineup(objective: str = "value", game_date: Optional[date] = None) -> None:
+    """
+    Set a day's (default today) my_team lineup from the projected, scored pool.
+
+    :param objective: ``"value"`` maximises weighted category value
+                      (Total_Value); ``"win_prob"`` maximises simulated
+                      win probability against matchup_team.
+    :param game_date: Day to set the lineup for (default today).
+    """
+    print("=== Daily Lineup ===")
+
+    scored_pool = _projected_scored_pool(game_date)
+    if scored_pool is None:
+        return
+
+    my_roster = Roster("my_team", config.roster.my_team)
+    if objective == "win_prob":
+        opp_lines = matchup_sim.roster_lines(
+            scored_pool.pool, Roster("matchup_team", config.roster.matchup_team)
+        )
+        result = optimize_lineup_for_matchup(
+            scored_pool, my_roster, opp_lines, slots=config.lineup.slots
+        )
+    else:
+        result = optimize_lineup(scored_pool, my_roster, slots=config.lineup.slots)
+
+    no_game = [pid for pid in config.roster.my_team if pid not in scored_pool]
+
+    output = {
+        "starters": [
+            {"slot": slot, "player_id": sp.player.player_id, "name": sp.player.name,
+             "Total_Value": sp.category_scores.total_value}
+            for slot, sp in result.starters
+        ],
+        "bench": [
+            {"player_id": sp.player.player_id, "name": sp.player.name,
+             "Total_Value": sp.category_scores.total_value}
+            for sp in result.bench
+        ],
+        "empty_slots": result.empty_slots,
+        "not_playing": no_game,
+        "objective": objective,
+        "matchup": result.matchup.to_dict() if result.matchup else None,
+    }
+    file_repo.save_json(DATA_DIR / "daily_lineup.json", output)
+
+    print("\n  Starters:")
+    for slot, sp in result.starters:
+        print(f"    {slot:<5} {sp.player.name:<26} {sp.category_scores.total_value:+.3f}")
+    if result.bench:
+        print("  Bench: " + ", ".join(sp.player.name for sp in result.bench))
+    if result.empty_slots:
+        print(f"  Empty slots: {', '.join(result.empty_slots)}")
+    if result.matchup:
+        print(f"  Simulated win probability: {result.matchup.win_prob:.1%}")
+    print(f"\nLineup complete — {len(result.starters)} starters, {len(no_game)} not playing.")
+
+
+# ---------------------------------------------------------------------------
+# plan — weekly lineups + streaming moves → data/weekly_plan.json
+# ---------------------------------------------------------------------------
+
+def plan(start: Optional[date] = None) -> None:
+    """
+    Plan this fantasy week's daily lineups and add/drop streaming moves.
+
+    Covers *start* (default today) through Sunday, within
+    ``streaming.max_adds``; only ``streaming.droppable`` (or the
+    drop_candidate) and newly added streamers are dropped. Each day is
+    valued from its own injury-adjusted projection (``project_range``),
+    z-scored against the full pool rather than that day's slate.
+    """
+    print("=== Weekly Streaming Plan ===")
+    start = start or date.today()
+
+    pool = player_ingestion.load_pool_from_file(DATA_DIR / "data.json")
+    scored_pool = score_pool(pool)
+
+    team_map = projection_ingestion.get_player_team_map()
+    if not team_map:
+        print("  [ERROR] Could not load player→team map. Aborting.")
+        return
+
+    print(f"  Loading schedule from {start}...")
+    schedule = projection_ingestion.fetch_week_schedule(start)
+    if not any(schedule.values()):
+        print("  [INFO] No games left this week. Nothing to plan.")
+        return
+
+    print(f"  Projecting {len(schedule)} day(s) through {max(schedule)}...")
+    projections = projection_ingestion.project_range(pool, start, max(schedule), team_map=team_map)
+    # Every slate on the full pool's scale, so a line is worth the same on
+    # a 4-game night as on a 12-game one
+    strategy = default_strategy()
+    reference = strategy.reference(pool)
+    daily_scores = {day: strategy.score(p.pool, reference) for day, p in projections.items()}
+
+    result = plan_week(
+        scored_pool,
+        Roster("my_team", config.roster.my_team),
+        schedule,
+        team_map,
+        max_adds=config.streaming.max_adds,
+        slots=config.lineup.slots,
+        droppable_ids=config.streaming.droppable or [config.roster.drop_candidate],
+        excluded_ids=_unavailable_ids(),
+        out_ids=projection_ingestion.load_out_player_ids(),
+        daily_scores=daily_scores,
+    )
+
+    output = {
+        "total_value": result.total_value,
+        "baseline_value": result.baseline_value,
+        "moves": [
+            {"day": m.day.isoformat(),
+             "drop": {"player_id": m.drop.player.player_id, "name": m.drop.player.name},
+             "add": {"player_id": m.add.player.player_id, "name": m.add.player.name}}
+            for m in result.moves
+        ],
+        "days": [
+            {"day": d.day.isoformat(),
+             "starters": [
+                 {"slot": slot, "player_id": sp.player.player_id, "name": sp.player.name}
+                 for slot, sp in d.lineup.starters
+             ],
+             "value": d.lineup.objective}
+            for d in result.days
+        ],
+    }
+    file_repo.save_json(DATA_DIR / "weekly_plan.json", output)
+
+    print(f"\n  Moves ({len(result.moves)}/{config.streaming.max_adds} adds):")
+    for m in result.moves:
+        print(f"    {m.day:%a %m-%d}  drop {m.drop.player.name:<24} add {m.add.player.name}")
+    if not result.moves:
+        print("    (none — no stream beats holding the current roster)")
+    for d in result.days:
+        print(f"  {d.day:%a %m-%d}: {len(d.lineup.starters):>2} starters, value {d.lineup.objective:+.2f}")
+    print(
+        f"\nPlan complete — week value {result.total_value:.2f} "
+        f"({result.gain:+.2f} vs. no moves, {result.explored} plans explored)."
+    )
+
+
+# ---------------------------------------------------------------------------
+# schedule — season schedule index → data/schedule_<season>.json
+# ---------------------------------------------------------------------------
+
+def schedule(start: Optional[date] = None) -> None:
+    """
+    Refresh the season schedule index and summarise the fantasy week
+    containing *start* (default today): games, back-to-backs and games
+    remaining per team.
+    """
+    print("=== Season Schedule ===")
+    start = start or date.today()
+
+    season_schedule = schedule_ingestion.load_season_schedule(refresh=True)
+    if not len(season_schedule):
+        return
+
+    monday = start - timedelta(days=start.weekday())
+    sunday = monday + timedelta(days=6)
+    week_games = season_schedule.game_counts(monday, sunday)
+
+    teams = [
+        {
+            "team_id": team_id,
+            "games_this_week": week_games.get(team_id, 0),
+            "back_to_backs": [d.isoformat() for d in season_schedule.back_to_backs(team_id, monday, sunday)],
+            "games_remaining": season_schedule.games_remaining(team_id, start),
+        }
+        for team_id in season_schedule.teams
+    ]
+    teams.sort(key=lambda t: (-t["games_this_week"], t["team_id"]))
+    file_repo.save_json(DATA_DIR / "week_schedule.json", {
+        "season": season_schedule.season,
+        "week_start": monday.isoformat(),
+        "week_end": sunday.isoformat(),
+        "teams": teams,
+    })
+
+    print(f"\n  Games per team, week of {monday}:")
+    for t in teams:
+        b2b = f"  (B2B {', '.join(t['back_to_backs'])})" if t["back_to_backs"] else ""
+        print(f"    {t['team_id']:<12} {t['games_this_week']}  {t['games_remaining']:>3} left{b2b}")
+    print(
+        f"\nSchedule complete — {len(season_schedule)} games indexed "
+        f"({season_schedule.first_day} to {season_schedule.last_day})."
+    )
+
+
+# ---------------------------------------------------------------------------
+# history — as-of rankings / player trajectories from data/history
+# ---------------------------------------------------------------------------
+
+def history_report(as_of: Optional[date] = None, player_id: Optional[int] = None) -> None:
+    """
+    Query the snapshot history written by ``pull`` / ``rank`` / ``predict``.
+
+    :param as_of:     Save the rankings as they stood at the end of this day
+                      (default today) → data/rankings_as_of.csv.
+    :param player_id: Instead, save this player's score and stat trajectory
+                      → data/player_history.csv.
+    """
+    print("=== Snapshot History ===")
+    store = history.store()
+    if store is None:
+        print("  [WARN] history.enabled is off in config.yaml — nothing recorded.")
+        return
+    for kind in (history.POOL, history.SCORES, history.PROJECTIONS):
+        snapshots = store.snapshots(kind)
+        if snapshots:
+            print(
+                f"  {kind:<12} {len(snapshots):>4} snapshots  "
+                f"{snapshots[0].taken_at:%Y-%m-%d} → {snapshots[-1].taken_at:%Y-%m-%d}"
+            )
+    if not store.snapshots(history.SCORES):
+        print("  [WARN] No rankings recorded yet — run rank first.")
+        return
+
+    if player_id is not None:
+        df = history.player_history(player_id, config.scoring.stats_source)
+        if df.empty:
+            print(f"  [WARN] Player {player_id} has no recorded history.")
+            return
+        file_repo.save_csv(DATA_DIR / "player_history.csv", df)
+        print(f"\n  {len(df)} recorded changes for player {player_id}.")
+        return
+
+    as_of = as_of or date.today()
+    scored_pool = history.scores_as_of(as_of)
+    if scored_pool is None:
+        print(f"  [WARN] Nothing was ranked by {as_of}.")
+        return
+    df = scored_pool.to_dataframe().sort_values("Total_Value", ascending=False)
+    file_repo.save_csv(DATA_DIR / "rankings_as_of.csv", df)
+    print(f"\nTop 10 as of {as_of}:")
+    print(df[["name", "Total_Value"]].head(10).to_string(index=False))
+
+
+# ---------------------------------------------------------------------------
+# portfolio — mean–variance roster construction → data/portfolio.json
+# ---------------------------------------------------------------------------
+
+def portfolio(risk_ratio: Optional[float] = 1.0, max_swaps: int = 2) -> None:
+    """
+    Find the best roster within *max_swaps* swaps whose risk (output
+    variance) is at most *risk_ratio* × my current roster's, plus the efficient frontier.
+    """
+    print("=== Portfolio Optimisation ===")
+    pool = player_ingestion.load_pool_from_file(DATA_DIR / "data.json")
+
+    result = optimize_portfolio(
+        pool,
+        Roster("my_team", config.roster.my_team),
+        config.scoring.category_weights,
+        punt_categories=config.scoring.punt_categories,
+        excluded_ids=_unavailable_ids(),
+        max_swaps=max_swaps,
+        risk_ratio=risk_ratio,
+        stats_source=config.scoring.stats_source,
+    )
+
+    def name(pid: int) -> str:
+        player = pool.get(pid)
+        return player.name if player is not None else str(pid)
+
+    def to_dict(r: PortfolioRoster) -> dict:
+        return {
+            "mean": round(r.mean, 3),
+            "risk": round(r.risk, 3),
+            "drops": [{"player_id": p, "name": name(p)} for p in r.drops],
+            "adds": [{"player_id": p, "name": name(p)} for p in r.adds],
+        }
+
+    file_repo.save_json(DATA_DIR / "portfolio.json", {
+        "current": to_dict(result.current),
+        "best": to_dict(result.best),
+        "max_risk": result.max_risk,
+        "frontier": [to_dict(r) for r in result.frontier],
+    })
+
+    best = result.best
+    print(f"\n  Current roster: mean {result.current.mean:.2f}, risk {result.current.risk:.1f}")
+    print(f"  Best roster:    mean {best.mean:.2f}, risk {best.risk:.1f}")
+    for pid in best.drops:
+        print(f"    drop {name(pid)}")
+    for pid in best.adds:
+        print(f"    add  {name(pid)}")
+    print(
+        f"\nPortfolio complete — {result.n_scored} rosters scored, "
+        f"{len(result.frontier)} on the efficient frontier."
+    )
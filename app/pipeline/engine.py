@@ -0,0 +1,285 @@
+"""
+app/pipeline/engine.py
+~~~~~~~~~~~~~~~~~~~~~~~
+Incremental stage runner for ``main.py all``.
+
+Each :class:`Stage` declares the files it reads, the config.yaml sections
+and arguments it depends on, the files it writes and the stages it runs
+after. Before running a stage the engine fingerprints those inputs; the
+stage is skipped when the fingerprint matches the one recorded on its
+last successful run and its outputs are still exactly as that run left
+them. Fingerprints are kept in ``data/pipeline_state.json``.
+
+Stages whose upstream stages are all finished run concurrently (e.g.
+``roster`` and ``evaluate`` after ``rank``); each stage's console output
+is buffered and printed as one block when it finishes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.config import DATA_DIR, config
+from app.repository import file_repository as file_repo
+
+STATE_FILE = DATA_DIR / "pipeline_state.json"
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One pipeline step.
+
+    :param name:    Stage name (the CLI command it runs).
+    :param run:     Runs the stage.
+    :param inputs:  Files read (relative to ``data/``, or absolute); missing
+                    files count as an input state too.
+    :param config:  config.yaml sections the stage depends on.
+    :param outputs: Files written (relative to ``data/``).
+    :param after:   Stages that must finish first.
+    :param params:  Arguments that change the stage's result (CLI flags).
+    :param always:  Never skipped (e.g. ``pull``, whose input is the NBA API).
+    """
+
+    name: str
+    run: Callable[[], None]
+    inputs: Tuple[str, ...] = ()
+    config: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    after: Tuple[str, ...] = ()
+    params: dict = field(default_factory=dict)
+    always: bool = False
+
+
+@dataclass
+class StageStatus:
+    """Whether a stage needs to run, and why."""
+
+    stage: Stage
+    fingerprint: str
+    inputs: Dict[str, dict]
+    reasons: List[str]
+
+    @property
+    def stale(self) -> bool:
+        return bool(self.reasons)
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+def file_fingerprint(path: Path) -> Optional[str]:
+    """
+    Content hash of *path* (``None`` if missing). ``.npz`` checkpoints are
+    hashed by their arrays, since the archive stamps write times.
+    """
+    if path.suffix != ".npz":
+        return file_repo.content_hash(path)
+    if not path.exists():
+        return None
+    h = hashlib.sha256()
+    try:
+        schema, arrays = file_repo.load_columnar(path)
+    except ValueError:
+        return file_repo.content_hash(path)
+    h.update(json.dumps(schema, sort_keys=True).encode("utf-8"))
+    for name in sorted(arrays):
+        array = arrays[name]
+        h.update(f"{name}:{array.dtype.str}:{array.shape}".encode("utf-8"))
+        h.update(array.tobytes())
+    return h.hexdigest()
+
+
+def _hash_json(data) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _input_state(stage: Stage) -> Dict[str, dict]:
+    return {
+        "files": {name: file_fingerprint(DATA_DIR / name) for name in stage.inputs},
+        "config": {section: _hash_json(asdict(getattr(config, section))) for section in stage.config},
+        "params": {k: _hash_json(v) for k, v in stage.params.items()},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Thread-local console output
+# ---------------------------------------------------------------------------
+
+class _StageOutput(io.TextIOBase):
+    """``sys.stdout`` stand-in that sends a worker thread's prints to its own buffer."""
+
+    def __init__(self, console) -> None:
+        self.console = console
+        self.local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.console).write(text)
+
+    def flush(self) -> None:
+        self.console.flush()
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+class Pipeline:
+    """
+    A DAG of stages, run incrementally.
+
+    :param stages:     Stages in a valid (topological) order.
+    :param state_path: Where fingerprints of past runs are kept.
+    """
+
+    def __init__(self, stages: List[Stage], state_path: Path = STATE_FILE) -> None:
+        self.stages = {s.name: s for s in stages}
+        self.state_path = state_path
+        seen: List[str] = []
+        for s in stages:
+            unknown = [d for d in s.after if d not in seen]
+            if unknown:
+                raise ValueError(f"Stage {s.name!r} runs after {unknown}, which are not listed before it")
+            seen.append(s.name)
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def _load_state(self) -> Dict[str, dict]:
+        if not self.state_path.exists():
+            return {}
+        try:
+            return file_repo.load_json(self.state_path)
+        except ValueError:
+            print(f"  [WARN] Ignoring unreadable {self.state_path.name}; every stage will run.")
+            return {}
+
+    def status(self, name: str, state: Optional[Dict[str, dict]] = None) -> StageStatus:
+        """Fingerprint *name*'s inputs now and compare with its last run."""
+        stage = self.stages[name]
+        inputs = _input_state(stage)
+        fingerprint = _hash_json(inputs)
+        previous = (state if state is not None else self._load_state()).get(name)
+
+        reasons: List[str] = []
+        if stage.always:
+            reasons.append("always runs")
+        elif previous is None:
+            reasons.append("no previous run")
+        elif previous["fingerprint"] != fingerprint:
+            before = previous.get("inputs", {})
+            for kind, label in (("files", "input"), ("config", "config"), ("params", "argument")):
+                for key, value in inputs[kind].items():
+                    if before.get(kind, {}).get(key) != value:
+                        reasons.append(f"{label} {key} changed")
+            reasons = reasons or ["inputs changed"]
+        else:
+            for out, digest in previous.get("outputs", {}).items():
+                if file_fingerprint(DATA_DIR / out) != digest:
+                    reasons.append(f"output {out} missing or modified")
+        return StageStatus(stage, fingerprint, inputs, reasons)
+
+    def explain(self) -> None:
+        """Print which stages would run and why, without running anything."""
+        state = self._load_state()
+        pending: List[str] = []
+        print("  Stage       Status")
+        for name, stage in self.stages.items():
+            status = self.status(name, state)
+            upstream = [d for d in stage.after if d in pending]
+            if status.stale:
+                pending.append(name)
+                print(f"  {name:<11} run       {'; '.join(status.reasons)}")
+            elif upstream:
+                pending.append(name)
+                print(f"  {name:<11} recheck   up to date now; rechecked after {', '.join(upstream)} runs")
+            else:
+                print(f"  {name:<11} skip      up to date")
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run(self, force: bool = False, max_workers: int = 4) -> bool:
+        """
+        Run every stale stage (all of them with *force*), each once its
+        upstream stages have finished.
+
+        :returns: ``True`` if no stage failed.
+        """
+        state = self._load_state()
+        done: Dict[str, bool] = {}          # name → succeeded
+        running: Dict[Future, StageStatus] = {}
+        console = sys.stdout
+        output = _StageOutput(console)
+        lock = threading.Lock()
+        sys.stdout = output
+
+        def execute(stage: Stage) -> None:
+            output.local.buffer = io.StringIO()
+            try:
+                stage.run()
+            finally:
+                text = output.local.buffer.getvalue()
+                output.local.buffer = None
+                with lock:
+                    console.write(f"\n=== {stage.name.upper()} ===\n{text}")
+                    console.flush()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                while len(done) < len(self.stages):
+                    for name, stage in self.stages.items():
+                        if name in done or any(st.stage.name == name for st in running.values()):
+                            continue
+                        if any(d not in done for d in stage.after):
+                            continue
+                        if not all(done[d] for d in stage.after):
+                            print(f"  [WARN] Skipping {name}: an upstream stage failed.")
+                            done[name] = False
+                            continue
+                        status = self.status(name, state)
+                        if not (force or status.stale):
+                            print(f"  [INFO] {name}: up to date — skipped.")
+                            done[name] = True
+                            continue
+                        reason = "forced" if force else "; ".join(status.reasons)
+                        print(f"  [INFO] {name}: running ({reason}).")
+                        running[pool.submit(execute, stage)] = status
+
+                    if not running:
+                        continue
+                    finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        status = running.pop(future)
+                        name = status.stage.name
+                        error = future.exception()
+                        if error is not None:
+                            print(f"  [ERROR] {name} failed: {error}")
+                            state.pop(name, None)
+                            done[name] = False
+                            continue
+                        # Inputs as fingerprinted before the run; outputs as written
+                        state[name] = {
+                            "fingerprint": status.fingerprint,
+                            "inputs": status.inputs,
+                            "outputs": {o: file_fingerprint(DATA_DIR / o) for o in status.stage.outputs},
+                        }
+                        done[name] = True
+                    file_repo.write_bytes(
+                        self.state_path, json.dumps(state, indent=2, sort_keys=True).encode("utf-8")
+                    )
+        finally:
+            sys.stdout = console
+        return all(done.values())
@@ -0,0 +1,76 @@
+"""
+app/pipeline/stages.py
+~~~~~~~~~~~~~~~~~~~~~~~
+The ``main.py all`` pipeline as a stage DAG::
+
+    pull → rank → roster
+                → evaluate
+
+``pull`` always runs (its input is the NBA API). Because unchanged output
+files are not rewritten and ``.npz`` checkpoints are fingerprinted by
+content, a pull that brings no new stats leaves ``rank``, ``roster`` and
+``evaluate`` skipped.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+from app.pipeline import commands
+from app.pipeline.engine import Pipeline, Stage
+
+_POOL = ("data.json", "data.npz")
+_SCORES = ("data_zscores.json", "data_zscores.npz")
+
+
+def default_pipeline(
+    incremental: bool = False,
+    drop_candidate_id: Optional[int] = None,
+    all_roster: bool = False,
+    scenarios_path: Optional[Path] = None,
+) -> Pipeline:
+    """The pull → rank → roster / evaluate pipeline, with the CLI's arguments."""
+    evaluate_outputs = ("data_roster_swaps.json",) if all_roster else ("data_top_n_replacements.json",)
+    # A scenarios file (outside data/) is an input by its absolute path
+    scenarios = (str(Path(scenarios_path).resolve()),) if scenarios_path is not None else ()
+    return Pipeline([
+        Stage(
+            name="pull",
+            run=partial(commands.pull, incremental=incremental),
+            config=("season",),
+            outputs=_POOL,
+            params={"incremental": incremental},
+            always=True,
+        ),
+        Stage(
+            name="rank",
+            run=partial(commands.rank, scenarios_path=scenarios_path),
+            inputs=_POOL + scenarios,
+            config=("scoring", "storage"),
+            outputs=_SCORES + ("fantasy_rankings.csv",)
+            + (("scenario_rankings.csv",) if scenarios else ()),
+            after=("pull",),
+        ),
+        Stage(
+            name="roster",
+            run=commands.roster,
+            inputs=_SCORES,
+            config=("roster", "storage"),
+            outputs=(
+                "data_myteam.json", "data_matchup.json",
+                "data_myteam_cumulative.json", "fantasy_rankings_myteam.csv",
+            ),
+            after=("rank",),
+        ),
+        Stage(
+            name="evaluate",
+            run=partial(commands.evaluate, drop_candidate_id=drop_candidate_id, all_roster=all_roster),
+            inputs=_SCORES,
+            config=("roster",),
+            outputs=evaluate_outputs,
+            after=("rank",),
+            params={"drop_candidate_id": drop_candidate_id, "all_roster": all_roster},
+        ),
+    ])
@@ -8,14 +8,37 @@ in the pipeline commands that call these functions.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
+import struct
+import tempfile
+import zipfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import yaml
 
 from app.config import DATA_DIR
 
+# Archive member holding the JSON schema header of a columnar checkpoint
+SCHEMA_KEY = "__schema__"
+
+# Fixed part of a zip local file header (signature … extra field length)
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+# Per-directory record of the text outputs written through write_bytes
+MANIFEST_NAME = "manifest.json"
+_manifest_lock = Lock()
+
+# Temp files are created 0600; renamed files get the usual umask mode.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 # ---------------------------------------------------------------------------
 # Generic primitives
@@ -33,11 +56,23 @@ def load_json(path: Path) -> dict:
         return json.load(f)
 
 
+def load_yaml(path: Path) -> dict:
+    """
+    Load and parse a YAML file.
+
+    :raises FileNotFoundError: if *path* does not exist.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
 def save_json(path: Path, data: Any, indent: int = 4) -> None:
-    """Serialise *data* to *path* as JSON."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
-    print(f"  Saved → {path}")
+    """Serialise *data* to *path* as JSON (skipped if the content is unchanged)."""
+    _report(path, write_bytes(
+        path, json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+    ))
 
 
 def save_dataframe_as_json(
@@ -46,23 +81,204 @@ def save_dataframe_as_json(
     index_col: str = "player_id",
 ) -> None:
     """
-    Write a DataFrame to JSON keyed by *index_col*.
+    Write a DataFrame to JSON keyed by *index_col* (skipped if the content
+    is unchanged).
 
     Output shape: ``{ "<player_id>": { col: val, … }, … }``
     """
     if df.empty:
         return
-    out = df.copy()
+    out = df
     if out.index.name != index_col and index_col in out.columns:
         out = out.set_index(index_col)
-    out.to_json(path, orient="index", indent=4)
-    print(f"  Saved → {path}")
+    _report(path, write_bytes(path, out.to_json(orient="index", indent=4).encode("utf-8")))
 
 
 def save_csv(path: Path, df: pd.DataFrame, index: bool = False) -> None:
-    """Write a DataFrame to CSV."""
-    df.to_csv(path, index=index)
-    print(f"  Saved → {path}")
+    """Write a DataFrame to CSV (skipped if the content is unchanged)."""
+    _report(path, write_bytes(path, df.to_csv(index=index).encode("utf-8")))
+
+
+def _report(path: Path, written: bool) -> None:
+    print(f"  Saved → {path}" if written else f"  Unchanged → {path}")
+
+
+# ---------------------------------------------------------------------------
+# Atomic writes and the output manifest
+# ---------------------------------------------------------------------------
+
+def _atomic_write(path: Path, write: Callable[[Any], None]) -> None:
+    """
+    Run *write* on a temporary file next to *path*, then rename it into
+    place, so readers see either the old file or the new one — never a
+    partial write.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_bytes(path: Path, data: bytes) -> bool:
+    """
+    Atomically write *data* to *path* unless the file already holds exactly
+    these bytes, and record the content hash in the directory's
+    ``manifest.json``.
+
+    :returns: Whether the file was (re)written.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    if content_hash(path) == digest:
+        return False
+    _atomic_write(path, lambda f: f.write(data))
+    _record(path, digest)
+    return True
+
+
+def load_manifest(directory: Path) -> Dict[str, dict]:
+    """
+    ``{file name: {"sha256", "size", "mtime_ns"}}`` for the files written
+    through :func:`write_bytes` in *directory* (empty if none).
+    """
+    path = directory / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def content_hash(path: Path) -> Optional[str]:
+    """
+    SHA-256 of *path*'s content, or ``None`` if it does not exist.
+
+    Taken from the manifest when the file's size and mtime still match
+    the recorded ones; otherwise the file is read and hashed.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    entry = load_manifest(path.parent).get(path.name)
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry["sha256"]
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _record(path: Path, digest: str) -> None:
+    stat = path.stat()
+    with _manifest_lock:
+        manifest = load_manifest(path.parent)
+        manifest[path.name] = {
+            "sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+        }
+        data = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+        _atomic_write(path.parent / MANIFEST_NAME, lambda f: f.write(data))
+
+
+# ---------------------------------------------------------------------------
+# Columnar checkpoints
+# ---------------------------------------------------------------------------
+
+def load_npz(path: Path) -> Dict[str, np.ndarray]:
+    """
+    Load every array from an ``.npz`` archive into memory.
+
+    :raises FileNotFoundError: if *path* does not exist.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    with np.load(path, allow_pickle=False) as archive:
+        return {name: archive[name] for name in archive.files}
+
+
+def save_npz(path: Path, arrays: Dict[str, np.ndarray], schema: Optional[dict] = None) -> None:
+    """
+    Write *arrays* to *path* as an uncompressed ``.npz`` archive.
+
+    Written to a temporary file first and renamed into place, so readers
+    never see a partial archive.
+
+    :param schema: Optional JSON-serialisable header, stored as the
+                   ``__schema__`` member (see :func:`load_columnar`).
+    """
+    if schema is not None:
+        arrays = {
+            SCHEMA_KEY: np.frombuffer(json.dumps(schema).encode("utf-8"), dtype=np.uint8),
+            **arrays,
+        }
+    _atomic_write(path, lambda f: np.savez(f, **arrays))
+
+
+def load_columnar(
+    path: Path, names: Optional[Iterable[str]] = None
+) -> Tuple[dict, Dict[str, np.ndarray]]:
+    """
+    Memory-map a checkpoint written by :func:`save_npz` with a schema.
+
+    Every member of an uncompressed ``.npz`` is a plain ``.npy`` file
+    stored as-is inside the zip, so each array is a read-only view
+    straight onto one shared mapping of *path*: nothing is parsed or
+    copied, and pages are only read from disk when touched.
+
+    :param names: Arrays to return (column projection); default all.
+    :returns:     ``(schema, {name: array})``.
+    :raises FileNotFoundError: if *path* does not exist.
+    :raises ValueError: if *path* is not an uncompressed archive with a
+                        schema, or holds object arrays.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    wanted = None if names is None else set(names) | {SCHEMA_KEY}
+
+    arrays: Dict[str, np.ndarray] = {}
+    with open(path, "rb") as f, zipfile.ZipFile(f) as archive:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        for info in archive.infolist():
+            name = info.filename[:-len(".npy")]
+            if wanted is not None and name not in wanted:
+                continue
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path}: member {name!r} is compressed")
+
+            header = _ZIP_LOCAL_HEADER.unpack_from(buffer, info.header_offset)
+            f.seek(info.header_offset + _ZIP_LOCAL_HEADER.size + header[-2] + header[-1])
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ValueError(f"{path}: member {name!r} holds Python objects")
+            arrays[name] = np.ndarray(
+                shape, dtype=dtype, buffer=buffer, offset=f.tell(),
+                order="F" if fortran else "C",
+            )
+
+    if SCHEMA_KEY not in arrays:
+        raise ValueError(f"{path}: no {SCHEMA_KEY} header")
+    schema = json.loads(arrays.pop(SCHEMA_KEY).tobytes().decode("utf-8"))
+    return schema, arrays
+
+
+def is_newer(path: Path, than: Path) -> bool:
+    """Whether *path* exists and was written no earlier than *than* (or *than* is missing)."""
+    if not path.exists():
+        return False
+    return not than.exists() or path.stat().st_mtime >= than.stat().st_mtime
 
 
 # ---------------------------------------------------------------------------
@@ -71,7 +287,8 @@ def save_csv(path: Path, df: pd.DataFrame, index: bool = False) -> None:
 
 def load_team_map_cache() -> Optional[Dict[int, int]]:
     """
-    Load the cached player→team map.
+    Load the legacy player→team map cache (superseded by the repository's
+    response cache; still read as a fallback when the API is unreachable).
 
     :returns: ``{player_id: team_id}`` dict, or ``None`` if no cache exists.
     """
@@ -81,8 +298,3 @@ def load_team_map_cache() -> Optional[Dict[int, int]]:
     with open(path, "r") as f:
         raw = json.load(f)
     return {int(k): int(v) for k, v in raw.items()}
-
-
-def save_team_map_cache(team_map: Dict[int, int]) -> None:
-    """Persist the player→team map to the cache file."""
-    save_json(DATA_DIR / "team_map_cache.json", team_map)
@@ -2,22 +2,134 @@
 app/repository/nba_api_repository.py
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 All outbound NBA API calls live here. Returns raw pandas DataFrames or
-plain dicts — no business logic, no file I/O.
+plain dicts — no business logic; file I/O is limited to the response
+cache (``app/repository/response_cache.py``).
+
+Every stats request goes through :func:`_frame`:
+  1. the disk response cache, keyed by endpoint + parameters, with a
+     per-endpoint TTL (``http_cache.ttl_minutes``; finished seasons and
+     past dates never expire) and live / record / replay / off modes;
+  2. on a miss, a shared token bucket (``api.requests_per_second`` /
+     ``api.burst``) plus retry with exponential backoff.
+
+:func:`fetch_concurrently` runs several fetches in parallel under that
+same budget. ``api.base_url`` points the client at another host, e.g. a
+local stub server (see ``benchmarks/stub_stats_server.py``).
 """
 
 from __future__ import annotations
 
-import time
-from typing import Dict, Set
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
 
 import pandas as pd
 from nba_api.stats.endpoints import (
     commonallplayers,
     leaguedashplayerstats,
+    playerindex,
+    scheduleleaguev2,
     scoreboardv2,
 )
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.static import players
 
+from app.config import CACHE_DIR, config
+from app.repository.rate_limiter import TokenBucket, call_with_retry
+from app.repository.response_cache import ReplayMissError, ResponseCache
+
+T = TypeVar("T")
+
+# One budget for every request this process makes
+_limiter = TokenBucket(config.api.requests_per_second, config.api.burst)
+
+
+def set_base_url(base_url: Optional[str]) -> None:
+    """
+    Send stats requests to *base_url* (must contain ``{endpoint}``), or
+    back to stats.nba.com when ``None``.
+    """
+    NBAStatsHTTP.base_url = base_url or "https://stats.nba.com/stats/{endpoint}"
+
+
+if config.api.base_url:
+    set_base_url(config.api.base_url)
+
+
+# One response cache for every request this process makes
+_cache = ResponseCache(
+    Path(config.http_cache.directory) if config.http_cache.directory else CACHE_DIR / "http",
+    mode=config.http_cache.mode,
+)
+
+
+def set_cache_mode(mode: str) -> None:
+    """Switch the response cache to ``live``, ``record``, ``replay`` or ``off``."""
+    _cache.mode = mode
+
+
+def _ttl(kind: str) -> float:
+    """TTL in seconds for *kind* (a ``http_cache.ttl_minutes`` key)."""
+    return config.http_cache.ttl_minutes.get(kind, 0.0) * 60
+
+
+def _request(label: str, fn: Callable[[], T]) -> T:
+    """Run one API call under the shared rate limiter, with retries."""
+    return call_with_retry(
+        fn,
+        limiter=_limiter,
+        max_retries=config.api.max_retries,
+        backoff=config.api.backoff_seconds,
+        label=label,
+    )
+
+
+def _frame(
+    endpoint_cls: Any,
+    params: Dict[str, Any],
+    ttl_seconds: Optional[float],
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    First result set of ``endpoint_cls(**params)`` as a DataFrame, via the
+    response cache and (on a miss) the rate limiter.
+
+    :param ttl_seconds: Cache lifetime; ``None`` = never expires.
+    :param columns:     Keep only these columns (trims what is cached).
+    :raises Exception:  The last API error, or ReplayMissError in replay mode.
+    """
+    name = endpoint_cls.endpoint
+
+    def fetch() -> dict:
+        df = _request(name, lambda: endpoint_cls(
+            **params, timeout=config.api.timeout_seconds,
+        ).get_data_frames()[0])
+        if columns is not None:
+            df = df[columns]
+        return json.loads(df.to_json(orient="split", index=False))
+
+    payload = _cache.fetch(name, params, ttl_seconds, fetch)
+    return pd.DataFrame(payload["data"], columns=payload["columns"])
+
+
+def fetch_concurrently(tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    Run independent fetches in parallel (``api.max_workers`` threads).
+
+    Each task is one of this module's ``fetch_*`` functions (bound with
+    ``functools.partial`` or a lambda), so it is rate-limited and
+    retried individually; wall-clock time is bounded by the slowest
+    call rather than their sum.
+
+    :param tasks: ``{name: zero-argument callable}``.
+    :returns:     ``{name: result}``.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, config.api.max_workers)) as pool:
+        futures = {name: pool.submit(fn) for name, fn in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
 
 def fetch_league_stats(season: str, last_n_games: int = 0) -> pd.DataFrame:
     """
@@ -26,17 +138,19 @@ def fetch_league_stats(season: str, last_n_games: int = 0) -> pd.DataFrame:
     :param season: e.g. "2025-26"
     :param last_n_games: 0 = full season, N = last N games
     :returns: Raw DataFrame from leaguedashplayerstats, or empty DataFrame on error.
+    :raises ReplayMissError: In replay mode, when the response was not recorded.
     """
     last_n_str = str(last_n_games) if last_n_games > 0 else "0"
     print(f"  Fetching league stats — season={season}, last_n_games={last_n_str}...")
     try:
-        dash = leaguedashplayerstats.LeagueDashPlayerStats(
-            season=season,
-            last_n_games=last_n_str,
-            per_mode_detailed="PerGame",
-            measure_type_detailed_defense="Base",
-        )
-        return dash.get_data_frames()[0]
+        return _frame(leaguedashplayerstats.LeagueDashPlayerStats, {
+            "season": season,
+            "last_n_games": last_n_str,
+            "per_mode_detailed": "PerGame",
+            "measure_type_detailed_defense": "Base",
+        }, ttl_seconds=None if season != config.season.current else _ttl("league_stats"))
+    except ReplayMissError:
+        raise
     except Exception as e:
         print(f"  [ERROR] fetch_league_stats: {e}")
         return pd.DataFrame()
@@ -44,45 +158,114 @@ def fetch_league_stats(season: str, last_n_games: int = 0) -> pd.DataFrame:
 
 def fetch_active_players() -> list[dict]:
     """
-    Return the list of currently active NBA players from the static dataset.
+    Return the list of currently active NBA players from the static dataset
+    (bundled with nba_api — no request, so nothing to cache).
 
     :returns: List of player dicts with keys: id, full_name, etc.
     """
     return players.get_active_players()
 
 
+def fetch_player_positions(season: str) -> Dict[int, str]:
+    """
+    Fetch each player's listed NBA position for *season*.
+
+    :returns: Dict {player_id: position} with positions such as ``"G"``,
+              ``"F-C"`` or ``"G-F"``. Empty dict on error.
+    :raises ReplayMissError: In replay mode, when the response was not recorded.
+    """
+    print(f"  Fetching player positions — season={season}...")
+    try:
+        index = _frame(
+            playerindex.PlayerIndex, {"season": season},
+            ttl_seconds=None if season != config.season.current else _ttl("positions"),
+        )
+        return {
+            int(pid): str(pos)
+            for pid, pos in zip(index["PERSON_ID"], index["POSITION"])
+            if pos
+        }
+    except ReplayMissError:
+        raise
+    except Exception as e:
+        print(f"  [ERROR] fetch_player_positions: {e}")
+        return {}
+
+
 def fetch_player_team_map() -> Dict[int, int]:
     """
     Fetch a mapping of player_id -> team_id for all currently active players.
 
     :returns: Dict {player_id: team_id}. Empty dict on error.
+    :raises ReplayMissError: In replay mode, when the response was not recorded.
     """
     print("  Fetching player→team map from NBA API...")
     try:
-        all_players = commonallplayers.CommonAllPlayers(
-            is_only_current_season=1
-        ).get_data_frames()[0]
+        all_players = _frame(
+            commonallplayers.CommonAllPlayers, {"is_only_current_season": 1},
+            ttl_seconds=_ttl("team_map"),
+        )
         team_map = pd.Series(
             all_players.TEAM_ID.values, index=all_players.PERSON_ID
         ).to_dict()
         return {int(k): int(v) for k, v in team_map.items() if v > 0}
+    except ReplayMissError:
+        raise
     except Exception as e:
         print(f"  [ERROR] fetch_player_team_map: {e}")
         return {}
 
 
-def fetch_todays_playing_teams() -> Set[int]:
+def fetch_season_schedule(season: str) -> pd.DataFrame:
     """
-    Return the set of NBA Team IDs with a scheduled game today.
+    Fetch every regular-season game of *season* in one request.
+
+    :returns: DataFrame with ``GAME_DATE`` (``datetime.date``),
+              ``HOME_TEAM_ID`` and ``VISITOR_TEAM_ID``; empty on error.
+              Preseason, All-Star and playoff games are dropped.
+    :raises ReplayMissError: In replay mode, when the response was not recorded.
+    """
+    print(f"  Fetching season schedule — season={season}...")
+    try:
+        games = _frame(
+            scheduleleaguev2.ScheduleLeagueV2, {"season": season},
+            ttl_seconds=None if season != config.season.current else _ttl("schedule"),
+            columns=["gameId", "gameDate", "homeTeam_teamId", "awayTeam_teamId"],
+        )
+        games = games[games["gameId"].astype(str).str.startswith("002")]
+        return pd.DataFrame({
+            "GAME_DATE": pd.to_datetime(games["gameDate"], format="mixed").dt.date,
+            "HOME_TEAM_ID": games["homeTeam_teamId"].astype(int),
+            "VISITOR_TEAM_ID": games["awayTeam_teamId"].astype(int),
+        }).reset_index(drop=True)
+    except ReplayMissError:
+        raise
+    except Exception as e:
+        print(f"  [ERROR] fetch_season_schedule: {e}")
+        return pd.DataFrame()
+
+
+def fetch_playing_teams(game_date: date) -> Set[int]:
+    """
+    Return the set of NBA Team IDs with a game scheduled on *game_date*.
+
+    The scoreboard is cached per date, so a replay only finds the days
+    that were recorded: pass the recorded day explicitly (``--date``)
+    rather than relying on "today".
 
     :returns: Set of team IDs. Empty set on error or no games.
+    :raises ReplayMissError: In replay mode, when *game_date* was not recorded.
     """
     try:
-        board = scoreboardv2.ScoreboardV2()
-        games = board.get_data_frames()[0]
+        games = _frame(
+            scoreboardv2.ScoreboardV2, {"game_date": game_date.isoformat()},
+            ttl_seconds=None if game_date < date.today() else _ttl("scoreboard"),
+        )
         home = set(games["HOME_TEAM_ID"].tolist())
         away = set(games["VISITOR_TEAM_ID"].tolist())
         return home | away
+    except ReplayMissError:
+        raise
     except Exception as e:
-        print(f"  [ERROR] fetch_todays_playing_teams: {e}")
+        print(f"  [ERROR] fetch_playing_teams({game_date}): {e}")
         return set()
@@ -0,0 +1,97 @@
+"""
+app/repository/rate_limiter.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Thread-safe token-bucket rate limiting and retry-with-backoff for
+outbound API calls.
+
+Every NBA API request goes through one shared :class:`TokenBucket`, so
+requests issued concurrently (see ``nba_api_repository.fetch_concurrently``)
+still respect a global requests-per-second budget, and a burst of up to
+``capacity`` requests can start at once.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    Token bucket: ``rate`` tokens per second, holding at most ``capacity``.
+
+    :param rate:     Refill rate (requests per second). ``<= 0`` disables limiting.
+    :param capacity: Burst size — requests that may start back-to-back.
+    :param clock:    Monotonic clock (injectable for tests).
+    :param sleep:    Sleep function (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until *tokens* are available and take them.
+
+        :returns: Seconds spent waiting.
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    limiter: Optional[TokenBucket] = None,
+    max_retries: int = 3,
+    backoff: float = 2.0,
+    max_backoff: float = 30.0,
+    label: str = "request",
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """
+    Call *fn*, taking a limiter token per attempt and retrying failures
+    with exponential backoff and jitter (``backoff · 2^attempt``, halved
+    at random, capped at *max_backoff*).
+
+    :raises Exception: The last error once *max_retries* retries are used up.
+    """
+    for attempt in range(max_retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            delay = min(max_backoff, backoff * 2 ** attempt) * random.uniform(0.5, 1.0)
+            print(f"  [WARN] {label} failed ({e}); retry {attempt + 1}/{max_retries} in {delay:.1f}s...")
+            sleep(delay)
+    raise AssertionError("unreachable")
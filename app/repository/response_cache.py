@@ -0,0 +1,153 @@
+"""
+app/repository/response_cache.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Disk-backed cache of NBA API responses, keyed by endpoint + parameters.
+
+Each response is one JSON file under ``<directory>/<endpoint>/<key>.json``
+(``key`` = sha256 of the endpoint and its sorted parameters) holding the
+parameters, the fetch time and the payload. Freshness is decided per
+call: ``ttl_seconds=None`` means the entry never expires (e.g. a finished
+season), otherwise it is refetched once older than the TTL.
+
+Modes:
+  - ``live``:   serve fresh entries, fetch and store on a miss / expiry
+  - ``record``: always fetch and store (refreshes every entry touched)
+  - ``replay``: serve stored entries regardless of age, never touch the
+                network; a miss raises :class:`ReplayMissError`
+  - ``off``:    always fetch, store nothing
+
+``record`` once, then ``replay`` runs the whole pipeline offline and
+deterministically. Requests are keyed by their parameters, including the
+game date: commands that default to today (``predict``, ``lineup``,
+``plan``) only replay on the day they were recorded unless given that
+day with ``--date``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from app.repository import file_repository as file_repo
+
+MODES = ("live", "record", "replay", "off")
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when no response was recorded for a request."""
+
+
+class ResponseCache:
+    """
+    Per-request response cache with TTLs and record/replay.
+
+    :param directory: Cache root (one sub-directory per endpoint).
+    :param mode:      One of :data:`MODES`.
+    :param clock:     Wall clock in seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        mode: str = "live",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = directory
+        self.mode = mode
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: str) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown response cache mode {mode!r}; expected one of {MODES}.")
+        self._mode = mode
+
+    @staticmethod
+    def key(endpoint: str, params: Dict[str, Any]) -> str:
+        """Content address of one request."""
+        blob = json.dumps({"endpoint": endpoint, "params": params}, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def path(self, endpoint: str, params: Dict[str, Any]) -> Path:
+        return self.directory / endpoint / f"{self.key(endpoint, params)}.json"
+
+    def fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        ttl_seconds: Optional[float],
+        fetch_fn: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the payload for ``(endpoint, params)``, calling *fetch_fn*
+        (which must return something JSON-serialisable) when needed.
+
+        :raises ReplayMissError: In replay mode, when nothing was recorded.
+        """
+        if self.mode == "off":
+            return fetch_fn()
+
+        path = self.path(endpoint, params)
+        if self.mode != "record":
+            entry = self._read(path)
+            fresh = entry is not None and (
+                self.mode == "replay"
+                or ttl_seconds is None
+                or self._clock() - entry["fetched_at"] <= ttl_seconds
+            )
+            if fresh:
+                self._count(hit=True)
+                return entry["payload"]
+            if self.mode == "replay":
+                raise ReplayMissError(
+                    f"No recorded response for {endpoint} {params} (replay mode)."
+                )
+
+        self._count(hit=False)
+        payload = fetch_fn()
+        self._write(path, {
+            "endpoint": endpoint,
+            "params": params,
+            "fetched_at": self._clock(),
+            "payload": payload,
+        })
+        return payload
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def _read(path: Path) -> Optional[dict]:
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  [WARN] Ignoring unreadable response cache {path.name}: {e}")
+            return None
+
+    @staticmethod
+    def _write(path: Path, entry: dict) -> None:
+        """Write atomically, so readers never see a partial entry."""
+        data = json.dumps(entry, default=str).encode("utf-8")
+        file_repo._atomic_write(path, lambda f: f.write(data))
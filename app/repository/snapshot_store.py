@@ -0,0 +1,429 @@
+"""
+app/repository/snapshot_store.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Append-only history of keyed tables (one row per player), with
+"as of" and per-key trajectory queries.
+
+Each *kind* of table (e.g. ``pool``, ``scores``) lives in its own
+directory::
+
+    <directory>/<kind>/index.npz       row index + snapshot list (schema header)
+    <directory>/<kind>/seg-000001.npz  rows added by one append (or a compaction)
+
+An append hashes every row and stores only the rows whose content changed
+since the key's latest stored version, plus a tombstone for every key
+that disappeared, as one new segment. The index holds one entry per
+stored row — key, snapshot, time, segment, row, row digest, tombstone
+flag — so queries only scan the index and then read the rows they need
+from memory-mapped segments; no snapshot is ever loaded whole.
+
+``compact`` thins snapshots older than a cutoff to the last one of each
+day and rewrites their rows into a single segment. A compacted segment
+holds the union of its snapshots' columns, so each snapshot's own column
+list is kept with it and ``as_of`` reads rows back in exactly those
+columns.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from app.repository import file_repository as file_repo
+
+STORE_VERSION = 1
+
+# Index arrays, one entry per stored row version
+_INDEX_FIELDS = {
+    "key": np.int64,         # row key (player ID)
+    "snapshot": np.int64,    # snapshot ID
+    "taken_at": np.int64,    # snapshot time, epoch seconds
+    "segment": np.int64,     # segment number
+    "row": np.int64,         # row within the segment
+    "digest": np.uint64,     # row content digest (0 for tombstones)
+    "deleted": np.bool_,     # tombstone: the key left the table
+}
+
+
+def _epoch(when: Union[datetime, date]) -> int:
+    """Epoch seconds; a bare date means the end of that day."""
+    if not isinstance(when, datetime):
+        when = datetime.combine(when, time.max)
+    return int(when.timestamp())
+
+
+@dataclass
+class SnapshotInfo:
+    """
+    One append: when it was taken, its content hash, how many rows it
+    stored and the table's columns at the time.
+    """
+
+    snapshot_id: int
+    taken_at: datetime
+    content_hash: str
+    n_rows: int
+    meta: dict = field(default_factory=dict)
+    columns: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "SnapshotInfo":
+        return cls(
+            snapshot_id=int(d["snapshot_id"]),
+            taken_at=datetime.fromisoformat(d["taken_at"]),
+            content_hash=d["content_hash"],
+            n_rows=int(d["n_rows"]),
+            meta=dict(d.get("meta") or {}),
+            columns=[str(c) for c in d.get("columns") or []],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "snapshot_id": self.snapshot_id,
+            "taken_at": self.taken_at.isoformat(timespec="seconds"),
+            "content_hash": self.content_hash,
+            "n_rows": self.n_rows,
+            "meta": self.meta,
+            "columns": self.columns,
+        }
+
+
+@dataclass
+class SnapshotRows:
+    """
+    Rows read back from the store.
+
+    :param keys:     Row keys.
+    :param labels:   Label per row (e.g. player name).
+    :param columns:  Value column names.
+    :param values:   ``(len(keys), len(columns))`` float matrix.
+    :param taken_at: When each row version was recorded (``datetime64[s]``).
+    """
+
+    keys: np.ndarray
+    labels: np.ndarray
+    columns: List[str]
+    values: np.ndarray
+    taken_at: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class SnapshotStore:
+    """
+    Append-only, deduplicated snapshots of keyed float tables.
+
+    :param directory: Store root (one sub-directory per kind).
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        kind: str,
+        keys: np.ndarray,
+        values: np.ndarray,
+        columns: List[str],
+        labels: Optional[np.ndarray] = None,
+        taken_at: Optional[datetime] = None,
+        meta: Optional[dict] = None,
+    ) -> SnapshotInfo:
+        """
+        Record one snapshot of a table, storing only changed rows.
+
+        :param keys:    ``(n,)`` unique row keys.
+        :param values:  ``(n, len(columns))`` values (NaN = missing).
+        :param labels:  ``(n,)`` string per row (default empty).
+        :param meta:    JSON-serialisable notes kept with the snapshot.
+        :returns:       The new snapshot's info (``n_rows`` = rows stored).
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        values = np.ascontiguousarray(values, dtype=np.float64).reshape(len(keys), len(columns))
+        labels = np.asarray(labels if labels is not None else [""] * len(keys), dtype=str)
+        taken_at = taken_at or datetime.now().replace(microsecond=0)
+        schema, index = self._load_index(kind)
+
+        digests = self._row_digests(columns, labels, values)
+        content = hashlib.sha256()
+        content.update(keys.tobytes())
+        content.update(digests.tobytes())
+
+        # Latest stored version of every key
+        latest_keys, latest = self._latest(index, np.iinfo(np.int64).max)
+        stored = dict(zip(latest_keys.tolist(), index["digest"][latest].tolist()))
+        live = set(latest_keys[~index["deleted"][latest]].tolist())
+
+        changed = np.fromiter(
+            (stored.get(k) != d or k not in live for k, d in zip(keys.tolist(), digests.tolist())),
+            dtype=bool, count=len(keys),
+        )
+        gone = np.array(sorted(live - set(keys.tolist())), dtype=np.int64)
+
+        snapshot_id = schema["next_snapshot"]
+        info = SnapshotInfo(
+            snapshot_id=snapshot_id,
+            taken_at=taken_at,
+            content_hash=content.hexdigest(),
+            n_rows=int(changed.sum()) + len(gone),
+            meta=meta or {},
+            columns=list(columns),
+        )
+        schema["next_snapshot"] += 1
+        schema["snapshots"].append(info.to_dict())
+
+        if info.n_rows:
+            segment = schema["next_segment"]
+            schema["next_segment"] += 1
+            seg_keys = np.concatenate([keys[changed], gone])
+            self._write_segment(kind, segment, {
+                "keys": seg_keys,
+                "labels": np.concatenate([labels[changed], np.full(len(gone), "", dtype=str)]),
+                "columns": np.asarray(columns, dtype=str),
+                "values": np.vstack([values[changed], np.full((len(gone), len(columns)), np.nan)]),
+            })
+            index = self._concat(index, {
+                "key": seg_keys,
+                "snapshot": np.full(len(seg_keys), snapshot_id),
+                "taken_at": np.full(len(seg_keys), _epoch(taken_at)),
+                "segment": np.full(len(seg_keys), segment),
+                "row": np.arange(len(seg_keys)),
+                "digest": np.concatenate([digests[changed], np.zeros(len(gone), dtype=np.uint64)]),
+                "deleted": np.concatenate([np.zeros(changed.sum(), dtype=bool), np.ones(len(gone), dtype=bool)]),
+            })
+        self._save_index(kind, schema, index)
+        return info
+
+    def compact(self, kind: str, before: datetime) -> int:
+        """
+        Keep only the last snapshot of each day among those taken before
+        *before*, and rewrite their rows into one segment. Queries as of
+        any retained snapshot are unchanged.
+
+        :returns: Number of snapshots removed.
+        """
+        schema, index = self._load_index(kind)
+        snapshots = [SnapshotInfo.from_dict(s) for s in schema["snapshots"]]
+        old = [s for s in snapshots if s.taken_at < before]
+        if not old:
+            return 0
+        last_of_day: Dict[date, SnapshotInfo] = {}
+        for s in old:
+            last_of_day[s.taken_at.date()] = s
+        kept = sorted(last_of_day.values(), key=lambda s: s.snapshot_id)
+        kept_ids = {s.snapshot_id for s in kept}
+        old_ids = {s.snapshot_id for s in old}
+        in_old = np.isin(index["snapshot"], list(old_ids))
+        if len(kept) == len(old) and len(np.unique(index["segment"][in_old])) <= 1:
+            return 0   # already compacted
+
+        # Entries for each kept snapshot: keys whose latest version (as of
+        # it) differs from their latest version as of the previous one.
+        parts: List[np.ndarray] = []
+        owners: List[SnapshotInfo] = []
+        previous: Dict[int, int] = {}
+        for s in kept:
+            keys, latest = self._latest(index, _epoch(s.taken_at), max_snapshot=s.snapshot_id)
+            current = dict(zip(keys.tolist(), latest.tolist()))
+            changed = [
+                e for k, e in current.items()
+                if k not in previous
+                or index["digest"][previous[k]] != index["digest"][e]
+                or index["deleted"][previous[k]] != index["deleted"][e]
+            ]
+            # A key tombstoned before it was ever kept needs no entry
+            changed = [e for e in changed if not (index["deleted"][e] and index["key"][e] not in previous)]
+            parts.append(np.array(changed, dtype=np.int64))
+            owners.append(s)
+            previous = current
+
+        entries = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+        rows = self._gather(kind, index, entries)
+        segment = schema["next_segment"]
+        schema["next_segment"] += 1
+        self._write_segment(kind, segment, {
+            "keys": rows.keys,
+            "labels": rows.labels,
+            "columns": np.asarray(rows.columns, dtype=str),
+            "values": rows.values,
+        })
+
+        compacted = {
+            "key": index["key"][entries],
+            "snapshot": np.concatenate([np.full(len(p), s.snapshot_id) for p, s in zip(parts, owners)]),
+            "taken_at": np.concatenate([np.full(len(p), _epoch(s.taken_at)) for p, s in zip(parts, owners)]),
+            "segment": np.full(len(entries), segment),
+            "row": np.arange(len(entries)),
+            "digest": index["digest"][entries],
+            "deleted": index["deleted"][entries],
+        }
+        for s, n in zip(owners, map(len, parts)):
+            s.n_rows = n
+
+        new_index = self._concat(compacted, {k: v[~in_old] for k, v in index.items()})
+        schema["snapshots"] = [s.to_dict() for s in kept] + [
+            s.to_dict() for s in snapshots if s.snapshot_id not in old_ids
+        ]
+        self._save_index(kind, schema, new_index)
+
+        referenced = set(new_index["segment"].tolist())
+        for path in (self.directory / kind).glob("seg-*.npz"):
+            if int(path.stem.split("-")[1]) not in referenced:
+                path.unlink()
+        return len(old) - len(kept_ids)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def snapshots(self, kind: str) -> List[SnapshotInfo]:
+        """Every snapshot of *kind*, oldest first."""
+        schema, _ = self._load_index(kind)
+        return [SnapshotInfo.from_dict(s) for s in schema["snapshots"]]
+
+    def as_of(
+        self, kind: str, when: Union[datetime, date], keys: Optional[np.ndarray] = None
+    ) -> SnapshotRows:
+        """
+        The table as it stood at *when* (a date means end of that day):
+        each key's latest version recorded by then, sorted by key, in the
+        columns of the latest snapshot by then. Keys that had been removed
+        are left out.
+
+        :param keys: Only these keys (default all).
+        """
+        schema, index = self._load_index(kind)
+        until = _epoch(when)
+        latest_keys, latest = self._latest(index, until)
+        keep = ~index["deleted"][latest]
+        if keys is not None:
+            keep &= np.isin(latest_keys, np.asarray(keys, dtype=np.int64))
+
+        columns = None
+        taken = [SnapshotInfo.from_dict(s) for s in schema["snapshots"]]
+        taken = [s for s in taken if _epoch(s.taken_at) <= until]
+        if taken and taken[-1].columns:    # stores written before columns were kept: union
+            columns = taken[-1].columns
+        return self._gather(kind, index, latest[keep], columns)
+
+    def trajectory(self, kind: str, key: int) -> SnapshotRows:
+        """Every stored version of *key*, oldest first (one row per change)."""
+        _, index = self._load_index(kind)
+        entries = np.flatnonzero((index["key"] == int(key)) & ~index["deleted"])
+        return self._gather(kind, index, entries)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _index_path(self, kind: str) -> Path:
+        return self.directory / kind / "index.npz"
+
+    def _load_index(self, kind: str):
+        path = self._index_path(kind)
+        if not path.exists():
+            schema = {
+                "kind": kind, "version": STORE_VERSION,
+                "next_snapshot": 1, "next_segment": 1, "snapshots": [],
+            }
+            return schema, {k: np.empty(0, dtype=t) for k, t in _INDEX_FIELDS.items()}
+        schema, index = file_repo.load_columnar(path)
+        if schema.get("version") != STORE_VERSION:
+            raise ValueError(f"{path}: unsupported snapshot store version {schema.get('version')}")
+        return schema, index
+
+    def _save_index(self, kind: str, schema: dict, index: Dict[str, np.ndarray]) -> None:
+        file_repo.save_npz(self._index_path(kind), index, schema=schema)
+
+    @staticmethod
+    def _concat(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        return {
+            k: np.concatenate([np.asarray(a[k], dtype=t), np.asarray(b[k], dtype=t)])
+            for k, t in _INDEX_FIELDS.items()
+        }
+
+    @staticmethod
+    def _latest(index: Dict[str, np.ndarray], until: int, max_snapshot: Optional[int] = None):
+        """
+        ``(keys, entries)``: each key's last index entry taken at or before
+        *until* (and, if given, in a snapshot no later than *max_snapshot*).
+        Entries are in append order, so the last match per key wins.
+        """
+        match = index["taken_at"] <= until
+        if max_snapshot is not None:
+            match &= index["snapshot"] <= max_snapshot
+        pos = np.flatnonzero(match)[::-1]
+        keys, first = np.unique(index["key"][pos], return_index=True)
+        return keys, pos[first]
+
+    @staticmethod
+    def _row_digests(columns: List[str], labels: np.ndarray, values: np.ndarray) -> np.ndarray:
+        prefix = hashlib.blake2b("\x1f".join(columns).encode("utf-8"), digest_size=8)
+        digests = np.empty(len(values), dtype=np.uint64)
+        for i, (label, row) in enumerate(zip(labels.tolist(), values)):
+            h = prefix.copy()
+            h.update(label.encode("utf-8"))
+            h.update(row.tobytes())
+            # never 0, which marks tombstones
+            digests[i] = int.from_bytes(h.digest(), "little") or 1
+        return digests
+
+    def _write_segment(self, kind: str, segment: int, arrays: Dict[str, np.ndarray]) -> None:
+        file_repo.save_npz(
+            self.directory / kind / f"seg-{segment:06d}.npz",
+            arrays,
+            schema={"kind": kind, "version": STORE_VERSION},
+        )
+
+    def _gather(
+        self,
+        kind: str,
+        index: Dict[str, np.ndarray],
+        entries: np.ndarray,
+        columns: Optional[List[str]] = None,
+    ) -> SnapshotRows:
+        """
+        Read the rows behind index *entries* (in that order) from their
+        segments, in *columns* (default: every segment's columns, newest
+        first).
+        """
+        entries = np.asarray(entries, dtype=np.int64)
+        segments = index["segment"][entries]
+        loaded = {
+            int(seg): file_repo.load_columnar(self.directory / kind / f"seg-{int(seg):06d}.npz")[1]
+            for seg in np.unique(segments)
+        }
+        if columns is None:
+            # Newest segment's columns first, then any others in order seen
+            columns = []
+            for seg in sorted(loaded, reverse=True):
+                columns += [c for c in loaded[seg]["columns"].tolist() if c not in columns]
+        position = {c: j for j, c in enumerate(columns)}
+
+        values = np.full((len(entries), len(columns)), np.nan)
+        labels = np.empty(len(entries), dtype=object)
+        for seg, arrays in loaded.items():
+            at = np.flatnonzero(segments == seg)
+            rows = index["row"][entries[at]]
+            stored = [(i, position[c]) for i, c in enumerate(arrays["columns"].tolist()) if c in position]
+            src, dst = [i for i, _ in stored], [j for _, j in stored]
+            values[np.ix_(at, dst)] = arrays["values"][np.ix_(rows, src)]
+            labels[at] = arrays["labels"][rows]
+
+        return SnapshotRows(
+            keys=index["key"][entries],
+            labels=labels.astype(str) if len(entries) else np.empty(0, dtype=str),
+            columns=list(columns),
+            values=values,
+            taken_at=index["taken_at"][entries].astype("datetime64[s]"),
+        )
@@ -0,0 +1,416 @@
+"""
+app/repository/sqlite_repository.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+SQLite store for players, stat windows, scores and projections.
+
+An alternative to re-reading whole JSON / checkpoint files when a command
+only needs a handful of players: roster slices and single-player score
+lookups (:meth:`SqliteRepository.load_scores`), a player's stat windows
+(:meth:`~SqliteRepository.load_players`) and projections
+(:meth:`~SqliteRepository.player_projections`), and the top N by
+Total_Value (:meth:`~SqliteRepository.top_scores`) are index lookups. Data
+goes in and comes out in the same column layout as the binary checkpoints
+(``PlayerPool.to_columns`` / ``ScoredPool.to_columns``), so this module
+stays free of domain objects.
+
+Tables (every stat / score table is keyed by a *snapshot* — the ISO date
+of the pull, ranking or projected game — and re-saving a snapshot
+replaces it):
+
+  - ``players``        player_id → name, positions, team_id
+  - ``stats``          (snapshot, source, player_id) → one column per stat
+                       (index: player_id, snapshot)
+  - ``scores``         (snapshot, player_id) → name, total_value
+                       (index: snapshot, total_value DESC)
+  - ``score_values``   (snapshot, player_id, col) → value;
+                       ``score_columns`` names each col per snapshot
+  - ``projections``    (game_date, player_id) → total_value, play_prob,
+                       one column per stat  (index: player_id, game_date)
+  - ``saves``          table → time of its last save, so readers can tell
+                       whether the store is older than the checkpoints
+
+Writes are one transaction per save (``executemany``); reads use fixed
+SQL strings, so sqlite3's statement cache prepares each query once —
+player-ID lists are bound as one JSON parameter (``json_each``) rather
+than spliced into the SQL.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+_IDS = "(SELECT value FROM json_each(?))"
+
+# Scores keep their own name; older rows (saved before they did) take it
+# from players, and a score is never dropped for a missing players row.
+_SQL_SCORES = (
+    "SELECT s.player_id, COALESCE(s.name, p.name, ''), s.total_value FROM scores s "
+    "LEFT JOIN players p USING (player_id)"
+)
+
+
+def _ids_param(player_ids: Iterable[int]) -> str:
+    return json.dumps([int(p) for p in player_ids])
+
+
+class SqliteRepository:
+    """
+    Players, stats, scores and projections in one SQLite file.
+
+    :param path:         Database file (created if missing).
+    :param stat_columns: Stat column names, in row order (``STAT_COLUMNS``).
+    :param windows:      Stats window names (``STATS_WINDOWS``).
+    """
+
+    def __init__(self, path: Path, stat_columns: List[str], windows: Iterable[str]) -> None:
+        self.path = path
+        self.stat_columns = list(stat_columns)
+        self.windows = tuple(windows)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._create_schema()
+
+        stats = ", ".join(f'"{c}"' for c in self.stat_columns)
+        marks = ", ".join("?" * len(self.stat_columns))
+        self._sql_insert_stats = (
+            f"INSERT INTO stats (snapshot, source, player_id, {stats}) "
+            f"VALUES (?, ?, ?, {marks})"
+        )
+        self._sql_insert_projection = (
+            f"INSERT INTO projections (game_date, player_id, name, total_value, play_prob, {stats}) "
+            f"VALUES (?, ?, ?, ?, ?, {marks})"
+        )
+        self._sql_stats = (
+            f"SELECT source, player_id, {stats} FROM stats "
+            f"WHERE snapshot = ? AND player_id IN {_IDS}"
+        )
+        self._sql_player_projections = (
+            f"SELECT game_date, player_id, name, total_value, play_prob, {stats} "
+            f"FROM projections WHERE player_id = ? ORDER BY game_date DESC"
+        )
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """
+        This thread's connection (sqlite3 connections are per-thread; WAL
+        lets readers in other threads or processes run alongside a write).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, cached_statements=256)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _create_schema(self) -> None:
+        stats = ", ".join(f'"{c}" REAL' for c in self.stat_columns)
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS players (
+                player_id INTEGER PRIMARY KEY,
+                name      TEXT NOT NULL,
+                positions TEXT NOT NULL DEFAULT '',
+                team_id   INTEGER
+            );
+            DROP INDEX IF EXISTS players_team;
+
+            CREATE TABLE IF NOT EXISTS stats (
+                snapshot  TEXT NOT NULL,
+                source    TEXT NOT NULL,
+                player_id INTEGER NOT NULL,
+                {stats},
+                PRIMARY KEY (snapshot, source, player_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS stats_player ON stats (player_id, snapshot);
+
+            CREATE TABLE IF NOT EXISTS scores (
+                snapshot    TEXT NOT NULL,
+                player_id   INTEGER NOT NULL,
+                name        TEXT,
+                total_value REAL,
+                PRIMARY KEY (snapshot, player_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS scores_value ON scores (snapshot, total_value DESC);
+
+            CREATE TABLE IF NOT EXISTS score_columns (
+                snapshot TEXT PRIMARY KEY,
+                columns  TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS score_values (
+                snapshot  TEXT NOT NULL,
+                player_id INTEGER NOT NULL,
+                col       INTEGER NOT NULL,
+                value     REAL,
+                PRIMARY KEY (snapshot, player_id, col)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS projections (
+                game_date   TEXT NOT NULL,
+                player_id   INTEGER NOT NULL,
+                name        TEXT,
+                total_value REAL,
+                play_prob   REAL,
+                {stats},
+                PRIMARY KEY (game_date, player_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS projections_player ON projections (player_id, game_date);
+
+            CREATE TABLE IF NOT EXISTS saves (
+                tbl      TEXT PRIMARY KEY,
+                saved_at REAL NOT NULL
+            );
+        """)
+        # Stores created before scores carried the player's name
+        score_cols = [r[1] for r in self._conn.execute("PRAGMA table_info(scores)")]
+        if "name" not in score_cols:
+            with self._conn:
+                self._conn.execute("ALTER TABLE scores ADD COLUMN name TEXT")
+
+    def _mark_saved(self, table: str) -> None:
+        """Record that *table* was written now (call inside the write transaction)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO saves (tbl, saved_at) VALUES (?, ?)", (table, time.time())
+        )
+
+    # ------------------------------------------------------------------
+    # Writes (one transaction each)
+    # ------------------------------------------------------------------
+
+    def save_players(
+        self,
+        columns: Dict[str, np.ndarray],
+        snapshot: str,
+        team_map: Optional[Dict[int, int]] = None,
+    ) -> None:
+        """
+        Upsert the players and replace *snapshot*'s stat windows.
+
+        :param columns:  ``PlayerPool.to_columns()`` arrays.
+        :param team_map: ``{player_id: team_id}``; players absent keep
+                         their stored team.
+        """
+        player_ids = columns["player_ids"].tolist()
+        team_map = team_map or {}
+        players = [
+            (pid, name, positions, team_map.get(pid))
+            for pid, name, positions in zip(
+                player_ids, columns["names"].tolist(), columns["positions"].tolist()
+            )
+        ]
+        stats = []
+        for source in self.windows:
+            rows = columns.get(f"{source}.rows")
+            if rows is None:
+                continue
+            values = columns[f"{source}.values"].tolist()
+            stats += [
+                (snapshot, source, player_ids[r], *v)
+                for r, v in zip(rows.tolist(), values)
+            ]
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO players (player_id, name, positions, team_id) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (player_id) DO UPDATE SET name = excluded.name, "
+                "positions = excluded.positions, "
+                "team_id = COALESCE(excluded.team_id, players.team_id)",
+                players,
+            )
+            self._conn.execute("DELETE FROM stats WHERE snapshot = ?", (snapshot,))
+            self._conn.executemany(self._sql_insert_stats, stats)
+            self._mark_saved("stats")
+
+    def save_scores(self, columns: Dict[str, np.ndarray], snapshot: str) -> None:
+        """Replace *snapshot*'s scores with ``ScoredPool.to_columns()`` arrays."""
+        player_ids = columns["player_ids"].tolist()
+        scores = columns["scores"]
+        n_cols = scores.shape[1]
+        values = zip(
+            np.repeat(player_ids, n_cols).tolist(),
+            np.tile(np.arange(n_cols), len(player_ids)).tolist(),
+            scores.ravel().tolist(),
+        )
+
+        with self._conn:
+            for table in ("scores", "score_values", "score_columns"):
+                self._conn.execute(f"DELETE FROM {table} WHERE snapshot = ?", (snapshot,))
+            self._conn.execute(
+                "INSERT INTO score_columns (snapshot, columns) VALUES (?, ?)",
+                (snapshot, json.dumps(columns["score_columns"].tolist())),
+            )
+            self._conn.executemany(
+                "INSERT INTO scores (snapshot, player_id, name, total_value) VALUES (?, ?, ?, ?)",
+                [
+                    (snapshot, pid, name, tv)
+                    for pid, name, tv in zip(
+                        player_ids, columns["names"].tolist(), columns["total_value"].tolist()
+                    )
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO score_values (snapshot, player_id, col, value) VALUES (?, ?, ?, ?)",
+                [(snapshot, pid, col, v) for pid, col, v in values],
+            )
+            self._mark_saved("scores")
+
+    def save_projections(self, df: pd.DataFrame, game_date: str) -> None:
+        """
+        Replace *game_date*'s projections with the rows of *df*
+        (``player_id``, ``name``, ``Total_Value``, optional ``play_prob``
+        and the stat columns).
+        """
+        df = df.reset_index(drop=df.index.name != "player_id")
+        stats = df.reindex(columns=self.stat_columns).astype(float).to_numpy().tolist()
+        play_prob = df["play_prob"] if "play_prob" in df else pd.Series(1.0, index=df.index)
+        rows = [
+            (game_date, int(pid), name, float(tv), float(p), *s)
+            for pid, name, tv, p, s in zip(
+                df["player_id"], df["name"], df["Total_Value"], play_prob.fillna(1.0), stats
+            )
+        ]
+        with self._conn:
+            self._conn.execute("DELETE FROM projections WHERE game_date = ?", (game_date,))
+            self._conn.executemany(self._sql_insert_projection, rows)
+            self._mark_saved("projections")
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def latest_snapshot(self, table: str = "scores") -> Optional[str]:
+        """Most recent snapshot in *table* (``"stats"`` or ``"scores"``)."""
+        if table not in ("stats", "scores"):
+            raise ValueError(f"No snapshots in table {table!r}.")
+        row = self._conn.execute(f"SELECT MAX(snapshot) FROM {table}").fetchone()
+        return row[0]
+
+    def saved_at(self, table: str) -> Optional[float]:
+        """Epoch seconds of *table*'s last save (``None`` if never saved)."""
+        row = self._conn.execute("SELECT saved_at FROM saves WHERE tbl = ?", (table,)).fetchone()
+        return row[0] if row else None
+
+    def load_scores(
+        self, player_ids: Optional[Iterable[int]] = None, snapshot: Optional[str] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        ``ScoredPool.to_columns()``-layout arrays for *player_ids* (default
+        all) as of *snapshot* (default latest), by descending Total_Value.
+
+        :returns: ``None`` when no scores have been saved.
+        """
+        snapshot = snapshot or self.latest_snapshot("scores")
+        if snapshot is None:
+            return None
+        if player_ids is None:
+            rows = self._conn.execute(
+                f"{_SQL_SCORES} WHERE s.snapshot = ? ORDER BY s.total_value DESC",
+                (snapshot,),
+            ).fetchall()
+        else:
+            rows = self._conn.execute(
+                f"{_SQL_SCORES} WHERE s.snapshot = ? AND s.player_id IN {_IDS} "
+                f"ORDER BY s.total_value DESC",
+                (snapshot, _ids_param(player_ids)),
+            ).fetchall()
+        return self._score_columns(snapshot, rows)
+
+    def top_scores(
+        self, n: int, exclude_ids: Iterable[int] = (), snapshot: Optional[str] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        The *n* highest Total_Value players not in *exclude_ids*, as
+        :meth:`load_scores` arrays (a scan of the ``scores_value`` index).
+
+        :returns: ``None`` when no scores have been saved.
+        """
+        snapshot = snapshot or self.latest_snapshot("scores")
+        if snapshot is None:
+            return None
+        rows = self._conn.execute(
+            f"{_SQL_SCORES} WHERE s.snapshot = ? AND s.player_id NOT IN {_IDS} "
+            f"ORDER BY s.total_value DESC LIMIT ?",
+            (snapshot, _ids_param(exclude_ids), int(n)),
+        ).fetchall()
+        return self._score_columns(snapshot, rows)
+
+    def load_players(
+        self, player_ids: Iterable[int], snapshot: Optional[str] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        ``PlayerPool.to_columns()``-layout arrays for *player_ids* with their
+        stat windows as of *snapshot* (default latest). Unknown IDs are
+        skipped.
+
+        :returns: ``None`` when no stats have been saved.
+        """
+        snapshot = snapshot or self.latest_snapshot("stats")
+        if snapshot is None:
+            return None
+        ids = _ids_param(player_ids)
+        players = self._conn.execute(
+            f"SELECT player_id, name, positions FROM players WHERE player_id IN {_IDS} "
+            f"ORDER BY player_id",
+            (ids,),
+        ).fetchall()
+
+        pids = np.array([p[0] for p in players], dtype=np.int64)
+        columns: Dict[str, np.ndarray] = {
+            "player_ids": pids,
+            "names": np.array([p[1] for p in players], dtype=str),
+            "positions": np.array([p[2] for p in players], dtype=str),
+        }
+        by_source: Dict[str, list] = {source: [] for source in self.windows}
+        for row in self._conn.execute(self._sql_stats, (snapshot, ids)):
+            by_source[row[0]].append(row[1:])
+        for source, rows in by_source.items():
+            rows.sort()
+            values = np.array([r[1:] for r in rows], dtype=np.float64)
+            columns[f"{source}.rows"] = np.searchsorted(pids, [r[0] for r in rows]).astype(np.int64)
+            columns[f"{source}.values"] = values.reshape(len(rows), len(self.stat_columns))
+        return columns
+
+    def player_projections(self, player_id: int) -> pd.DataFrame:
+        """
+        Every saved projection for *player_id*, latest game_date first
+        (``projections_player`` index).
+        """
+        return pd.read_sql_query(
+            self._sql_player_projections, self._conn, params=(int(player_id),)
+        ).rename(columns={"total_value": "Total_Value"})
+
+    def _score_columns(self, snapshot: str, rows: list) -> Dict[str, np.ndarray]:
+        """Attach the score matrix for the ``(player_id, name, total_value)`` *rows*."""
+        names = json.loads(self._conn.execute(
+            "SELECT columns FROM score_columns WHERE snapshot = ?", (snapshot,)
+        ).fetchone()[0])
+        pids = np.array([r[0] for r in rows], dtype=np.int64)
+        scores = np.zeros((len(pids), len(names)))
+        position = {int(pid): i for i, pid in enumerate(pids)}
+        for pid, col, value in self._conn.execute(
+            f"SELECT player_id, col, value FROM score_values "
+            f"WHERE snapshot = ? AND player_id IN {_IDS}",
+            (snapshot, _ids_param(pids)),
+        ):
+            scores[position[pid], col] = np.nan if value is None else value
+        return {
+            "player_ids": pids,
+            "names": np.array([r[1] for r in rows], dtype=str),
+            "score_columns": np.array(names, dtype=str),
+            "scores": scores,
+            "total_value": np.array([np.nan if r[2] is None else r[2] for r in rows], dtype=np.float64),
+        }
@@ -0,0 +1 @@
+"""benchmarks — standalone timing scripts (``python -m benchmarks.<name>``)."""
@@ -0,0 +1,51 @@
+"""
+benchmarks/bench_pull.py
+~~~~~~~~~~~~~~~~~~~~~~~~~
+Times ``player_ingestion.fetch_and_build_pool`` against the local stub
+stats server, compared with the sequential cost of the same requests
+(the old ``fetch → sleep(1) → fetch …`` path).
+
+Usage::
+
+    python -m benchmarks.bench_pull [--latency 1.0] [--fail-every 0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.ingestion import player_ingestion
+from app.repository import nba_api_repository as nba_repo
+from benchmarks.stub_stats_server import StubStatsServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency", type=float, default=1.0,
+                        help="Simulated seconds per API response.")
+    parser.add_argument("--fail-every", type=int, default=0,
+                        help="Fail every N-th request with HTTP 500 (exercises retries).")
+    args = parser.parse_args()
+
+    with StubStatsServer(latency=args.latency, fail_every=args.fail_every) as server:
+        nba_repo.set_base_url(server.base_url)
+        nba_repo.set_cache_mode("off")          # time the requests, not the cache
+        try:
+            start = time.perf_counter()
+            pool = player_ingestion.fetch_and_build_pool()
+            elapsed = time.perf_counter() - start
+        finally:
+            nba_repo.set_base_url(None)
+
+    requests = server.requests
+    sequential = requests * args.latency + (requests - 1) * 1.0   # + sleep(1) between calls
+    print(
+        f"\npull: {len(pool)} players, {requests} requests "
+        f"({server.failures} failed and retried), max {server.max_in_flight} in flight\n"
+        f"  concurrent: {elapsed:.2f}s   sequential baseline: ~{sequential:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+benchmarks/bench_scoring.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Times ZScoreStrategy.score (+ ScoredPool.to_dataframe) against the old
+row-wise implementation (pandas z-scores, then one dict/CategoryScores
+per player via iterrows) over a batch of synthetic pools, and batch
+scenario scoring against one score() call per punt build.
+
+Usage::
+
+    python -m benchmarks.bench_scoring [--players 500] [--pools 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List
+
+import pandas as pd
+
+from app.analytics.scoring.scenarios import punt_subset_scenarios, score_scenarios
+from app.analytics.scoring.z_score import ZScoreStrategy
+from app.domain.player import PlayerPool
+from app.domain.scoring import CategoryScores
+from app.domain.stats import STAT_MAP
+from benchmarks.synthetic import make_pool
+
+
+def _rowwise_score(pool: PlayerPool, weights: dict) -> pd.DataFrame:
+    """The pre-vectorisation scoring path, kept here as the baseline."""
+    df = pool.to_dataframe().copy()
+    league_fg_pct = df["FGM"].sum() / df["FGA"].sum()
+    league_ft_pct = df["FTM"].sum() / df["FTA"].sum()
+    df["FG%_Impact"] = df["FGM"] - (df["FGA"] * league_fg_pct)
+    df["FT%_Impact"] = df["FTM"] - (df["FTA"] * league_ft_pct)
+    z_cols = []
+    for cat, col, higher_better in STAT_MAP:
+        mean, std = df[col].mean(), df[col].std() or 1.0
+        z = (df[col] - mean) / std if higher_better else (mean - df[col]) / std
+        df[f"z{cat}"] = z * weights.get(cat, 1.0)
+        z_cols.append(f"z{cat}")
+    df = df.round(3)
+    df["Total_Value"] = df[z_cols].sum(axis=1)
+
+    rows = []
+    for _, row in df.iterrows():
+        scores = {c: float(row[c]) for c in z_cols + ["FG%_Impact", "FT%_Impact"]}
+        cs = CategoryScores(scores=scores, total_value=float(row["Total_Value"]))
+        rows.append({"player_id": int(row["player_id"]), "name": row["name"],
+                     "Total_Value": cs.total_value, **cs.scores})
+    return pd.DataFrame(rows)
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark z-score scoring")
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--pools", type=int, default=20)
+    args = parser.parse_args()
+
+    pools: List[PlayerPool] = [
+        make_pool(args.players, seed=s) for s in range(args.pools)
+    ]
+    weights = {"FG%": 1.5, "AST": 1.2, "PTS": 0.8}
+    strategy = ZScoreStrategy(weights=weights)
+
+    t_old = _time(lambda: [_rowwise_score(p, weights) for p in pools], 1)
+    t_new = _time(lambda: [strategy.score(p).to_dataframe() for p in pools], 3)
+
+    print(f"{args.pools} pools × {args.players} players")
+    print(f"  row-wise  : {t_old * 1e3 / args.pools:8.2f} ms / pool")
+    print(f"  vectorised: {t_new * 1e3 / args.pools:8.2f} ms / pool")
+    print(f"  speedup   : {t_old / t_new:8.1f}×")
+
+    # Every punt subset (512 builds): one z-matrix + one matmul vs. K score() calls
+    scenarios = punt_subset_scenarios(weights)
+    pool = pools[0]
+    t_batch = _time(lambda: score_scenarios(pool, scenarios), 3)
+    t_loop = _time(lambda: [
+        ZScoreStrategy(s.weights, s.punt_categories).score(pool) for s in scenarios
+    ], 1)
+    print(f"\n{len(scenarios)} punt scenarios × {args.players} players")
+    print(f"  one score() per scenario: {t_loop * 1e3:8.2f} ms")
+    print(f"  score_scenarios (batch) : {t_batch * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+benchmarks/bench_storage.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Times loading a synthetic pool and its scored pool from the JSON files
+(``data.json`` / ``data_zscores.json``: parse + rebuild) against the
+memory-mapped ``.npz`` checkpoints, plus a one-window column projection,
+and checks the checkpoint round-trips to the same pool. Also times a
+15-player roster slice and a single-player lookup against the SQLite store, and
+an "as of" pool and a one-player trajectory against a 30-pull snapshot
+history.
+
+Usage::
+
+    python -m benchmarks.bench_storage [--players 500] [--repeat 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from app.analytics.scoring.z_score import ZScoreStrategy
+from app.config import config
+from app.domain.player import STATS_WINDOWS, PlayerPool
+from app.domain.scoring import ScoredPool
+from app.domain.stats import RAW_STAT_COLS, STAT_COLUMNS
+from app.ingestion import checkpoint
+from app.repository import file_repository as file_repo
+from app.repository.sqlite_repository import SqliteRepository
+from app.repository.snapshot_store import SnapshotStore
+from benchmarks.synthetic import make_pool
+
+
+def _time(fn, repeat: int) -> tuple:
+    """Mean seconds per call and the last result."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    pool = make_pool(args.players)
+    scored = ZScoreStrategy(weights=config.scoring.category_weights).score(pool)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp) / "data.json"
+        zscores_path = Path(tmp) / "data_zscores.json"
+        checkpoint.save_pool(pool, data_path)
+        checkpoint.save_scored_pool(scored, zscores_path)
+        # Both formats are timed, whatever storage.export_json says
+        file_repo.save_json(data_path, pool.to_raw_dict())
+        file_repo.save_dataframe_as_json(
+            zscores_path, scored.to_dataframe().drop(columns=RAW_STAT_COLS, errors="ignore")
+        )
+        # Read each format directly (not via checkpoint.load_*, which
+        # would pick whichever file is newer)
+        json_s, from_json = _time(
+            lambda: PlayerPool.from_raw_dict(file_repo.load_json(data_path)), args.repeat)
+        npz_s, from_npz = _time(
+            lambda: PlayerPool.from_columns(file_repo.load_columnar(checkpoint.checkpoint_path(data_path))[1]),
+            args.repeat)
+        proj_s, _ = _time(
+            lambda: PlayerPool.from_columns(file_repo.load_columnar(
+                checkpoint.checkpoint_path(data_path),
+                ["player_ids", "names", "positions",
+                 "stats_curr_season.rows", "stats_curr_season.values"],
+            )[1]),
+            args.repeat)
+        zjson_s, _ = _time(
+            lambda: ScoredPool.from_zscores_dict(file_repo.load_json(zscores_path)), args.repeat)
+        znpz_s, zfrom_npz = _time(
+            lambda: ScoredPool.from_columns(file_repo.load_columnar(checkpoint.checkpoint_path(zscores_path))[1]),
+            args.repeat)
+
+        db = SqliteRepository(Path(tmp) / "fantasy.db", STAT_COLUMNS, STATS_WINDOWS)
+        db.save_players(pool.to_columns(), "2025-01-01")
+        db.save_scores(scored.to_columns(), "2025-01-01")
+        roster = pool.player_ids[:: max(1, args.players // 15)][:15].tolist()
+        slice_s, sliced = _time(lambda: ScoredPool.from_columns(db.load_scores(roster)), args.repeat)
+        one_s, _ = _time(lambda: db.load_scores(roster[:1]), args.repeat)
+        db.close()
+
+        # 30 daily pulls, ~10% of players' stats changing each time
+        history = SnapshotStore(Path(tmp) / "history")
+        rng = np.random.default_rng(0)
+        values = pool.window("stats_curr_season").values.copy()
+        keys = pool.player_ids[pool.window("stats_curr_season").rows]
+        start = datetime(2025, 1, 1, 9)
+        stored = 0
+        for day in range(30):
+            changed = rng.random(len(keys)) < 0.1
+            values[changed] *= 1.01
+            stored += history.append("pool", keys, values, STAT_COLUMNS,
+                                     taken_at=start + timedelta(days=day)).n_rows
+        as_of_s, as_of = _time(lambda: history.as_of("pool", (start + timedelta(days=14)).date()), args.repeat)
+        traj_s, _ = _time(lambda: history.trajectory("pool", int(keys[0])), args.repeat)
+        history_kb = sum(p.stat().st_size for p in (Path(tmp) / "history").rglob("*")) // 1024
+        sizes = {p.name: p.stat().st_size // 1024 for p in Path(tmp).iterdir()}
+
+    assert from_npz.fingerprint() == pool.fingerprint()
+    assert from_json.player_ids.tolist() == from_npz.player_ids.tolist()
+    assert np.allclose(np.sort(zfrom_npz.total_value), np.sort(scored.total_value))
+    assert sorted(sliced.player_ids.tolist()) == sorted(roster)
+    assert len(as_of) == len(keys)
+
+    print(
+        f"\nload {args.players} players (warm page cache):\n"
+        f"  data.json:        {json_s * 1000:8.2f} ms   ({sizes['data.json']} KB)\n"
+        f"  data.npz:         {npz_s * 1000:8.2f} ms   ({sizes['data.npz']} KB, "
+        f"{json_s / npz_s:.0f}x, identical pool)\n"
+        f"    one window:     {proj_s * 1000:8.2f} ms\n"
+        f"  data_zscores.json:{zjson_s * 1000:8.2f} ms   ({sizes['data_zscores.json']} KB)\n"
+        f"  data_zscores.npz: {znpz_s * 1000:8.2f} ms   ({sizes['data_zscores.npz']} KB, "
+        f"{zjson_s / znpz_s:.0f}x)\n"
+        f"  sqlite, {len(roster)}-player roster: {slice_s * 1000:6.2f} ms   "
+        f"one player: {one_s * 1000:.2f} ms   ({sizes['fantasy.db']} KB)\n"
+        f"  history, 30 pulls ({stored} of {30 * len(keys)} rows stored, {history_kb} KB):\n"
+        f"    as of day 15:   {as_of_s * 1000:8.2f} ms   one trajectory: {traj_s * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+benchmarks/stub_stats_server.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A local stand-in for stats.nba.com that serves synthetic responses for
+the endpoints nba_api_repository uses (leaguedashplayerstats,
+playerindex, commonallplayers, scoreboardv2, scheduleleaguev2), with configurable latency
+and injected failures. Point the app at it with ``api.base_url`` or
+``nba_api_repository.set_base_url(server.base_url)``.
+
+Usage::
+
+    python -m benchmarks.stub_stats_server [--port 8765] [--latency 0.5] [--fail-every 0]
+
+or in-process::
+
+    with StubStatsServer(latency=0.5) as server:
+        nba_repo.set_base_url(server.base_url)
+        ...
+        print(server.requests, server.max_in_flight)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+from nba_api.stats.endpoints import (
+    commonallplayers,
+    leaguedashplayerstats,
+    playerindex,
+    scheduleleaguev2,
+    scoreboardv2,
+)
+from nba_api.stats.static import players
+
+# Endpoint name → (nba_api class, the result set get_data_frames()[0] reads)
+_ENDPOINTS = {
+    "leaguedashplayerstats": (leaguedashplayerstats.LeagueDashPlayerStats, "LeagueDashPlayerStats"),
+    "playerindex":           (playerindex.PlayerIndex, "PlayerIndex"),
+    "commonallplayers":      (commonallplayers.CommonAllPlayers, "CommonAllPlayers"),
+    "scoreboardv2":          (scoreboardv2.ScoreboardV2, "GameHeader"),
+    "scheduleleaguev2":      (scheduleleaguev2.ScheduleLeagueV2, "SeasonGames"),
+}
+
+_FIRST_TEAM_ID = 1610612737
+
+
+def _synthetic_schedule(season: str, seed: int) -> dict:
+    """
+    A ``leagueSchedule`` payload (the nested V2 format): a few preseason
+    games, then 3–12 games a day from late October to mid April.
+    """
+    rng = np.random.default_rng(seed)
+    start = date(int(season[:4]), 10, 4)
+    game_dates = []
+    for offset in range(190):
+        day = start + timedelta(days=offset)
+        preseason = offset < 17
+        n_games = int(rng.integers(1, 4)) if preseason else int(rng.integers(3, 13))
+        teams = rng.permutation(30)[: 2 * n_games] + _FIRST_TEAM_ID
+        games = [
+            {
+                "gameId": f"{'001' if preseason else '002'}{season[2:4]}{offset:03d}{i:02d}",
+                "gameStatus": 1,
+                "broadcasters": {"nationalBroadcasters": []},
+                "homeTeam": {"teamId": int(home), "teamTricode": ""},
+                "awayTeam": {"teamId": int(away), "teamTricode": ""},
+                "pointsLeaders": [],
+            }
+            for i, (home, away) in enumerate(teams.reshape(-1, 2))
+        ]
+        game_dates.append({"gameDate": f"{day:%m/%d/%Y} 00:00:00", "games": games})
+    return {
+        "meta": {"version": 1},
+        "leagueSchedule": {
+            "seasonYear": season, "leagueId": "00", "weeks": [], "gameDates": game_dates,
+        },
+    }
+
+
+def _synthetic_rows(endpoint: str, headers: List[str], params: Dict[str, str],
+                    player_ids: List[int], seed: int) -> List[list]:
+    """Plausible rows for *endpoint*'s main result set."""
+    rng = np.random.default_rng(seed)
+    if endpoint == "scoreboardv2":
+        teams = rng.permutation(30)[: 2 * int(rng.integers(3, 8))] + _FIRST_TEAM_ID
+        games = teams.reshape(-1, 2)
+        return [
+            [{"HOME_TEAM_ID": int(h), "VISITOR_TEAM_ID": int(v)}.get(col) for col in headers]
+            for h, v in games
+        ]
+
+    rows = []
+    for pid in player_ids:
+        minutes = float(rng.uniform(8, 36))
+        fga = minutes * rng.uniform(0.25, 0.55)
+        fta = minutes * rng.uniform(0.05, 0.25)
+        values = {
+            "PLAYER_ID": pid, "PERSON_ID": pid,
+            "TEAM_ID": int(_FIRST_TEAM_ID + rng.integers(30)),
+            "POSITION": str(rng.choice(["G", "F", "C", "G-F", "F-C"])),
+            "MIN": minutes, "GP": int(rng.integers(5, 60)),
+            "FGA": fga, "FGM": fga * rng.uniform(0.4, 0.6),
+            "FTA": fta, "FTM": fta * rng.uniform(0.6, 0.9),
+            "FG3M": minutes * rng.uniform(0, 0.1),
+            "REB": minutes * rng.uniform(0.1, 0.35),
+            "AST": minutes * rng.uniform(0.03, 0.25),
+            "STL": minutes * rng.uniform(0.01, 0.05),
+            "BLK": minutes * rng.uniform(0, 0.06),
+            "TOV": minutes * rng.uniform(0.02, 0.08),
+        }
+        values["PTS"] = 2 * values["FGM"] + values["FG3M"] + values["FTM"]
+        values["FG_PCT"] = values["FGM"] / values["FGA"]
+        values["FT_PCT"] = values["FTM"] / values["FTA"]
+        rows.append([values.get(col) for col in headers])
+    return rows
+
+
+class StubStatsServer:
+    """
+    Threaded HTTP server imitating the NBA stats API.
+
+    :param port:       0 picks a free port.
+    :param latency:    Seconds each response is delayed.
+    :param fail_every: Every N-th request answers HTTP 500 (0 = never).
+    :param n_players:  Players in synthetic result sets.
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.0, fail_every: int = 0,
+                 n_players: int = 400) -> None:
+        self.latency = latency
+        self.fail_every = fail_every
+        self.player_ids = [p["id"] for p in players.get_active_players()[:n_players]]
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/stats/{{endpoint}}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                endpoint = url.path.rstrip("/").rsplit("/", 1)[-1].lower()
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                with server._lock:
+                    server.requests += 1
+                    n = server.requests
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.latency)
+                    if server.fail_every and n % server.fail_every == 0:
+                        with server._lock:
+                            server.failures += 1
+                        self._send(500, b'{"Message":"An error has occurred."}')
+                    elif endpoint not in _ENDPOINTS:
+                        self._send(404, b'{"Message":"Unknown endpoint."}')
+                    else:
+                        self._send(200, server._body(endpoint, params))
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def _send(self, status: int, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:   # keep benchmark output clean
+                pass
+
+        return Handler
+
+    def _body(self, endpoint: str, params: Dict[str, str]) -> bytes:
+        cls, main = _ENDPOINTS[endpoint]
+        seed = abs(hash((endpoint, tuple(sorted(params.items()))))) % 2**32
+        if endpoint == "scheduleleaguev2":
+            return json.dumps(_synthetic_schedule(params.get("Season", "2025-26"), seed)).encode("utf-8")
+        result_sets = [
+            {
+                "name": name,
+                "headers": headers,
+                "rowSet": (
+                    _synthetic_rows(endpoint, headers, params, self.player_ids, seed)
+                    if name == main else []
+                ),
+            }
+            for name, headers in sorted(cls.expected_data.items(), key=lambda kv: kv[0] != main)
+        ]
+        return json.dumps({"resource": endpoint, "parameters": params,
+                           "resultSets": result_sets}).encode("utf-8")
+
+    def start(self) -> "StubStatsServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubStatsServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--fail-every", type=int, default=0)
+    args = parser.parse_args()
+
+    server = StubStatsServer(args.port, args.latency, args.fail_every)
+    print(f"Serving stub stats API at {server.base_url} (Ctrl+C to stop)")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
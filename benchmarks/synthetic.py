@@ -0,0 +1,47 @@
+"""
+benchmarks/synthetic.py
+~~~~~~~~~~~~~~~~~~~~~~~~
+Synthetic PlayerPool generator so benchmarks run without data.json or
+network access.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.domain.player import STATS_WINDOWS, PlayerPool, StatsWindow
+from app.domain.stats import STAT_COLUMNS
+
+# Rough per-game means used to draw plausible stat lines.
+_MEANS = {
+    "FGA": 9.0, "FTA": 2.5, "3PTM": 1.2, "REB": 4.0, "AST": 2.3,
+    "ST": 0.7, "BLK": 0.5, "TO": 1.3, "MIN": 22.0,
+}
+
+
+def make_pool(n_players: int = 500, seed: int = 0) -> PlayerPool:
+    """Return a PlayerPool of *n_players* random but plausible stat lines."""
+    rng = np.random.default_rng(seed)
+    col = {c: i for i, c in enumerate(STAT_COLUMNS)}
+
+    windows = {}
+    for source in STATS_WINDOWS:
+        v = np.zeros((n_players, len(STAT_COLUMNS)))
+        for name, mean in _MEANS.items():
+            v[:, col[name]] = rng.gamma(2.0, mean / 2.0, n_players)
+        v[:, col["FGM"]] = v[:, col["FGA"]] * rng.uniform(0.38, 0.62, n_players)
+        v[:, col["FTM"]] = v[:, col["FTA"]] * rng.uniform(0.55, 0.92, n_players)
+        v[:, col["PTS"]] = (
+            2 * v[:, col["FGM"]] + v[:, col["3PTM"]] + v[:, col["FTM"]]
+        )
+        v[:, col["GP"]] = rng.integers(1, 82, n_players)
+        v[:, col["FG%"]] = v[:, col["FGM"]] / v[:, col["FGA"]]
+        v[:, col["FT%"]] = v[:, col["FTM"]] / v[:, col["FTA"]]
+        v.flags.writeable = False
+        windows[source] = StatsWindow(rows=np.arange(n_players), values=v)
+
+    return PlayerPool(
+        player_ids=np.arange(1_000_000, 1_000_000 + n_players),
+        names=np.array([f"Player {i}" for i in range(n_players)], dtype=object),
+        windows=windows,
+    )
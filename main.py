@@ -8,17 +8,58 @@ Usage:
 
 Commands:
     pull        Fetch raw NBA stats → data/data.json
+                  --incremental  refetch only in-season windows, apply the
+                                 changes and list changed players
+                                 → data/pull_delta.json
     rank        Score all players   → data/data_zscores.json, fantasy_rankings.csv
+                  --scenarios <FILE>  also score every weight/punt scenario in
+                                      FILE in one pass → data/scenario_rankings.csv
+    punt        Punt-build search   → data/punt_search.csv
+                  --max-punts K  only builds punting at most K categories
     roster      Filter to rosters   → data/data_myteam.json, data_matchup.json, etc.
     evaluate    Rank replacements   → data/data_top_n_replacements.json
                   --player / -p <ID>  override the drop candidate (default: config.yaml)
+                  --all               evaluate every my_team player against every
+                                      free agent → data/data_roster_swaps.json
+    top         Print the best free agents by Total_Value
+                  --top-n N           how many (default 20)
+                  --player / -p <ID>  instead show that player's scores, stats
+                                      and projections
+    trade       Multi-player trades → data/data_trades.json
+    portfolio   Mean–variance roster → data/portfolio.json
+                  --risk-ratio R  max risk as a multiple of the current roster's
     predict     Daily projections   → data/daily_projections*.json
-    all         Run pull → rank → roster → evaluate (excludes predict)
+    lineup      Today's start/sit   → data/daily_lineup.json
+                  --objective value|win_prob  what the lineup maximises
+    plan        Weekly streaming    → data/weekly_plan.json
+    schedule    Season schedule     → data/schedule_<season>.json, week_schedule.json
+                  (predict, lineup, plan, schedule) --date YYYY-MM-DD
+                  project / plan / summarise from that day instead of today
+    history     Snapshot history    → data/rankings_as_of.csv
+                  --date YYYY-MM-DD  rankings as they stood at the end of that day
+                  --player / -p <ID> that player's rankings and stats over time
+                                     → data/player_history.csv
+    simulate    Matchup win odds    → data/matchup_simulation.json (needs predict)
+    all         Run pull → rank → roster + evaluate (excludes predict), skipping
+                stages whose inputs and outputs are unchanged since their last run
+                (roster and evaluate run in parallel)
+                  --force    rerun every stage
+                  --scenarios <FILE>  passed to rank (reruns when FILE changes)
+                  --explain  show which stages would run and why, then exit
+
+Options for any command:
+    --http-cache live|record|replay|off   NBA API response cache mode
+                                          (replay = offline, deterministic;
+                                          pass --date to replay a recorded day)
 """
 
 import argparse
+import sys
+from datetime import date
+from pathlib import Path
 
-from app.pipeline import commands
+from app.pipeline import commands, stages
+from app.repository import nba_api_repository as nba_repo
 
 
 def main() -> None:
@@ -30,7 +71,7 @@ def main() -> None:
         "command",
         nargs="?",
         default="all",
-        choices=["pull", "rank", "roster", "evaluate", "predict", "all"],
+        choices=["pull", "rank", "punt", "roster", "evaluate", "top", "trade", "portfolio", "predict", "lineup", "plan", "schedule", "history", "simulate", "all"],
         help="Pipeline step to execute (default: all)",
     )
     parser.add_argument(
@@ -39,32 +80,182 @@ def main() -> None:
         default=None,
         metavar="PLAYER_ID",
         help=(
-            "(evaluate only) Player ID to evaluate for dropping. "
-            "Overrides drop_candidate in config.yaml."
+            "(evaluate) Player ID to evaluate for dropping. "
+            "Overrides drop_candidate in config.yaml. "
+            "(history) Player whose trajectory to save. "
+            "(top) Player to look up."
+        ),
+    )
+    parser.add_argument(
+        "--all",
+        dest="all_roster",
+        action="store_true",
+        help=(
+            "(evaluate only) Evaluate every my_team player as a drop "
+            "against every free agent in one pass."
+        ),
+    )
+    parser.add_argument(
+        "--top-n",
+        type=int,
+        default=20,
+        metavar="N",
+        help="(top only) Number of free agents to list.",
+    )
+    parser.add_argument(
+        "--objective",
+        choices=["value", "win_prob"],
+        default="value",
+        help=(
+            "(lineup only) Maximise weighted category value (default) or "
+            "simulated matchup win probability."
+        ),
+    )
+    parser.add_argument(
+        "--max-punts",
+        type=int,
+        default=None,
+        metavar="K",
+        help="(punt only) Only search builds punting at most K categories.",
+    )
+    parser.add_argument(
+        "--risk-ratio",
+        type=float,
+        default=1.0,
+        metavar="R",
+        help=(
+            "(portfolio only) Allow output variance up to R × the current "
+            "roster's (default 1.0: no riskier than now)."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "(pull only) Refetch just the current-season and last-10 windows, "
+            "apply them to data/data.json and record changed players in "
+            "data/pull_delta.json."
+        ),
+    )
+    parser.add_argument(
+        "--date",
+        dest="game_date",
+        type=date.fromisoformat,
+        default=None,
+        metavar="YYYY-MM-DD",
+        help=(
+            "(predict, lineup, plan, schedule) Day to project or plan from "
+            "instead of today, answered from the season schedule index. "
+            "(history) Day to report rankings as of."
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="(all only) Rerun every stage, even those that are up to date.",
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="(all only) Show which stages would rerun and why, without running them.",
+    )
+    parser.add_argument(
+        "--http-cache",
+        choices=["live", "record", "replay", "off"],
+        default=None,
+        help=(
+            "NBA API response cache mode for this run (overrides http_cache.mode): "
+            "replay runs offline from recorded responses (with --date for "
+            "day-specific commands, since scoreboards are recorded per date)."
+        ),
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help=(
+            "(rank, all) YAML file of weight/punt scenarios to score in one "
+            "pass alongside the config.yaml build."
         ),
     )
 
     args = parser.parse_args()
 
-    if args.command in ("pull", "all"):
+    if args.http_cache:
+        nba_repo.set_cache_mode(args.http_cache)
+
+    if args.command == "all":
+        pipeline = stages.default_pipeline(
+            incremental=args.incremental,
+            drop_candidate_id=args.player,
+            all_roster=args.all_roster,
+            scenarios_path=args.scenarios,
+        )
+        if args.explain:
+            print("\n=== PIPELINE PLAN ===")
+            pipeline.explain()
+            return
+        print("\n=== RUNNING PIPELINE ===")
+        if not pipeline.run(force=args.force):
+            sys.exit(1)
+        return
+
+    if args.command == "pull":
         print("\n=== RUNNING DATA PULL ===")
-        commands.pull()
+        commands.pull(incremental=args.incremental)
 
-    if args.command in ("rank", "all"):
+    if args.command == "rank":
         print("\n=== RUNNING RANKING / Z-SCORES ===")
-        commands.rank()
+        commands.rank(scenarios_path=args.scenarios)
 
-    if args.command in ("roster", "all"):
+    if args.command == "punt":
+        print("\n=== SEARCHING PUNT BUILDS ===")
+        commands.punt(max_size=args.max_punts)
+
+    if args.command == "roster":
         print("\n=== GENERATING ROSTER STATS ===")
         commands.roster()
 
-    if args.command in ("evaluate", "all"):
+    if args.command == "evaluate":
         print("\n=== EVALUATING PLAYER ===")
-        commands.evaluate(drop_candidate_id=args.player)
+        commands.evaluate(drop_candidate_id=args.player, all_roster=args.all_roster)
+
+    if args.command == "top":
+        print("\n=== LOOKING UP PLAYERS ===")
+        commands.top(top_n=args.top_n, player_id=args.player)
+
+    if args.command == "trade":
+        print("\n=== SEARCHING TRADES ===")
+        commands.trade()
+
+    if args.command == "portfolio":
+        print("\n=== OPTIMISING PORTFOLIO ===")
+        commands.portfolio(risk_ratio=args.risk_ratio)
 
     if args.command == "predict":
         print("\n=== RUNNING DAILY PREDICTION ===")
-        commands.predict()
+        commands.predict(game_date=args.game_date)
+
+    if args.command == "lineup":
+        print("\n=== OPTIMISING LINEUP ===")
+        commands.lineup(objective=args.objective, game_date=args.game_date)
+
+    if args.command == "plan":
+        print("\n=== PLANNING WEEK ===")
+        commands.plan(start=args.game_date)
+
+    if args.command == "schedule":
+        print("\n=== INDEXING SEASON SCHEDULE ===")
+        commands.schedule(start=args.game_date)
+
+    if args.command == "history":
+        print("\n=== QUERYING SNAPSHOT HISTORY ===")
+        commands.history_report(as_of=args.game_date, player_id=args.player)
+
+    if args.command == "simulate":
+        print("\n=== SIMULATING MATCHUP ===")
+        commands.simulate()
 
 
 if __name__ == "__main__":
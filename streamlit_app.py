@@ -1,8 +1,9 @@
 import streamlit as st
 import pandas as pd
 from app.ingestion import player_ingestion
-from app.analytics.scoring.z_score import ZScoreStrategy
 from app.config import DATA_DIR, config
+from app.analytics.scoring.service import score_pool
+from app.analytics.simulation.matchup import lines_from_dataframe, simulate
 from app.repository import file_repository as file_repo
 import json
 from google import genai
@@ -19,12 +20,7 @@ st.set_page_config(
 @st.cache_data
 def load_data():
     pool = player_ingestion.load_pool_from_file(DATA_DIR / "data.json")
-    strategy = ZScoreStrategy(
-        weights=config.scoring.category_weights,
-        punt_categories=config.scoring.punt_categories,
-        stats_source=config.scoring.stats_source,
-    )
-    return strategy.score(pool).to_dataframe()
+    return score_pool(pool).to_dataframe()
 
 def get_gemini_response(api_key, context, prompt):
     try:
@@ -208,6 +204,20 @@ def main():
             
         st.dataframe(pd.DataFrame([comp_data]), width='stretch', hide_index=True)
 
+        # Monte Carlo win probabilities (per category and overall)
+        sim = simulate(
+            lines_from_dataframe(my_df_display),
+            lines_from_dataframe(matchup_df_display),
+            n_sims=20_000,
+            seed=0,
+        )
+        st.write(
+            f"**Win Probability:** {sim.win_prob:.1%} "
+            f"(tie {sim.tie_prob:.1%}, loss {sim.loss_prob:.1%})"
+        )
+        win_probs = {cat: f"{p:.1%}" for cat, p in sim.category_win_prob.items()}
+        st.dataframe(pd.DataFrame([win_probs]), width='stretch', hide_index=True)
+
     # --- AI Assistant ---
     st.header("Fantasy Assistant")
     user_question = st.text_area("Ask for advice (e.g., 'Who should I bench?', 'Am I winning blocks?')")
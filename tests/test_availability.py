@@ -0,0 +1,91 @@
+"""AvailabilityModel against the deterministic engines and the per-team baseline."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ingestion.availability import AvailabilityModel
+from app.ingestion.minute_redistribution import (
+    N_POSITION_GROUPS,
+    ProportionalRedistributor,
+    RotationRedistributor,
+    Slate,
+)
+
+ENGINES = [ProportionalRedistributor(), RotationRedistributor()]
+
+
+def _slate(n_teams: int = 4, per_team: int = 12, seed: int = 0) -> Slate:
+    rng = np.random.default_rng(seed)
+    n = n_teams * per_team
+    positions = np.eye(N_POSITION_GROUPS)[rng.integers(0, N_POSITION_GROUPS, n)]
+    return Slate(
+        minutes=rng.uniform(8.0, 36.0, n),
+        games=rng.integers(10, 30, n).astype(float),
+        team_codes=np.repeat(np.arange(n_teams), per_team),
+        is_out=np.zeros(n, dtype=bool),
+        positions=positions,
+    )
+
+
+def _with_out(slate: Slate, is_out: np.ndarray) -> Slate:
+    return Slate(slate.minutes, slate.games, slate.team_codes, is_out, slate.positions)
+
+
+@pytest.mark.parametrize("engine", ENGINES, ids=lambda e: type(e).__name__)
+def test_certain_probabilities_reproduce_project(engine):
+    slate = _slate()
+    is_out = np.zeros(len(slate.minutes), dtype=bool)
+    is_out[[0, 13, 14, 40]] = True
+
+    for out in (np.zeros_like(is_out), is_out):
+        mean, var = AvailabilityModel(engine).factor_moments(slate, (~out).astype(float))
+
+        expected = engine.project(_with_out(slate, out))
+        np.testing.assert_allclose(mean * slate.minutes, expected, atol=1e-9)
+        np.testing.assert_array_equal(var, 0.0)
+
+
+@pytest.mark.parametrize("engine", ENGINES, ids=lambda e: type(e).__name__)
+def test_exact_enumeration_agrees_with_sampling(engine):
+    slate = _slate()
+    rng = np.random.default_rng(1)
+    prob = np.ones(len(slate.minutes))
+    for team in range(4):
+        uncertain = team * 12 + rng.choice(12, 4, replace=False)
+        prob[uncertain] = rng.uniform(0.2, 0.8, 4)
+
+    exact_mean, exact_var = AvailabilityModel(engine, max_exact=8).factor_moments(slate, prob)
+    sampled_mean, sampled_var = AvailabilityModel(
+        engine, max_exact=0, n_samples=20_000, seed=3
+    ).factor_moments(slate, prob)
+
+    np.testing.assert_allclose(sampled_mean, exact_mean, atol=0.02)
+    np.testing.assert_allclose(sampled_var, exact_var, atol=0.02)
+
+
+def _baseline_minutes(team_df: pd.DataFrame) -> pd.Series:
+    """The original per-team ``_redistribute_minutes`` (MIN only; OUT rows → 0)."""
+    out_mask = team_df["IS_OUT"]
+    active_df = team_df.loc[~out_mask].copy()
+    missing_minutes = team_df.loc[out_mask, "MIN"].sum()
+    total_active_min = active_df["MIN"].sum()
+    if missing_minutes > 0 and total_active_min != 0:
+        active_df["MIN"] = active_df["MIN"] * (1 + missing_minutes / total_active_min)
+    return active_df["MIN"].reindex(team_df.index, fill_value=0.0)
+
+
+def test_proportional_matches_per_team_baseline():
+    slate = _slate(n_teams=6, seed=2)
+    rng = np.random.default_rng(4)
+    is_out = rng.random(len(slate.minutes)) < 0.2
+    is_out[slate.team_codes == 5] = True                   # a team with nobody left
+
+    df = pd.DataFrame({"TEAM_ID": slate.team_codes, "MIN": slate.minutes, "IS_OUT": is_out})
+    expected = pd.concat(_baseline_minutes(team_df) for _, team_df in df.groupby("TEAM_ID"))
+
+    projected = ProportionalRedistributor().project(_with_out(slate, is_out))
+
+    np.testing.assert_allclose(projected, expected.sort_index().to_numpy(), atol=1e-9)
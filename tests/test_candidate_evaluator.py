@@ -0,0 +1,22 @@
+"""evaluate_roster_swaps reports a best swap only for categories that are scored."""
+
+from __future__ import annotations
+
+from app.analytics.evaluation.candidate_evaluator import evaluate_roster_swaps
+from app.analytics.scoring.z_score import ZScoreStrategy
+from app.domain.roster import Roster
+from benchmarks.synthetic import make_pool
+
+
+def test_punted_categories_have_no_best_swap():
+    pool = make_pool(120)
+    scored = ZScoreStrategy(weights={}, punt_categories=["FT%", "TO"]).score(pool)
+    mine = scored.get_roster_snapshot(Roster("mine", pool.player_ids[:13].tolist()))
+
+    result = evaluate_roster_swaps(scored, mine)
+
+    assert "zFT%" not in result.best_by_category
+    assert "zTO" not in result.best_by_category
+    assert "zPTS" in result.best_by_category
+    best = result.best_by_category["zPTS"].replacements[0]
+    assert best.value_added["zPTS"] > 0
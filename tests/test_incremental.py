@@ -0,0 +1,165 @@
+"""Incremental z-scoring must match a full ZScoreStrategy rescore."""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from app.analytics.scoring.incremental import IncrementalZScorer
+from app.analytics.scoring.z_score import ZScoreStrategy
+from app.domain.player import PlayerPool
+from app.domain.scoring import ScoredPool
+from benchmarks.synthetic import make_pool
+
+SOURCE = "stats_curr_season"
+
+
+def _strategy() -> ZScoreStrategy:
+    return ZScoreStrategy(
+        weights={"FG%": 1.5, "REB": 1.2, "BLK": 0.8},
+        punt_categories=["TO"],
+        stats_source=SOURCE,
+    )
+
+
+def _rows(pool: PlayerPool) -> dict:
+    window = pool.window(SOURCE)
+    return dict(zip(pool.player_ids[window.rows].tolist(), window.values.tolist()))
+
+
+def _with_rows(pool: PlayerPool, rows: dict) -> PlayerPool:
+    return pool.with_windows({SOURCE: pool.window_from_rows(rows)})
+
+
+def _changed_pool(pool: PlayerPool, seed: int = 1):
+    """
+    *pool* with some lines changed, some removed and, where a player has
+    no line yet, one added — plus the ``{player_id: previous row}`` delta.
+
+    :returns: ``(current pool, updated IDs, removed IDs, previous rows)``.
+    """
+    rng = np.random.default_rng(seed)
+    before = _rows(pool)
+    after = dict(before)
+    ids = np.array(sorted(before))
+
+    picked = rng.choice(ids, 18, replace=False).tolist()
+    updated, removed = picked[:12], picked[12:]
+    for pid in updated:
+        after[pid] = (np.asarray(before[pid]) * rng.uniform(0.8, 1.2)).tolist()
+    for pid in removed:
+        del after[pid]
+    missing = [int(pid) for pid in pool.player_ids if int(pid) not in before]
+    if missing:
+        updated.append(missing[0])
+        after[missing[0]] = before[ids[0]]
+
+    previous = {pid: before.get(pid) for pid in updated + removed}
+    return _with_rows(pool, after), updated, removed, previous
+
+
+def _pool_with_gap(n_players: int) -> PlayerPool:
+    """A synthetic pool where a few players have no current-season line."""
+    pool = make_pool(n_players)
+    rows = _rows(pool)
+    for pid in pool.player_ids[:3].tolist():
+        del rows[pid]
+    return _with_rows(pool, rows)
+
+
+def _by_player(scored: ScoredPool):
+    order = np.argsort(scored.player_ids)
+    return scored.player_ids[order], scored.scores[order], scored.total_value[order]
+
+
+def _assert_same(actual: ScoredPool, expected: ScoredPool) -> None:
+    a_ids, a_scores, a_total = _by_player(actual)
+    e_ids, e_scores, e_total = _by_player(expected)
+    np.testing.assert_array_equal(a_ids, e_ids)
+    np.testing.assert_allclose(a_scores, e_scores, atol=1e-9)
+    np.testing.assert_allclose(a_total, e_total, atol=1e-9)
+    assert actual.score_columns == expected.score_columns
+
+
+def test_apply_matches_full_rescore():
+    base = _pool_with_gap(150)
+    current, updated, removed, _ = _changed_pool(base)
+    scorer = IncrementalZScorer(_strategy(), base)
+
+    scored = scorer.apply(updated=[current.get(pid) for pid in updated], removed=removed)
+
+    _assert_same(scored, _strategy().score(current))
+    assert len(scorer) == len(current.window(SOURCE))
+
+
+def test_repeated_deltas_match_full_rescore():
+    pool = _pool_with_gap(80)
+    scorer = IncrementalZScorer(_strategy(), pool)
+    for seed in range(1, 6):
+        pool, updated, removed, _ = _changed_pool(pool, seed)
+        scored = scorer.apply(updated=[pool.get(pid) for pid in updated], removed=removed)
+        _assert_same(scored, _strategy().score(pool))
+
+
+def test_player_without_stats_is_removed():
+    pool = make_pool(40)
+    scorer = IncrementalZScorer(_strategy(), pool)
+    pid = int(pool.player_ids[3])
+    rows = _rows(pool)
+    del rows[pid]
+    current = _with_rows(pool, rows)
+
+    scored = scorer.apply(updated=[current.get(pid)])
+
+    assert pid not in scored
+    _assert_same(scored, _strategy().score(current))
+
+
+def test_deltas_touching_only_known_players_keep_the_same_rows():
+    pool = make_pool(60)
+    scorer = IncrementalZScorer(_strategy(), pool)
+    first = scorer.apply()
+    ids = first.player_ids.copy()
+
+    current, updated, _, _ = _changed_pool(pool)
+    scored = scorer.apply(updated=[current.get(pid) for pid in updated[:5]])
+
+    assert scored is first
+    np.testing.assert_array_equal(scored.player_ids, ids)
+
+
+def _best_of(fn, repeat: int = 30) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_small_delta_is_faster_than_full_rescore():
+    pool = make_pool(500)
+    strategy = _strategy()
+    scorer = IncrementalZScorer(strategy, pool)
+    current, updated, _, _ = _changed_pool(pool)
+    players = [current.get(pid) for pid in updated[:3]]
+
+    incremental = _best_of(lambda: scorer.apply(updated=players))
+    full = _best_of(lambda: strategy.score(current))
+
+    assert incremental < full
+
+
+def test_punted_and_zero_scores_are_never_negative_zero():
+    pool = _pool_with_gap(80)
+    scorer = IncrementalZScorer(_strategy(), pool)
+    current, updated, removed, _ = _changed_pool(pool)
+
+    for scored in (
+        _strategy().score(pool),
+        scorer.apply(updated=[current.get(pid) for pid in updated], removed=removed),
+    ):
+        zeros = scored.scores[scored.scores == 0]
+        assert not np.signbit(zeros).any()
+        assert not np.signbit(scored.column("zTO")).any()
@@ -0,0 +1,26 @@
+"""Lineup assignment fills every open slot a playing player is eligible for."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.analytics.optimization.lineup import _assign
+
+
+def test_very_negative_player_still_starts_in_open_slot():
+    values = np.array([5.0, -20.0])
+    slot_of_player = _assign(values, np.ones((2, 2), dtype=bool), np.ones(2, dtype=bool))
+    assert (slot_of_player >= 0).all()
+
+
+def test_more_players_than_slots_keeps_the_best():
+    values = np.array([1.0, -3.0, 4.0, -10.0])
+    slot_of_player = _assign(values, np.ones((4, 2), dtype=bool), np.ones(4, dtype=bool))
+    assert sorted(np.flatnonzero(slot_of_player >= 0).tolist()) == [0, 2]
+
+
+def test_players_without_a_game_stay_benched():
+    values = np.array([2.0, 1.0])
+    can_start = np.array([False, True])
+    slot_of_player = _assign(values, np.ones((2, 2), dtype=bool), can_start)
+    assert slot_of_player.tolist()[0] == -1 and slot_of_player[1] >= 0
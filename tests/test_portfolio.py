@@ -0,0 +1,50 @@
+"""Portfolio risk is the variance of the roster's output: additive over players."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.analytics.optimization.portfolio import optimize_portfolio
+from app.domain.roster import Roster
+from benchmarks.synthetic import make_pool
+
+WEIGHTS = {"FG%": 1.5, "REB": 1.2}
+
+
+def test_roster_risk_is_the_sum_of_its_players():
+    pool = make_pool(200)
+    ids = pool.player_ids[:13].tolist()
+
+    def risk(player_ids):
+        return optimize_portfolio(
+            pool, Roster("r", player_ids), WEIGHTS, n_candidates=0, max_swaps=0
+        ).current.risk
+
+    singles = sum(risk([pid]) for pid in ids)
+    assert np.isclose(risk(ids), singles)
+    assert np.isclose(risk(ids[:6]) + risk(ids[6:]), risk(ids))
+
+
+def test_frontier_is_sorted_and_undominated():
+    pool = make_pool(200)
+    roster = Roster("my_team", pool.player_ids[:13].tolist())
+    result = optimize_portfolio(
+        pool, roster, WEIGHTS, n_candidates=10, max_swaps=1, risk_ratio=None
+    )
+
+    risks = [r.risk for r in result.frontier]
+    means = [r.mean for r in result.frontier]
+    assert risks == sorted(risks)
+    assert all(b > a for a, b in zip(means, means[1:]))
+    assert result.best.risk <= max(risks)
+
+
+def test_game_logs_replace_the_model_covariance():
+    pool = make_pool(200)
+    pid = int(pool.player_ids[0])
+    roster = Roster("r", [pid])
+    steady = {pid: np.tile(np.arange(9.0), (5, 1))}        # identical games: no variance
+
+    result = optimize_portfolio(pool, roster, WEIGHTS, n_candidates=0, max_swaps=0, game_logs=steady)
+
+    assert result.current.risk == 0.0
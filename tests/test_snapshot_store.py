@@ -0,0 +1,41 @@
+"""SnapshotStore.as_of returns each snapshot's own columns, before and after compaction."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import numpy as np
+
+from app.repository.snapshot_store import SnapshotStore
+
+DAY1 = datetime(2025, 1, 6, 12)
+DAY2 = datetime(2025, 1, 7, 12)
+
+
+def _store(tmp_path) -> SnapshotStore:
+    store = SnapshotStore(tmp_path)
+    keys = np.array([1, 2, 3])
+    store.append("pool", keys, np.arange(6.0).reshape(3, 2), ["a", "b"], taken_at=DAY1)
+    store.append("pool", keys, np.arange(9.0).reshape(3, 3), ["a", "b", "c"], taken_at=DAY2)
+    return store
+
+
+def _check(store: SnapshotStore) -> None:
+    first = store.as_of("pool", DAY1)
+    assert first.columns == ["a", "b"]
+    assert np.array_equal(first.values, np.arange(6.0).reshape(3, 2))
+
+    second = store.as_of("pool", DAY2)
+    assert second.columns == ["a", "b", "c"]
+    assert np.array_equal(second.values, np.arange(9.0).reshape(3, 3))
+
+
+def test_as_of_keeps_each_snapshots_columns(tmp_path):
+    _check(_store(tmp_path))
+
+
+def test_as_of_after_compacting_mixed_columns(tmp_path):
+    store = _store(tmp_path)
+    store.compact("pool", before=datetime(2025, 2, 1))
+    assert len(list((tmp_path / "pool").glob("seg-*.npz"))) == 1
+    _check(store)
@@ -0,0 +1,78 @@
+"""SqliteRepository reads match the checkpoints and do not depend on save order."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from app.analytics.scoring.z_score import ZScoreStrategy
+from app.domain.player import STATS_WINDOWS, PlayerPool
+from app.domain.stats import STAT_COLUMNS
+from app.ingestion import checkpoint
+from app.repository.sqlite_repository import SqliteRepository
+from benchmarks.synthetic import make_pool
+
+
+def _scored(n_players: int = 30):
+    return ZScoreStrategy(weights={}).score(make_pool(n_players))
+
+
+def test_scores_saved_before_players_are_loaded(tmp_path):
+    scored = _scored()
+    db = SqliteRepository(tmp_path / "fantasy.db", STAT_COLUMNS, STATS_WINDOWS)
+    db.save_scores(scored.to_columns(), "2025-01-06")
+
+    ids = scored.player_ids[:3].tolist()
+    columns = db.load_scores(ids)
+
+    assert sorted(columns["player_ids"].tolist()) == sorted(ids)
+    assert set(columns["names"]) == set(scored.names[:3])
+
+
+def test_load_scored_players_falls_back_when_rows_are_missing(tmp_path, monkeypatch):
+    scored = _scored()
+    path = tmp_path / "data_zscores.json"
+    checkpoint.save_scored_pool(scored, path)
+
+    db = SqliteRepository(tmp_path / "fantasy.db", STAT_COLUMNS, STATS_WINDOWS)
+    partial = scored.to_columns()
+    partial = {k: v[:5] if k != "score_columns" else v for k, v in partial.items()}
+    db.save_scores(partial, "2025-01-06")
+    monkeypatch.setattr(checkpoint, "database", lambda: db)
+
+    ids = scored.player_ids[:10].tolist()
+    loaded = checkpoint.load_scored_players(path, ids)
+
+    assert all(pid in loaded for pid in ids)
+
+
+def test_top_scores_match_the_checkpoint_fallback(tmp_path, monkeypatch):
+    scored = _scored(60)
+    path = tmp_path / "data_zscores.json"
+    checkpoint.save_scored_pool(scored, path)
+    exclude = scored.player_ids[np.argsort(-scored.total_value)[:3]].tolist()
+
+    monkeypatch.setattr(checkpoint, "database", lambda: None)
+    from_file = checkpoint.load_top_scored(path, 5, exclude)
+
+    db = SqliteRepository(tmp_path / "fantasy.db", STAT_COLUMNS, STATS_WINDOWS)
+    db.save_scores(scored.to_columns(), "2025-01-06")
+    monkeypatch.setattr(checkpoint, "database", lambda: db)
+    from_db = checkpoint.load_top_scored(path, 5, exclude)
+
+    assert from_db.player_ids.tolist() == from_file.player_ids.tolist()
+    assert not set(exclude) & set(from_db.player_ids.tolist())
+    np.testing.assert_allclose(from_db.scores, from_file.scores)
+
+
+def test_load_players_round_trips_stat_windows(tmp_path):
+    pool = make_pool(20)
+    db = SqliteRepository(tmp_path / "fantasy.db", STAT_COLUMNS, STATS_WINDOWS)
+    db.save_players(pool.to_columns(), "2025-01-06")
+
+    pid = int(pool.player_ids[4])
+    player = PlayerPool.from_columns(db.load_players([pid])).get(pid)
+
+    expected = pool.get(pid)
+    assert player.name == expected.name
+    for source in STATS_WINDOWS:
+        assert player.get_stats(source) == expected.get_stats(source)
@@ -0,0 +1,92 @@
+"""plan_week with per-day scored projections."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.analytics.optimization.streaming import plan_week
+from app.analytics.scoring.z_score import ZScoreStrategy
+from app.domain.roster import Roster
+from app.domain.scoring import ScoredPool
+from benchmarks.synthetic import make_pool
+
+DAYS = [date(2025, 1, 6) + timedelta(days=k) for k in range(7)]
+
+
+def _setup():
+    pool = make_pool(150, seed=3)
+    scored = ZScoreStrategy(weights={}).score(pool)
+    ids = pool.player_ids.tolist()
+    team_map = {pid: pid % 30 for pid in ids}
+    rng = np.random.default_rng(1)
+    schedule = {day: set(rng.choice(30, 12, replace=False).tolist()) for day in DAYS}
+    return scored, Roster("mine", ids[:13]), schedule, team_map, ids[13:40]
+
+
+def _take(scored: ScoredPool, keep: np.ndarray, scale: float = 1.0) -> ScoredPool:
+    columns = scored.to_columns()
+    for key in ("player_ids", "names", "scores", "total_value"):
+        columns[key] = columns[key][keep]
+    columns["scores"] = columns["scores"] * scale
+    columns["total_value"] = columns["total_value"] * scale
+    return ScoredPool.from_columns(columns, pool=scored.pool)
+
+
+def _plan(scored, roster, schedule, team_map, excluded, daily_scores=None, max_adds=3):
+    return plan_week(
+        scored, roster, schedule, team_map, max_adds=max_adds,
+        excluded_ids=excluded, daily_scores=daily_scores,
+    )
+
+
+def test_daily_season_lines_match_static_plan():
+    scored, roster, schedule, team_map, excluded = _setup()
+    team_of = np.array([team_map[int(p)] for p in scored.player_ids])
+    daily = {day: _take(scored, np.isin(team_of, list(teams))) for day, teams in schedule.items()}
+
+    static = _plan(scored, roster, schedule, team_map, excluded)
+    projected = _plan(scored, roster, schedule, team_map, excluded, daily)
+
+    assert projected.total_value == pytest.approx(static.total_value)
+    assert projected.baseline_value == pytest.approx(static.baseline_value)
+    assert [(m.day, m.drop.player.player_id, m.add.player.player_id) for m in projected.moves] == [
+        (m.day, m.drop.player.player_id, m.add.player.player_id) for m in static.moves
+    ]
+
+
+def test_daily_values_come_from_each_days_projection():
+    scored, roster, schedule, team_map, excluded = _setup()
+    team_of = np.array([team_map[int(p)] for p in scored.player_ids])
+    daily = {
+        day: _take(scored, np.isin(team_of, list(teams)), scale=2.0 if k == 0 else 1.0)
+        for k, (day, teams) in enumerate(schedule.items())
+        if k != 1
+    }
+    static = _plan(scored, roster, schedule, team_map, excluded, max_adds=0)
+    projected = _plan(scored, roster, schedule, team_map, excluded, daily, max_adds=0)
+
+    assert projected.days[0].lineup.objective == pytest.approx(2.0 * static.days[0].lineup.objective)
+    assert projected.days[1].lineup.starters == []
+    assert [d.lineup.objective for d in projected.days[2:]] == pytest.approx(
+        [d.lineup.objective for d in static.days[2:]]
+    )
+
+
+def test_same_line_scores_the_same_on_small_and_large_slates():
+    pool = make_pool(150, seed=3)
+    strategy = ZScoreStrategy(weights={"FG%": 1.5}, punt_categories=["TO"])
+    reference = strategy.reference(pool)
+    pid = int(pool.player_ids[0])
+
+    small = strategy.score(pool.take(np.arange(5)), reference)
+    large = strategy.score(pool.take(np.arange(60)), reference)
+
+    np.testing.assert_array_equal(small.scores[small.row_of(pid)], large.scores[large.row_of(pid)])
+    assert small.total_value[small.row_of(pid)] == large.total_value[large.row_of(pid)]
+    # Scored against themselves, the two slates disagree
+    own_small = strategy.score(pool.take(np.arange(5)))
+    own_large = strategy.score(pool.take(np.arange(60)))
+    assert own_small.total_value[own_small.row_of(pid)] != own_large.total_value[own_large.row_of(pid)]
@@ -0,0 +1,50 @@
+"""TradeResult.complete must report when the candidate cap dropped packages."""
+
+from __future__ import annotations
+
+from app.analytics.evaluation.trade_evaluator import evaluate_trades
+from app.analytics.scoring.z_score import ZScoreStrategy
+from app.domain.roster import Roster
+from benchmarks.synthetic import make_pool
+
+
+def _setup():
+    pool = make_pool(120)
+    scored = ZScoreStrategy(weights={}).score(pool)
+    ids = pool.player_ids.tolist()
+    mine = scored.get_roster_snapshot(Roster("mine", ids[:13]))
+    theirs = scored.get_roster_snapshot(Roster("theirs", ids[13:26]))
+    return scored, mine, theirs
+
+
+def test_uncapped_search_is_complete():
+    scored, mine, theirs = _setup()
+    result = evaluate_trades(scored, mine, theirs, top_n=10)
+    assert result.complete
+
+
+def test_cap_at_exact_count_is_complete():
+    scored, mine, theirs = _setup()
+    explored = evaluate_trades(scored, mine, theirs, top_n=10).explored
+    result = evaluate_trades(scored, mine, theirs, top_n=10, max_candidates=explored)
+    assert result.complete and result.explored == explored
+
+
+def test_truncated_search_is_incomplete():
+    scored, mine, theirs = _setup()
+    explored = evaluate_trades(scored, mine, theirs, top_n=10).explored
+    for cap in (explored - 1, explored // 2, 1):
+        result = evaluate_trades(scored, mine, theirs, top_n=10, max_candidates=cap)
+        assert not result.complete
+        assert result.explored == cap
+
+
+def test_cap_clipping_last_package_is_incomplete():
+    # 1-for-1 with no top-n bound: every give package sees all 13 receive
+    # packages, so a cap of 12 * 13 + 4 clips only the last give package.
+    scored, mine, theirs = _setup()
+    result = evaluate_trades(
+        scored, mine, theirs, shapes=[(1, 1)], top_n=1000, max_candidates=12 * 13 + 4
+    )
+    assert result.explored == 12 * 13 + 4
+    assert not result.complete